@@ -2,13 +2,14 @@
 
 import asyncio
 import base64
-import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union
+import time
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlencode, urlparse
 
 import httpx
+import orjson
 
 from .models import (
     AuthMethod,
@@ -21,6 +22,28 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# HTTP verbs used by the pfSense REST API v2
+_HTTP_METHODS = frozenset({"GET", "POST", "PATCH", "PUT", "DELETE"})
+
+# Shared page size for list calls that don't pass their own (frozen, so safe to reuse)
+_DEFAULT_PAGINATION = PaginationOptions(limit=200)
+
+# Sent on every request. Accept-Encoding is left to httpx: it already offers
+# gzip/deflate, and adds br/zstd only when a decoder for them is installed.
+_CLIENT_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "pfsense-mcp-server",
+}
+
+
+class _FlightAbandoned(Exception):
+    """Set on a shared GET whose leading caller was cancelled."""
+
+
+def _header_pair(name: str, value: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Build (bodyless, with Content-Type) header dicts carrying one auth header"""
+    return {name: value}, {"Content-Type": "application/json", name: value}
+
 
 class EnhancedPfSenseAPIClient:
     """
@@ -37,7 +60,10 @@ class EnhancedPfSenseAPIClient:
         verify_ssl: bool = True,
         timeout: int = 30,
         version: PfSenseVersion = PfSenseVersion.CE_2_8_0,
-        enable_hateoas: bool = False
+        enable_hateoas: bool = False,
+        pool_size: int = 100,
+        http2: bool = False,
+        cache_ttl: float = 0.0,
     ):
         self.host = host.rstrip('/')
         self.auth_method = auth_method
@@ -48,10 +74,49 @@ class EnhancedPfSenseAPIClient:
         self.timeout = timeout
         self.version = version
         self.hateoas_enabled = enable_hateoas
+        self.pool_size = max(1, pool_size)
+        self.http2 = http2
+        self.cache_ttl = max(0.0, cache_ttl)
         self.jwt_token = None
-        self.jwt_expiry = None
+        # time.monotonic() deadline, so wall-clock jumps can't affect it
+        self.jwt_expiry: Optional[float] = None
+        # Credentials are fixed for the client lifetime, so the Basic auth
+        # value (used for basic auth and JWT refresh) is encoded once here.
+        self._basic_auth_header = (
+            "Basic " + base64.b64encode(f"{username}:{password}".encode()).decode()
+            if username and password else None
+        )
+        # Ready-made request headers as (bodyless, with Content-Type). Basic
+        # and API-key credentials are fixed, so they are built once here; the
+        # JWT pair is rebuilt only when _refresh_jwt() obtains a new token.
+        self._auth_headers: Optional[Tuple[Dict[str, str], Dict[str, str]]] = None
+        if auth_method == AuthMethod.BASIC and self._basic_auth_header:
+            self._auth_headers = _header_pair("Authorization", self._basic_auth_header)
+        elif auth_method == AuthMethod.API_KEY and api_key:
+            self._auth_headers = _header_pair("X-API-Key", api_key)
         self.client = None
         self._client_loop = None
+        # In-flight GET requests keyed by (URL, If-None-Match) for
+        # single-flight deduplication
+        self._inflight: Dict[Tuple[str, Optional[str]], asyncio.Future] = {}
+        # GET response cache (cache_ttl > 0): URL -> (expires_at, raw body).
+        # Raw bytes are stored so every hit decodes to a fresh dict that
+        # callers can mutate. _cache_generation is bumped around every write
+        # so a GET that overlapped a write never stores pre-write data.
+        self._response_cache: Dict[str, Tuple[float, bytes]] = {}
+        self._cache_generation = 0
+        # Validators for revalidated GETs (slow-changing resources such as
+        # aliases, users and API settings): URL -> (etag, raw body). The next
+        # GET sends If-None-Match and reuses the body on a 304. pfSense
+        # decides freshness, so writes need not clear this.
+        self._etag_cache: Dict[str, Tuple[str, bytes]] = {}
+        # Serialises JWT refreshes so concurrent callers share one /auth/jwt call
+        self._jwt_lock = asyncio.Lock()
+        # Firewall apply coalescing (see apply_firewall_changes)
+        self._apply_lock = asyncio.Lock()
+        self._apply_requested = 0
+        self._apply_completed = 0
+        self._last_apply: Optional[Dict] = None
 
         # API base URL
         self.api_base = f"{self.host}/api/v2"
@@ -73,38 +138,51 @@ class EnhancedPfSenseAPIClient:
             # Discard the old client — it belongs to a different event loop
             # and cannot be safely closed from here. The explicit close()
             # method should be used before switching loops.
+            # Explicit pool limits: concurrent tool calls fan out against a
+            # single pfSense host, and the httpx defaults (10 keep-alive
+            # connections) force repeated TCP/TLS handshakes under bursts.
+            # With HTTP/2 the requests multiplex over one TLS connection.
             self.client = httpx.AsyncClient(
                 verify=self.verify_ssl,
                 timeout=self.timeout,
-                follow_redirects=True
+                follow_redirects=True,
+                http2=self.http2,
+                headers=_CLIENT_HEADERS,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=max(1, self.pool_size // 2),
+                    keepalive_expiry=30.0,
+                ),
             )
             self._client_loop = current_loop
+            # Futures and locks are bound to the loop that created them
+            self._inflight = {}
+            self._jwt_lock = asyncio.Lock()
+            self._apply_lock = asyncio.Lock()
 
-    async def _get_auth_headers(self, include_content_type: bool = True) -> Dict[str, str]:
-        """Generate authentication headers based on auth method"""
-        headers = {}
-        if include_content_type:
-            headers["Content-Type"] = "application/json"
+    # pfSense issues JWTs valid for one hour
+    JWT_LIFETIME = 3600.0  # seconds
+    # A JWT this close to expiry is refreshed early so a request never goes
+    # out with a token that lapses in flight
+    JWT_EXPIRY_MARGIN = 60.0  # seconds
 
-        if self.auth_method == AuthMethod.BASIC:
-            if not self.username or not self.password:
-                raise ValueError("Username and password required for basic auth")
-            credentials = base64.b64encode(
-                f"{self.username}:{self.password}".encode()
-            ).decode()
-            headers["Authorization"] = f"Basic {credentials}"
+    async def _get_auth_headers(self, include_content_type: bool = True) -> Dict[str, str]:
+        """Return authentication headers for the configured auth method.
 
-        elif self.auth_method == AuthMethod.API_KEY:
-            if not self.api_key:
-                raise ValueError("API key required for API key auth")
-            headers["X-API-Key"] = self.api_key
+        The returned dict is shared between requests and must not be mutated.
+        """
+        if self.auth_method == AuthMethod.JWT and self._is_jwt_expired():
+            async with self._jwt_lock:
+                # Another caller may have refreshed while we waited
+                if self._is_jwt_expired():
+                    await self._refresh_jwt()
 
-        elif self.auth_method == AuthMethod.JWT:
-            if not self.jwt_token or self._is_jwt_expired():
-                await self._refresh_jwt()
-            headers["Authorization"] = f"Bearer {self.jwt_token}"
+        if self._auth_headers is not None:
+            return self._auth_headers[bool(include_content_type)]
 
-        return headers
+        if self.auth_method == AuthMethod.BASIC:
+            raise ValueError("Username and password required for basic auth")
+        raise ValueError("API key required for API key auth")
 
     async def _refresh_jwt(self):
         """Get a new JWT token.
@@ -112,19 +190,16 @@ class EnhancedPfSenseAPIClient:
         The /auth/jwt endpoint requires Basic Auth credentials in the header,
         NOT username/password in the JSON body.
         """
-        if not self.username or not self.password:
+        if not self._basic_auth_header:
             raise ValueError("Username and password required for JWT auth")
 
         self._ensure_client()
-        credentials = base64.b64encode(
-            f"{self.username}:{self.password}".encode()
-        ).decode()
         response = await self.client.post(
             f"{self.api_base}/auth/jwt",
-            headers={"Authorization": f"Basic {credentials}"},
+            headers={"Authorization": self._basic_auth_header},
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         token = data.get("data", {}).get("token") if isinstance(data.get("data"), dict) else None
         if not token:
@@ -133,13 +208,14 @@ class EnhancedPfSenseAPIClient:
                 "Response may be malformed or API version incompatible."
             )
         self.jwt_token = token
-        self.jwt_expiry = datetime.now() + timedelta(hours=1)
+        self._auth_headers = _header_pair("Authorization", f"Bearer {token}")
+        self.jwt_expiry = time.monotonic() + self.JWT_LIFETIME
 
     def _is_jwt_expired(self) -> bool:
-        """Check if JWT token is expired"""
-        if not self.jwt_expiry:
+        """Check if the JWT token is missing or within JWT_EXPIRY_MARGIN of expiry"""
+        if not self.jwt_token or not self.jwt_expiry:
             return True
-        return datetime.now() >= self.jwt_expiry
+        return time.monotonic() >= self.jwt_expiry - self.JWT_EXPIRY_MARGIN
 
     def _build_query_params(
         self,
@@ -192,36 +268,34 @@ class EnhancedPfSenseAPIClient:
         control: Optional[ControlParameters] = None,
         extra_params: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
+        revalidate: bool = False,
+        use_cache: bool = True,
     ) -> Dict:
         """Make API request with enhanced features.
 
         Control parameters (apply, placement, append, remove) are merged into
         the JSON request body — pfSense REST API v2 reads them from the body
         on POST/PATCH/DELETE, not from query parameters.
+
+        revalidate=True (GET only) keeps the ETag and body of the response
+        and sends If-None-Match next time; meant for slow-changing resources.
+        use_cache=False makes a GET skip the response cache and always reach
+        pfSense (the fresh response is still cached for later callers).
         """
         # Ensure client is created for current event loop
         self._ensure_client()
 
+        # Normalise once; every branch below compares against upper-case verbs
+        method = method.upper()
+        if method not in _HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
         url = f"{self.api_base}{endpoint}"
 
         # Merge control parameters into request body (NOT query string)
         # pfSense API reads apply/placement/append/remove from request_data
         # which is the decoded JSON body for POST/PATCH/DELETE
         if control:
-            control_dict = control.to_params()
-            # Convert string "true"/"false" to actual booleans for JSON body
-            body_params = {}
-            for k, v in control_dict.items():
-                if v == "true":
-                    body_params[k] = True
-                elif v == "false":
-                    body_params[k] = False
-                else:
-                    # placement is an int
-                    try:
-                        body_params[k] = int(v)
-                    except (ValueError, TypeError):
-                        body_params[k] = v
+            body_params = control.to_body()
             if data is not None:
                 data = {**data, **body_params}
             else:
@@ -239,7 +313,7 @@ class EnhancedPfSenseAPIClient:
 
         # Don't send Content-Type on GET or bodyless DELETE - pfSense API ignores
         # query params when Content-Type: application/json is present on bodyless requests
-        needs_body = method.upper() in ("POST", "PATCH", "PUT") or (method.upper() == "DELETE" and data)
+        needs_body = method in ("POST", "PATCH", "PUT") or (method == "DELETE" and data)
         headers = await self._get_auth_headers(include_content_type=needs_body)
 
         # Per-request timeout override (used by log endpoints to fail fast).
@@ -247,36 +321,47 @@ class EnhancedPfSenseAPIClient:
         # keep using the client defaults and don't cause false positives.
         req_timeout = httpx.Timeout(self.timeout, read=timeout) if timeout else None
 
-        # Make request
-        if method.upper() == "GET":
-            response = await self.client.get(url, headers=headers, timeout=req_timeout)
-        elif method.upper() == "POST":
-            response = await self.client.post(url, headers=headers, json=data, timeout=req_timeout)
-        elif method.upper() == "PATCH":
-            response = await self.client.patch(url, headers=headers, json=data, timeout=req_timeout)
-        elif method.upper() == "PUT":
-            response = await self.client.put(url, headers=headers, json=data, timeout=req_timeout)
-        elif method.upper() == "DELETE":
-            # httpx.AsyncClient.delete() does NOT accept a json= kwarg; only
-            # request()/post()/patch()/put() do. Some pfSense DELETEs carry a
-            # body (bulk operations), so route DELETE through request(). See
-            # issue #12 / PR #9.
-            response = await self.client.request(
-                "DELETE", url, headers=headers, json=data, timeout=req_timeout
-            )
+        # Make request. GETs go through single-flight coalescing; every other
+        # verb uses request(), the one httpx entry point that accepts a body
+        # for all methods (AsyncClient.delete() does not, and some pfSense
+        # DELETEs carry a body for bulk operations — see issue #12 / PR #9).
+        if method == "GET":
+            if self.cache_ttl and use_cache:
+                cached = self._response_cache.get(url)
+                if cached is not None and time.monotonic() < cached[0]:
+                    return orjson.loads(cached[1])
+            generation = self._cache_generation
+            validator = self._etag_cache.get(url) if revalidate else None
+            if validator is not None:
+                # Auth header dicts are shared, so extend a copy
+                headers = {**headers, "If-None-Match": validator[0]}
+            response = await self._coalesced_get(url, headers, req_timeout)
         else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+            # Any write may change what a cached GET would return
+            self._invalidate_cache()
+            # Encoded with orjson rather than httpx's json= (stdlib json);
+            # Content-Type is already in headers whenever there is a body
+            body = orjson.dumps(data) if needs_body and data is not None else None
+            try:
+                response = await self.client.request(
+                    method, url, headers=headers, content=body, timeout=req_timeout
+                )
+            finally:
+                self._invalidate_cache()
 
         # Enhanced error handling
         if response.status_code >= 400:
-            error_body = response.text
+            # Decode the body once: use the parsed JSON when available and
+            # only fall back to the raw text for non-JSON error pages.
             try:
-                error_json = response.json()
+                error_json = orjson.loads(response.content)
+            except ValueError:
+                error_json = None
+            if isinstance(error_json, dict):
                 error_message = error_json.get('message', 'Unknown error')
-                error_detail = json.dumps(error_json, indent=2)
-            except Exception:
-                error_message = error_body
-                error_detail = error_body
+                error_detail = orjson.dumps(error_json, option=orjson.OPT_INDENT_2).decode()
+            else:
+                error_message = error_detail = response.text
 
             # Log error info at DEBUG level (endpoint only, no sensitive data)
             logger.debug(
@@ -286,7 +371,7 @@ class EnhancedPfSenseAPIClient:
             logger.debug("Response: %s", error_detail)
 
             # Log concise error at ERROR level
-            logger.error(f"pfSense API {response.status_code}: {error_message}")
+            logger.error("pfSense API %s: %s", response.status_code, error_message)
 
             # Raise with error info (no request data to avoid leaking sensitive payloads)
             url_path = urlparse(url).path
@@ -301,8 +386,95 @@ class EnhancedPfSenseAPIClient:
             raise Exception(error_msg)
 
         # Log successful request
-        logger.debug(f"API Success: {method} {endpoint} - Status {response.status_code}")
-        return response.json()
+        logger.debug("API Success: %s %s - Status %s", method, endpoint, response.status_code)
+        body = response.content
+        if method == "GET":
+            if response.status_code == 304 and validator is not None:
+                body = validator[1]
+            elif revalidate and response.status_code == 200:
+                etag = response.headers.get("etag")
+                if etag:
+                    self._store_etag(url, etag, body)
+            if self.cache_ttl and generation == self._cache_generation:
+                self._store_cached(url, body)
+        # orjson decodes straight from the raw bytes (no str round-trip) and
+        # is several times faster than stdlib json on large list endpoints
+        return orjson.loads(body)
+
+    # Upper bound on cached GET responses; expired entries are dropped first
+    _CACHE_MAX_ENTRIES = 256
+
+    def _store_cached(self, url: str, body: bytes) -> None:
+        now = time.monotonic()
+        cache = self._response_cache
+        if len(cache) >= self._CACHE_MAX_ENTRIES and url not in cache:
+            for key in [k for k, (expires, _) in cache.items() if expires <= now]:
+                del cache[key]
+            if len(cache) >= self._CACHE_MAX_ENTRIES:
+                cache.clear()
+        cache[url] = (now + self.cache_ttl, body)
+
+    def _store_etag(self, url: str, etag: str, body: bytes) -> None:
+        cache = self._etag_cache
+        if len(cache) >= self._CACHE_MAX_ENTRIES and url not in cache:
+            cache.clear()
+        cache[url] = (etag, body)
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached GET responses (called around every write).
+
+        In-flight GETs are forgotten too, so a GET issued after a write never
+        joins a flight that started before it.
+        """
+        self._cache_generation += 1
+        self._response_cache.clear()
+        self._inflight.clear()
+
+    async def _coalesced_get(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: Optional[httpx.Timeout],
+    ) -> httpx.Response:
+        """GET with single-flight deduplication of identical concurrent requests.
+
+        When several tool calls ask for the same URL at once (e.g. parallel
+        system_status calls), only the first one goes to pfSense; the others
+        await its response. The shared object is the httpx.Response, so each
+        caller still decodes its own independent dict from it.
+
+        Flights are keyed by URL and If-None-Match: a conditional GET can
+        answer 304 with no body, which only a caller holding that same
+        validator can use.
+        """
+        key = (url, headers.get("If-None-Match"))
+        while (pending := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except _FlightAbandoned:
+                # The leader was cancelled; the first waiter to get here
+                # starts a new flight and the rest join it
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        # Waiters retrieve the exception; mark it retrieved for the no-waiter case
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            response = await self.client.get(url, headers=headers, timeout=timeout)
+        except asyncio.CancelledError:
+            # Only the leader was cancelled — don't cancel its waiters too
+            future.set_exception(_FlightAbandoned())
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
 
     # Enhanced System Methods
 
@@ -318,7 +490,7 @@ class EnhancedPfSenseAPIClient:
     ) -> Dict:
         """Get interfaces with advanced filtering and sorting"""
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         return await self._make_request(
             "GET", "/status/interfaces",
             filters=filters, sort=sort, pagination=pagination
@@ -358,7 +530,7 @@ class EnhancedPfSenseAPIClient:
             sort = SortOptions(sort_by="tracker", sort_order=sort.sort_order)
 
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         return await self._make_request(
             "GET", "/firewall/rules",
             filters=filters, sort=sort, pagination=pagination
@@ -460,6 +632,99 @@ class EnhancedPfSenseAPIClient:
             data={"id": rule_id}, control=control
         )
 
+    # Bulk rule changes. The API has no array-body create/update/delete for
+    # rules, so each rule is still its own request, but all of them are sent
+    # with apply=False and the filter reload runs once at the end.
+
+    async def create_firewall_rules(
+        self,
+        rules: List[Dict],
+        apply_immediately: bool = True
+    ) -> List[Dict]:
+        """Create several firewall rules with a single apply
+
+        Rules are created in order. Returns one entry per rule:
+        {"success": True, "response": ...} or {"success": False, "error": ...}.
+        """
+        no_apply = ControlParameters(apply=False)
+        return await self._bulk_rule_writes(
+            [partial(self.create_firewall_rule, rule, no_apply) for rule in rules],
+            apply_immediately,
+        )
+
+    async def update_firewall_rules(
+        self,
+        updates: List[Dict],
+        apply_immediately: bool = True
+    ) -> List[Dict]:
+        """Update several firewall rules with a single apply
+
+        Each entry of updates must carry the rule "id" alongside the fields to
+        change; an entry without one is reported as a failed item. Results are
+        returned in the same order as updates.
+        """
+        no_apply = ControlParameters(apply=False)
+
+        async def update_one(update: Dict) -> Dict:
+            if "id" not in update:
+                raise ValueError("Update entry has no 'id'")
+            fields = {k: v for k, v in update.items() if k != "id"}
+            return await self.update_firewall_rule(update["id"], fields, no_apply)
+
+        return await self._bulk_rule_writes(
+            [partial(update_one, update) for update in updates],
+            apply_immediately,
+        )
+
+    async def delete_firewall_rules(
+        self,
+        rule_ids: List[int],
+        apply_immediately: bool = True
+    ) -> List[Dict]:
+        """Delete several firewall rules with a single apply
+
+        Rule IDs are array indices, so deleting one shifts every later ID down.
+        Deletes therefore run from the highest ID to the lowest, which keeps
+        the remaining IDs valid. Repeated IDs are deleted once (a second
+        delete would hit whichever rule shifted into place), so there is one
+        result per distinct ID, returned in deletion order and tagged with
+        its "id".
+        """
+        ordered = sorted(set(rule_ids), reverse=True)
+        results = await self._bulk_rule_writes(
+            [
+                partial(self.delete_firewall_rule, rule_id, apply_immediately=False)
+                for rule_id in ordered
+            ],
+            apply_immediately,
+        )
+        return [{"id": rule_id, **r} for rule_id, r in zip(ordered, results)]
+
+    async def _bulk_rule_writes(
+        self,
+        writes: List[Callable[[], Awaitable[Dict]]],
+        apply_immediately: bool
+    ) -> List[Dict]:
+        """Run rule writes one at a time, then apply once if any succeeded.
+
+        Each write is a zero-argument callable, only called when its turn
+        comes, so nothing is left unawaited if the batch stops early. A
+        failed write (including one that fails while being built) does not
+        stop the rest. An apply failure is raised so callers never mistake
+        unapplied changes for live ones.
+        """
+        results = []
+        for write in writes:
+            try:
+                results.append({"success": True, "response": await write()})
+            except Exception as e:
+                logger.error("Bulk firewall rule write failed: %s", e)
+                results.append({"success": False, "error": str(e)})
+
+        if apply_immediately and any(r["success"] for r in results):
+            await self.apply_firewall_changes()
+        return results
+
     # Enhanced Alias Methods
 
     async def get_aliases(
@@ -476,10 +741,10 @@ class EnhancedPfSenseAPIClient:
             filters.append(QueryFilter("type", alias_type))
 
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         return await self._make_request(
             "GET", "/firewall/aliases",
-            filters=filters, sort=sort, pagination=pagination
+            filters=filters, sort=sort, pagination=pagination, revalidate=True
         )
 
     async def find_aliases_containing_ip(self, ip_address: str) -> Dict:
@@ -672,7 +937,7 @@ class EnhancedPfSenseAPIClient:
     ) -> Dict:
         """Get services with filtering"""
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         return await self._make_request(
             "GET", "/status/services",
             filters=filters, sort=sort, pagination=pagination
@@ -708,29 +973,25 @@ class EnhancedPfSenseAPIClient:
             f"Available services: {', '.join(available)}"
         )
 
-    async def start_service(self, service_name: str) -> Dict:
-        """Start a service by name"""
+    async def control_service(self, service_name: str, action: str) -> Dict:
+        """Run a service action ("start", "stop", "restart") by service name"""
         svc_id = await self._lookup_service_id(service_name)
         return await self._make_request(
             "POST", "/status/service",
-            data={"id": svc_id, "action": "start"}
+            data={"id": svc_id, "action": action}
         )
 
+    async def start_service(self, service_name: str) -> Dict:
+        """Start a service by name"""
+        return await self.control_service(service_name, "start")
+
     async def stop_service(self, service_name: str) -> Dict:
         """Stop a service by name"""
-        svc_id = await self._lookup_service_id(service_name)
-        return await self._make_request(
-            "POST", "/status/service",
-            data={"id": svc_id, "action": "stop"}
-        )
+        return await self.control_service(service_name, "stop")
 
     async def restart_service(self, service_name: str) -> Dict:
         """Restart a service by name"""
-        svc_id = await self._lookup_service_id(service_name)
-        return await self._make_request(
-            "POST", "/status/service",
-            data={"id": svc_id, "action": "restart"}
-        )
+        return await self.control_service(service_name, "restart")
 
     # Enhanced DHCP Methods
 
@@ -743,7 +1004,7 @@ class EnhancedPfSenseAPIClient:
     ) -> Dict:
         """Get DHCP leases with filtering"""
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         # DHCP field is 'if' not 'interface'
         if interface and not filters:
             filters = [QueryFilter("if", interface, "contains")]
@@ -787,7 +1048,7 @@ class EnhancedPfSenseAPIClient:
                        Passed as parent_id query param, not a filter.
         """
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         extra = {"parent_id": interface} if interface else None
         return await self._make_request(
             "GET", "/services/dhcp_server/static_mappings",
@@ -865,7 +1126,7 @@ class EnhancedPfSenseAPIClient:
     ) -> Dict:
         """Get NAT port forwarding rules with filtering"""
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         return await self._make_request(
             "GET", "/firewall/nat/port_forwards",
             filters=filters, sort=sort, pagination=pagination
@@ -913,8 +1174,24 @@ class EnhancedPfSenseAPIClient:
     # Firewall Apply
 
     async def apply_firewall_changes(self) -> Dict:
-        """Force apply pending firewall changes (triggers filter_configure)"""
-        return await self._make_request("POST", "/firewall/apply", data={})
+        """Force apply pending firewall changes (triggers filter_configure).
+
+        An apply reloads the whole pf ruleset, so concurrent calls are
+        coalesced: callers that arrive while an apply is running wait for it
+        to finish and then share a single follow-up apply, which covers every
+        change made before they called. Each caller still returns only once
+        its changes are live.
+        """
+        self._apply_requested += 1
+        ticket = self._apply_requested
+        async with self._apply_lock:
+            if self._apply_completed >= ticket:
+                return self._last_apply
+            covers = self._apply_requested
+            result = await self._make_request("POST", "/firewall/apply", data={})
+            self._apply_completed = covers
+            self._last_apply = result
+            return result
 
     # DHCP Server Configuration
 
@@ -926,7 +1203,7 @@ class EnhancedPfSenseAPIClient:
     ) -> Dict:
         """Get DHCP server configurations for all interfaces"""
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         return await self._make_request(
             "GET", "/services/dhcp_servers",
             filters=filters, sort=sort, pagination=pagination
@@ -961,7 +1238,7 @@ class EnhancedPfSenseAPIClient:
     ) -> Dict:
         """Get ARP table entries"""
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         return await self._make_request(
             "GET", "/diagnostics/arp_table",
             filters=filters, sort=sort, pagination=pagination
@@ -1011,7 +1288,7 @@ class EnhancedPfSenseAPIClient:
     ) -> Dict:
         """Generic list/search for any plural endpoint."""
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         return await self._make_request(
             "GET", endpoint,
             filters=filters, sort=sort, pagination=pagination,
@@ -1090,8 +1367,7 @@ class EnhancedPfSenseAPIClient:
 
     async def refresh_object_ids(self, endpoint: str) -> Dict:
         """Refresh object IDs by re-querying endpoint"""
-        pagination = PaginationOptions(limit=200)
-        return await self._make_request("GET", endpoint, pagination=pagination)
+        return await self._make_request("GET", endpoint, pagination=_DEFAULT_PAGINATION)
 
     async def find_object_by_field(
         self,
@@ -1163,13 +1439,15 @@ class EnhancedPfSenseAPIClient:
     # Utility Methods
 
     async def test_connection(self) -> Dict:
-        """Test API connection.
+        """Test API connection by probing /status/system.
 
         Returns:
             Dict with 'connected' (bool) and 'error' (str, if failed).
         """
         try:
-            await self.get_system_status()
+            # Bypass the response cache: a cached status says nothing about
+            # whether pfSense is reachable now
+            await self._make_request("GET", "/status/system", use_cache=False)
             return {"connected": True}
         except httpx.ConnectError as e:
             return {"connected": False, "error": f"Cannot reach {self.host}: {e}"}
@@ -1189,7 +1467,9 @@ class EnhancedPfSenseAPIClient:
 
     async def get_api_capabilities(self) -> Dict:
         """Get API capabilities and settings"""
-        return await self._make_request("GET", "/system/restapi/settings")
+        return await self._make_request(
+            "GET", "/system/restapi/settings", revalidate=True
+        )
 
     async def set_hateoas(self, enabled: bool) -> Dict:
         """Enable or disable HATEOAS on the pfSense REST API server.
@@ -1216,10 +1496,10 @@ class EnhancedPfSenseAPIClient:
     ) -> Dict:
         """Get users with optional filtering"""
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         return await self._make_request(
             "GET", "/users",
-            filters=filters, sort=sort, pagination=pagination,
+            filters=filters, sort=sort, pagination=pagination, revalidate=True,
         )
 
     async def create_user(self, user_data: Dict) -> Dict:
@@ -1246,7 +1526,7 @@ class EnhancedPfSenseAPIClient:
     ) -> Dict:
         """Get user groups with optional filtering"""
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         return await self._make_request(
             "GET", "/user/groups",
             filters=filters, sort=sort, pagination=pagination,
@@ -1276,7 +1556,7 @@ class EnhancedPfSenseAPIClient:
     ) -> Dict:
         """Get authentication servers with optional filtering"""
         if pagination is None:
-            pagination = PaginationOptions(limit=200)
+            pagination = _DEFAULT_PAGINATION
         return await self._make_request(
             "GET", "/user/auth_servers",
             filters=filters, sort=sort, pagination=pagination,
@@ -1304,3 +1584,5 @@ class EnhancedPfSenseAPIClient:
         """Reset client state for reuse in a new event loop."""
         self.client = None
         self._client_loop = None
+        self._inflight = {}
+        self._invalidate_cache()
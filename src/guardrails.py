@@ -12,17 +12,23 @@ Implements multiple layers of protection following security best practices:
 8. Input Sanitization — defense against injection via tool parameters
 """
 
+import atexit
+import functools
 import hashlib
-import json
 import logging
 import os
+import queue
 import re
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -32,12 +38,28 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 class RiskLevel(str, Enum):
-    """Risk classification for MCP tool operations."""
-    READ = "read"              # No state change (search, get, list)
-    LOW = "low"                # Reversible state change (enable/disable, update settings)
-    MEDIUM = "medium"          # Significant change (create rule, update config)
-    HIGH = "high"              # Destructive/irreversible (delete, bulk operations)
-    CRITICAL = "critical"      # System-level destructive (reboot, halt, bulk delete, wipe)
+    """Risk classification for MCP tool operations.
+
+    Members keep their string value for display and JSON output, and carry
+    an integer ``rank`` so severity checks are a single integer comparison
+    (``risk.rank >= RiskLevel.HIGH.rank``) instead of tuple/dict lookups.
+    """
+    READ = ("read", 0)              # No state change (search, get, list)
+    LOW = ("low", 1)                # Reversible state change (enable/disable, update settings)
+    MEDIUM = ("medium", 2)          # Significant change (create rule, update config)
+    HIGH = ("high", 3)              # Destructive/irreversible (delete, bulk operations)
+    CRITICAL = ("critical", 4)      # System-level destructive (reboot, halt, bulk delete, wipe)
+
+    def __new__(cls, value: str, rank: int):
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        obj.rank = rank
+        return obj
+
+    @property
+    def requires_confirmation(self) -> bool:
+        """HIGH and CRITICAL operations must be confirmed before executing."""
+        return self.rank >= RiskLevel.HIGH.rank
 
 
 # Map of tool name patterns to risk levels.
@@ -87,20 +109,38 @@ _RISK_CLASSIFICATION = {
     "run_ping": RiskLevel.READ,
 }
 
+# Prefix lookup tables, built once at import. Patterns are bucketed by length
+# so a lookup is a few dict probes on tool_name[:n] rather than a startswith()
+# scan over every pattern. Each entry keeps its declaration order for priority.
+_RISK_PREFIX_BUCKETS: Dict[int, Dict[str, Tuple[int, RiskLevel]]] = {}
+for _order, (_pattern, _level) in enumerate(_RISK_CLASSIFICATION.items()):
+    _RISK_PREFIX_BUCKETS.setdefault(len(_pattern), {})[_pattern] = (_order, _level)
+del _order, _pattern, _level
+_RISK_PREFIX_LENGTHS = tuple(sorted(_RISK_PREFIX_BUCKETS))
+
 
+@functools.lru_cache(maxsize=1024)
 def classify_risk(tool_name: str) -> RiskLevel:
     """Classify the risk level of a tool by name.
 
     Checks exact matches first, then prefix matches.
     Defaults to MEDIUM for unknown tools (fail-safe).
+    The mapping is static, so results are memoized per tool name.
     """
     # Exact match first
-    if tool_name in _RISK_CLASSIFICATION:
-        return _RISK_CLASSIFICATION[tool_name]
-    # Prefix match
-    for pattern, level in _RISK_CLASSIFICATION.items():
-        if tool_name.startswith(pattern):
-            return level
+    level = _RISK_CLASSIFICATION.get(tool_name)
+    if level is not None:
+        return level
+    # Prefix match — earliest pattern in _RISK_CLASSIFICATION wins
+    best = None
+    for length in _RISK_PREFIX_LENGTHS:
+        if length > len(tool_name):
+            break
+        hit = _RISK_PREFIX_BUCKETS[length].get(tool_name[:length])
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit
+    if best is not None:
+        return best[1]
     # Unknown tools default to MEDIUM (fail-safe, not fail-open)
     return RiskLevel.MEDIUM
 
@@ -109,7 +149,11 @@ def classify_risk(tool_name: str) -> RiskLevel:
 # 2. Approval Gate — Full Command Visualization
 # ---------------------------------------------------------------------------
 
-@dataclass
+# Canonical encoding for hashing: sorted keys, non-string keys allowed
+_ORJSON_STABLE = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+@dataclass(slots=True)
 class ApprovalRequest:
     """Represents a pending destructive action requiring approval."""
     tool_name: str
@@ -123,8 +167,9 @@ class ApprovalRequest:
     def __post_init__(self):
         if not self.request_id:
             # Deterministic ID from tool + params + time for idempotency
-            content = f"{self.tool_name}:{json.dumps(self.parameters, sort_keys=True)}:{self.timestamp}"
-            self.request_id = hashlib.sha256(content.encode()).hexdigest()[:16]
+            params = orjson.dumps(self.parameters, option=_ORJSON_STABLE)
+            content = b"%s:%s:%s" % (self.tool_name.encode(), params, self.timestamp.encode())
+            self.request_id = hashlib.sha256(content).hexdigest()[:16]
 
 
 def build_approval_request(
@@ -235,29 +280,41 @@ def _build_impact_summary(tool_name: str, params: Dict) -> str:
     return f"Will execute {tool_name.replace('_', ' ')} on the live pfSense appliance."
 
 
+# Parameter names whose values are never shown in approvals or audit logs
+_SENSITIVE_KEYS = frozenset({
+    "password", "pre_shared_key", "presharedkey", "privatekey",
+    "secret", "passphrase", "api_key", "prv", "key",
+    "pwd", "passwd", "token", "jwt_token", "bearer_token",
+    "cert", "certificate",
+})
+
+
 def _redact_sensitive(params: Dict) -> Dict:
     """Redact sensitive values from parameters for display.
 
     Passwords, keys, and secrets are replaced with '***REDACTED***'.
+    Copy-on-write: the input is returned unchanged (no copy) when nothing
+    needs redacting, which is the common case for audit and approval output.
     """
-    sensitive_keys = {"password", "pre_shared_key", "presharedkey", "privatekey",
-                      "secret", "passphrase", "api_key", "prv", "key",
-                      "pwd", "passwd", "token", "jwt_token", "bearer_token",
-                      "cert", "certificate"}
-    redacted = {}
+    redacted = None
     for k, v in params.items():
-        if k.lower() in sensitive_keys:
-            redacted[k] = "***REDACTED***"
+        if k.lower() in _SENSITIVE_KEYS:
+            new = "***REDACTED***"
         elif isinstance(v, dict):
-            redacted[k] = _redact_sensitive(v)
+            new = _redact_sensitive(v)
         elif isinstance(v, list):
-            redacted[k] = [
+            items = [
                 _redact_sensitive(item) if isinstance(item, dict) else item
                 for item in v
             ]
+            new = v if all(a is b for a, b in zip(items, v)) else items
         else:
-            redacted[k] = v
-    return redacted
+            continue
+        if new is not v:
+            if redacted is None:
+                redacted = dict(params)
+            redacted[k] = new
+    return params if redacted is None else redacted
 
 
 # ---------------------------------------------------------------------------
@@ -266,6 +323,46 @@ def _redact_sensitive(params: Dict) -> Dict:
 
 # Audit log file path (configurable via env var)
 _AUDIT_LOG_PATH = os.getenv("MCP_AUDIT_LOG", "")
+# File writer state, started lazily on the first audit entry
+_audit_logger: Optional[logging.Logger] = None
+_audit_listener: Optional[QueueListener] = None
+
+
+def _get_audit_logger() -> logging.Logger:
+    """Return the audit file logger, starting its background writer if needed.
+
+    Entries are enqueued by the caller and written to MCP_AUDIT_LOG by a
+    QueueListener thread, so disk I/O never blocks the event loop. The file
+    handle stays open for the process lifetime (rotate with copytruncate).
+    """
+    global _audit_logger, _audit_listener
+    if _audit_logger is None:
+        file_handler = logging.FileHandler(_AUDIT_LOG_PATH, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter("%(message)s"))
+        audit_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        _audit_listener = QueueListener(audit_queue, file_handler)
+        _audit_listener.start()
+
+        audit_logger = logging.getLogger(f"{__name__}.audit")
+        audit_logger.setLevel(logging.INFO)
+        audit_logger.propagate = False
+        audit_logger.handlers = [QueueHandler(audit_queue)]
+        _audit_logger = audit_logger
+    return _audit_logger
+
+
+def _stop_audit_writer():
+    """Flush pending audit entries and close the audit file."""
+    global _audit_logger, _audit_listener
+    if _audit_listener is not None:
+        _audit_listener.stop()
+        for handler in _audit_listener.handlers:
+            handler.close()
+    _audit_logger = None
+    _audit_listener = None
+
+
+atexit.register(_stop_audit_writer)
 
 
 def audit_log(
@@ -295,8 +392,9 @@ def audit_log(
     # Optionally write to dedicated audit file
     if _AUDIT_LOG_PATH:
         try:
-            with open(_AUDIT_LOG_PATH, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+            _get_audit_logger().info(
+                orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS).decode()
+            )
         except OSError as e:
             logger.warning("Failed to write audit log to %s: %s", _AUDIT_LOG_PATH, e)
 
@@ -305,7 +403,7 @@ def audit_log(
 # 4. Rate Limiting — Prevent Runaway Automation
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RateLimiter:
     """Sliding window rate limiter for destructive operations.
 
@@ -315,23 +413,26 @@ class RateLimiter:
     # Max operations per window (configurable via env)
     max_ops: int = 10
     window_seconds: int = 60
-    _timestamps: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    _timestamps: Dict[str, "deque[float]"] = field(default_factory=lambda: defaultdict(deque))
 
     def check(self, category: str) -> Optional[str]:
         """Check if the rate limit is exceeded.
 
         Returns None if OK, or an error message if rate-limited.
         """
-        now = time.time()
+        now = time.monotonic()
         cutoff = now - self.window_seconds
-        # Clean old entries
-        self._timestamps[category] = [t for t in self._timestamps[category] if t > cutoff]
-        if len(self._timestamps[category]) >= self.max_ops:
+        # Timestamps are appended in order, so expired ones are always at the
+        # left: drop them in place instead of rebuilding the list each call.
+        window = self._timestamps[category]
+        while window and window[0] <= cutoff:
+            window.popleft()
+        if len(window) >= self.max_ops:
             return (
                 f"Rate limit exceeded: {self.max_ops} {category} operations "
                 f"per {self.window_seconds}s. Wait before retrying."
             )
-        self._timestamps[category].append(now)
+        window.append(now)
         return None
 
 
@@ -405,7 +506,7 @@ def build_dry_run_response(
 # 6. Rollback Tracking
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RollbackEntry:
     """Records state before a destructive operation for potential rollback."""
     tool_name: str
@@ -415,9 +516,11 @@ class RollbackEntry:
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
 
-# In-memory rollback buffer (last N operations)
+# In-memory rollback buffer (last N operations). A bounded deque evicts the
+# oldest entry in O(1) on append instead of shifting a list with pop(0);
+# MCP_ROLLBACK_BUFFER=0 gives a zero-length deque, so nothing is recorded.
 _MAX_ROLLBACK_ENTRIES = int(os.getenv("MCP_ROLLBACK_BUFFER", "50"))
-_rollback_buffer: List[RollbackEntry] = []
+_rollback_buffer: "deque[RollbackEntry]" = deque(maxlen=max(0, _MAX_ROLLBACK_ENTRIES))
 
 
 def record_rollback(
@@ -434,15 +537,12 @@ def record_rollback(
         previous_state=previous_state,
     )
     _rollback_buffer.append(entry)
-    # Trim buffer
-    while len(_rollback_buffer) > _MAX_ROLLBACK_ENTRIES:
-        _rollback_buffer.pop(0)
     logger.debug("Rollback recorded: %s %s id=%s", tool_name, object_type, object_id)
 
 
 def get_rollback_history(limit: int = 10) -> List[Dict]:
     """Get recent rollback entries for review."""
-    entries = _rollback_buffer[-limit:]
+    entries = islice(reversed(_rollback_buffer), max(0, limit))
     return [
         {
             "tool": e.tool_name,
@@ -451,7 +551,7 @@ def get_rollback_history(limit: int = 10) -> List[Dict]:
             "has_previous_state": e.previous_state is not None,
             "timestamp": e.timestamp,
         }
-        for e in reversed(entries)
+        for e in entries
     ]
 
 
@@ -489,15 +589,19 @@ def is_tool_allowed(tool_name: str) -> bool:
 
 # Patterns that should never appear in user-supplied string parameters
 _INJECTION_PATTERNS = [
-    re.compile(r"\.\./"),                    # Directory traversal
-    re.compile(r";\s*\w"),                   # Command chaining
-    re.compile(r"\|\s*\w"),                  # Pipe injection
-    re.compile(r"`[^`]+`"),                  # Backtick execution
-    re.compile(r"\$\("),                     # Command substitution
-    re.compile(r"\$\{"),                     # Variable expansion
-    re.compile(r"<script", re.IGNORECASE),   # XSS
+    r"\.\./",                  # Directory traversal
+    r";\s*\w",                 # Command chaining
+    r"\|\s*\w",                # Pipe injection
+    r"`[^`]+`",                # Backtick execution
+    r"\$\(",                   # Command substitution
+    r"\$\{",                   # Variable expansion
+    r"(?i:<script)",           # XSS
 ]
 
+# All patterns joined into one alternation so each value is scanned once
+# instead of once per pattern.
+_INJECTION_RE = re.compile("|".join(_INJECTION_PATTERNS))
+
 
 def sanitize_input(value: str, field_name: str = "input") -> Optional[str]:
     """Check a string input for injection patterns.
@@ -506,13 +610,12 @@ def sanitize_input(value: str, field_name: str = "input") -> Optional[str]:
     """
     if not isinstance(value, str):
         return None
-    for pattern in _INJECTION_PATTERNS:
-        if pattern.search(value):
-            return (
-                f"Potentially unsafe content detected in '{field_name}'. "
-                f"Input contains a pattern that could indicate injection. "
-                f"Review the value and retry."
-            )
+    if _INJECTION_RE.search(value):
+        return (
+            f"Potentially unsafe content detected in '{field_name}'. "
+            f"Input contains a pattern that could indicate injection. "
+            f"Review the value and retry."
+        )
     return None
 
 
@@ -547,6 +650,17 @@ def sanitize_parameters(params: Dict[str, Any]) -> Optional[str]:
 # Unified Guardrail Check — Call This From Every Tool
 # ---------------------------------------------------------------------------
 
+_NOT_ALLOWED_MSG = "Tool '{}' is not in the allowed tools list (MCP_ALLOWED_TOOLS)."
+
+
+def _blocked(error: str, risk: Optional[RiskLevel] = None) -> Dict[str, Any]:
+    """Build the response returned when a guardrail blocks a call."""
+    response: Dict[str, Any] = {"success": False, "error": error}
+    if risk is not None:
+        response["risk_level"] = risk.value
+    return response
+
+
 def check_guardrails(
     tool_name: str,
     parameters: Dict[str, Any],
@@ -569,29 +683,17 @@ def check_guardrails(
 
     # 1. Allowlist check
     if not is_tool_allowed(tool_name):
-        return {
-            "success": False,
-            "error": f"Tool '{tool_name}' is not in the allowed tools list (MCP_ALLOWED_TOOLS).",
-            "risk_level": risk.value,
-        }
+        return _blocked(_NOT_ALLOWED_MSG.format(tool_name), risk)
 
     # 2. Input sanitization
     injection_err = sanitize_parameters(parameters)
     if injection_err:
-        return {
-            "success": False,
-            "error": injection_err,
-            "risk_level": risk.value,
-        }
+        return _blocked(injection_err, risk)
 
     # 3. Rate limiting
     rate_err = check_rate_limit(tool_name)
     if rate_err:
-        return {
-            "success": False,
-            "error": rate_err,
-            "risk_level": risk.value,
-        }
+        return _blocked(rate_err, risk)
 
     # 4. Dry-run mode
     if dry_run:
@@ -601,7 +703,7 @@ def check_guardrails(
         )
 
     # 5. Confirmation gate for HIGH and CRITICAL risk
-    if risk in (RiskLevel.HIGH, RiskLevel.CRITICAL) and not confirm:
+    if risk.requires_confirmation and not confirm:
         return build_approval_request(
             tool_name, parameters,
             description=_build_impact_summary(tool_name, parameters),
@@ -618,10 +720,32 @@ def check_guardrails(
 # Guarded Tool Wrapper — Automatically applies guardrails to any tool
 # ---------------------------------------------------------------------------
 
-import functools  # noqa: E402
 import inspect  # noqa: E402
 
 from .models import PaginationOptions  # noqa: E402
+from .server import get_api_client  # noqa: E402
+
+
+def _collect_params(
+    param_names: Tuple[str, ...],
+    args: tuple,
+    kwargs: Dict[str, Any],
+    skip: frozenset = frozenset(),
+) -> Dict[str, Any]:
+    """Map a call's positional and keyword arguments onto parameter names."""
+    params = {}
+    for index, name in enumerate(param_names):
+        if name in skip:
+            continue
+        if name in kwargs:
+            params[name] = kwargs[name]
+        elif index < len(args):
+            params[name] = args[index]
+    return params
+
+
+_GUARD_FLAGS = frozenset({"confirm", "dry_run"})
+_LATEST_REVISION = PaginationOptions(limit=1)
 
 
 def rate_limited(fn):
@@ -637,37 +761,32 @@ def rate_limited(fn):
         async def create_something(name: str, ...):
             ...
     """
+    # Tool name, risk and signature are fixed per function — resolve them
+    # once at decoration time instead of on every call.
+    tool_name = fn.__name__
+    risk = classify_risk(tool_name)
+    param_names = tuple(inspect.signature(fn).parameters)
+    not_allowed_msg = _NOT_ALLOWED_MSG.format(tool_name)
+
     @functools.wraps(fn)
     async def wrapper(*args, **kwargs):
-        tool_name = fn.__name__
-        risk = classify_risk(tool_name)
-
         if risk != RiskLevel.READ:
             # Build parameter dict for inspection
-            params = {}
-            sig = inspect.signature(fn)
-            for name, param in sig.parameters.items():
-                if name in kwargs:
-                    params[name] = kwargs[name]
-                elif args and list(sig.parameters.keys()).index(name) < len(args):
-                    params[name] = args[list(sig.parameters.keys()).index(name)]
+            params = _collect_params(param_names, args, kwargs)
 
             # Allowlist check
             if not is_tool_allowed(tool_name):
-                return {
-                    "success": False,
-                    "error": f"Tool '{tool_name}' is not in the allowed tools list (MCP_ALLOWED_TOOLS).",
-                }
+                return _blocked(not_allowed_msg)
 
             # Input sanitization
             injection_err = sanitize_parameters(params)
             if injection_err:
-                return {"success": False, "error": injection_err}
+                return _blocked(injection_err)
 
             # Rate limiting
             rate_err = check_rate_limit(tool_name)
             if rate_err:
-                return {"success": False, "error": rate_err}
+                return _blocked(rate_err)
 
             # Audit log
             audit_log(tool_name, risk, params, result="proceeding", user_confirmed=False)
@@ -705,22 +824,19 @@ def guarded(fn):
     4. If guardrails pass, calls the original function
     5. After successful execution, logs the audit result
     """
+    # Resolved once at decoration time (see rate_limited)
+    tool_name = fn.__name__
+    risk = classify_risk(tool_name)
+    param_names = tuple(inspect.signature(fn).parameters)
+    object_type = tool_name.replace("delete_", "").replace("_", " ")
+
     @functools.wraps(fn)
     async def wrapper(*args, **kwargs):
-        tool_name = fn.__name__
         confirm = kwargs.get("confirm", False)
         dry_run = kwargs.get("dry_run", False)
 
         # Build parameter dict for guardrail inspection (exclude internal flags)
-        params = {}
-        sig = inspect.signature(fn)
-        for name, param in sig.parameters.items():
-            if name in ("confirm", "dry_run"):
-                continue
-            if name in kwargs:
-                params[name] = kwargs[name]
-            elif args and list(sig.parameters.keys()).index(name) < len(args):
-                params[name] = args[list(sig.parameters.keys()).index(name)]
+        params = _collect_params(param_names, args, kwargs, skip=_GUARD_FLAGS)
 
         # Run all guardrail checks
         block = check_guardrails(tool_name, params, confirm=confirm, dry_run=dry_run)
@@ -729,14 +845,12 @@ def guarded(fn):
 
         # Capture pre-change config revision for rollback
         pre_change_revision = None
-        risk = classify_risk(tool_name)
-        if risk in (RiskLevel.HIGH, RiskLevel.CRITICAL):
+        if risk.requires_confirmation:
             try:
-                from .server import get_api_client as _get_client
-                _client = _get_client()
+                _client = get_api_client()
                 _hist = await _client.crud_list(
                     "/diagnostics/config_history/revisions",
-                    pagination=PaginationOptions(limit=1),
+                    pagination=_LATEST_REVISION,
                 )
                 _revisions = _hist.get("data") or []
                 if _revisions:
@@ -765,7 +879,7 @@ def guarded(fn):
             # Record in rollback buffer
             record_rollback(
                 tool_name,
-                tool_name.replace("delete_", "").replace("_", " "),
+                object_type,
                 _extract_object_id(params),
                 pre_change_revision,
             )
@@ -774,7 +888,7 @@ def guarded(fn):
         success = result.get("success", False) if isinstance(result, dict) else True
         audit_log(
             tool_name,
-            classify_risk(tool_name),
+            risk,
             params,
             result="success" if success else "failed",
             user_confirmed=confirm,
@@ -3,7 +3,10 @@
 import ipaddress
 import logging
 import re
-from typing import Dict, List, Optional, Union
+import socket
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple, Union
 
 from .models import PaginationOptions, QueryFilter, SortOptions
 
@@ -19,6 +22,28 @@ VALID_LOG_TYPES = frozenset({
     "firewall", "system", "dhcp", "openvpn", "auth",
 })
 
+# Actions accepted by POST /api/v2/status/service
+VALID_SERVICE_ACTIONS = frozenset({"start", "stop", "restart"})
+
+
+_utc_iso_cache: Tuple[int, str] = (0, "")
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string, at one-second resolution.
+
+    Nearly every tool response carries a timestamp; the string is only
+    rebuilt when the wall-clock second changes. Use datetime directly where
+    sub-second precision matters (e.g. audit entries).
+    """
+    global _utc_iso_cache
+    now = int(time.time())
+    second, iso = _utc_iso_cache
+    if now != second:
+        iso = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+        _utc_iso_cache = (now, iso)
+    return iso
+
 
 def safe_data_dict(result: Dict) -> Dict:
     """Safely extract the 'data' dict from an API response.
@@ -39,6 +64,47 @@ def safe_data_list(result: Dict) -> List:
     return data if isinstance(data, list) else []
 
 
+def filter_by_search_term(rows: List[Dict], search_term: str, fields: Tuple[str, ...]) -> List[Dict]:
+    """Keep rows where search_term appears (case-insensitive) in any of fields.
+
+    The term is lower-cased once and each row stops at its first matching
+    field. Missing or null fields never match; non-string values are
+    compared by their str() form.
+    """
+    term = search_term.lower()
+
+    def _matches(row: Dict) -> bool:
+        for name in fields:
+            value = row.get(name)
+            if value is None:
+                continue
+            if term in (value if isinstance(value, str) else str(value)).lower():
+                return True
+        return False
+
+    return [row for row in rows if _matches(row)]
+
+
+def rows_to_columns(rows: List[Dict]) -> Dict[str, List]:
+    """Convert a list of row dicts into one list per field.
+
+    Columns appear in first-seen key order; rows missing a field get None
+    in that column, so every list has len(rows) entries. Field names are
+    sent once instead of once per row, which shrinks large list responses.
+    """
+    columns: Dict[str, List] = {}
+    for i, row in enumerate(rows):
+        for key, value in row.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * i
+            column.append(value)
+        for column in columns.values():
+            if len(column) == i:
+                column.append(None)
+    return columns
+
+
 MAX_DESCRIPTION_LENGTH = 1024
 
 
@@ -173,6 +239,13 @@ def validate_ip_address(ip: str) -> str:
     ip = ip.strip()
     if ip.lower() == "any":
         return "any"
+    # Fast path: a plain dotted-quad is checked by a single libc call without
+    # building an ipaddress object. CIDRs, IPv6 and rejects fall through.
+    try:
+        socket.inet_pton(socket.AF_INET, ip)
+        return ip
+    except (OSError, ValueError):
+        pass
     try:
         ipaddress.ip_network(ip, strict=False)
     except ValueError as e:
@@ -242,9 +315,10 @@ VALID_ALIAS_TYPES = frozenset({"host", "network", "port", "url"})
 
 VALID_PROTOCOLS = frozenset({"tcp", "udp", "icmp", "tcp/udp", "any"})
 
-_MAC_COLON_RE = re.compile(r"^([0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}$")
-_MAC_HYPHEN_RE = re.compile(r"^([0-9a-fA-F]{2}-){5}[0-9a-fA-F]{2}$")
-_MAC_BARE_RE = re.compile(r"^[0-9a-fA-F]{12}$")
+# Colon, hyphen or bare MAC in one pattern: the separator captured after the
+# first octet (possibly empty) must repeat between every following octet.
+_MAC_RE = re.compile(r"^[0-9a-fA-F]{2}([:-]?)(?:[0-9a-fA-F]{2}\1){4}[0-9a-fA-F]{2}$")
+_MAC_SEPARATORS = str.maketrans("", "", ":-")
 
 MAX_BULK_IPS = 100
 
@@ -274,12 +348,8 @@ def normalize_mac_address(mac: str) -> str:
         ValueError: If the MAC address is not valid in any supported format.
     """
     stripped = mac.strip()
-    if _MAC_COLON_RE.match(stripped):
-        return stripped.lower()
-    if _MAC_HYPHEN_RE.match(stripped):
-        return stripped.replace("-", ":").lower()
-    if _MAC_BARE_RE.match(stripped):
-        h = stripped.lower()
+    if _MAC_RE.match(stripped):
+        h = stripped.translate(_MAC_SEPARATORS).lower()
         return ":".join(h[i:i+2] for i in range(0, 12, 2))
     raise ValueError(
         f"Invalid MAC address '{mac}'. Accepted formats: "
@@ -363,6 +433,24 @@ def validate_alias_addresses(alias_type: str, addresses: List[str]) -> Optional[
     return None
 
 
+def dedupe_alias_entries(
+    addresses: List[str], details: Optional[List[str]] = None
+) -> Tuple[List[str], Optional[List[str]]]:
+    """Strip alias entries and drop repeats, keeping the first occurrence.
+
+    When ``details`` lines up with ``addresses`` (one description per
+    entry), the matching descriptions are dropped with their entries;
+    otherwise ``details`` is returned unchanged.
+    """
+    stripped = [addr.strip() for addr in addresses]
+    if details is None or len(details) != len(stripped):
+        return list(dict.fromkeys(stripped)), details
+    first: Dict[str, str] = {}
+    for addr, detail in zip(stripped, details):
+        first.setdefault(addr, detail)
+    return list(first), list(first.values())
+
+
 # --------------------------------------------------------------------------- #
 # pfSense filterlog parser
 # --------------------------------------------------------------------------- #
@@ -376,6 +464,29 @@ def validate_alias_addresses(alias_type: str, addresses: List[str]) -> Optional[
 #   ..., class, flow_label, hop_limit, protocol, proto_id, length,
 #   src_ip, dst_ip, [src_port, dst_port if TCP/UDP]
 
+# Dotted-quad candidates for the non-filterlog fallback (validated afterwards)
+_IPV4_CANDIDATE_RE = re.compile(r"\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b")
+
+
+def _is_ip_address(value: str) -> bool:
+    """Return True if value is a bare IPv4 or IPv6 address.
+
+    Tries libc inet_pton first (no object allocation) and only falls back to
+    the ipaddress module for forms it doesn't accept, such as scoped IPv6.
+    """
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(family, value)
+            return True
+        except (OSError, ValueError):
+            pass
+    try:
+        ipaddress.ip_address(value)
+        return True
+    except ValueError:
+        return False
+
+
 def parse_filterlog_entry(text: str) -> Optional[Dict[str, str]]:
     """Parse a pfSense filterlog syslog line into structured fields.
 
@@ -397,71 +508,49 @@ def parse_filterlog_entry(text: str) -> Optional[Dict[str, str]]:
     csv_part = text[colon_idx + 3:]
 
     fields = csv_part.split(",")
-    if len(fields) < 7:
+    n = len(fields)
+    if n < 7:
         return None
 
+    # Indexes below 7 are guaranteed by the length check above, and each
+    # address-family branch only runs once its whole prefix is present.
+    ip_ver = fields[8] if n > 8 else ""
     result: Dict[str, str] = {
-        "tracker": fields[3] if len(fields) > 3 else "",
-        "interface": fields[4] if len(fields) > 4 else "",
-        "reason": fields[5] if len(fields) > 5 else "",
-        "action": fields[6] if len(fields) > 6 else "",
-        "direction": fields[7] if len(fields) > 7 else "",
-        "ip_version": fields[8] if len(fields) > 8 else "",
+        "tracker": fields[3],
+        "interface": fields[4],
+        "reason": fields[5],
+        "action": fields[6],
+        "direction": fields[7] if n > 7 else "",
+        "ip_version": ip_ver,
     }
 
-    ip_ver = result["ip_version"]
-
-    if ip_ver == "4" and len(fields) >= 20:
-        result["protocol"] = fields[16] if len(fields) > 16 else ""
+    if ip_ver == "4" and n >= 20:
+        result["protocol"] = fields[16]
         # Validate extracted IPs to guard against format changes
-        raw_src = fields[18] if len(fields) > 18 else ""
-        raw_dst = fields[19] if len(fields) > 19 else ""
-        try:
-            ipaddress.ip_address(raw_src)
-            result["src_ip"] = raw_src
-        except ValueError:
-            result["src_ip"] = ""
-        try:
-            ipaddress.ip_address(raw_dst)
-            result["dst_ip"] = raw_dst
-        except ValueError:
-            result["dst_ip"] = ""
+        raw_src = fields[18]
+        raw_dst = fields[19]
+        result["src_ip"] = raw_src if _is_ip_address(raw_src) else ""
+        result["dst_ip"] = raw_dst if _is_ip_address(raw_dst) else ""
         # TCP/UDP have src_port and dst_port after dst_ip
-        if len(fields) >= 22:
+        if n >= 22:
             result["src_port"] = fields[20]
             result["dst_port"] = fields[21]
 
-    elif ip_ver == "6" and len(fields) >= 17:
-        result["protocol"] = fields[12] if len(fields) > 12 else ""
+    elif ip_ver == "6" and n >= 17:
+        result["protocol"] = fields[12]
         # IPv6 addresses are validated more loosely (contain colons)
-        raw_src = fields[15] if len(fields) > 15 else ""
-        raw_dst = fields[16] if len(fields) > 16 else ""
-        try:
-            ipaddress.ip_address(raw_src)
-            result["src_ip"] = raw_src
-        except ValueError:
-            result["src_ip"] = ""
-        try:
-            ipaddress.ip_address(raw_dst)
-            result["dst_ip"] = raw_dst
-        except ValueError:
-            result["dst_ip"] = ""
+        raw_src = fields[15]
+        raw_dst = fields[16]
+        result["src_ip"] = raw_src if _is_ip_address(raw_src) else ""
+        result["dst_ip"] = raw_dst if _is_ip_address(raw_dst) else ""
         # TCP/UDP have src_port and dst_port after dst_ip
-        if len(fields) >= 19:
+        if n >= 19:
             result["src_port"] = fields[17]
             result["dst_port"] = fields[18]
 
     else:
         # Fallback: try to extract IPs via regex but validate them
-        _ipv4_re = re.compile(r"\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b")
-        candidates = _ipv4_re.findall(csv_part)
-        valid_ips = []
-        for c in candidates:
-            try:
-                ipaddress.ip_address(c)
-                valid_ips.append(c)
-            except ValueError:
-                continue
+        valid_ips = [c for c in _IPV4_CANDIDATE_RE.findall(csv_part) if _is_ip_address(c)]
         if valid_ips:
             result["src_ip"] = valid_ips[0]
             if len(valid_ips) > 1:
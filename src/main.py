@@ -5,10 +5,14 @@ Implements: Object IDs, Queries/Filters, HATEOAS, Control Parameters
 Compatible with pfSense REST API v2 (jaredhendrickson13/pfsense-api)
 """
 
+import argparse
 import asyncio
 import os
 import sys
 
+import uvicorn
+
+from .middleware import BearerAuthMiddleware
 from .server import VERSION, get_api_client, logger, mcp, reset_api_client
 
 # Read-only mode: only register read-level tools (MCP security best practice: least privilege)
@@ -67,11 +71,58 @@ if _READ_ONLY_MODE:
     )
 
 
+def _install_uvloop() -> bool:
+    """Use uvloop for the asyncio event loop when it is installed.
+
+    uvloop ships with ``uvicorn[standard]`` on Linux/macOS but is not
+    available on Windows, so the stdlib selector loop remains the fallback.
+    Both the preflight check and the stdio transport (anyio) create their
+    loops through the global policy, so setting it once covers every mode.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _http_workers() -> int:
+    """Number of uvicorn worker processes for HTTP mode (MCP_WORKERS, default 1)."""
+    try:
+        return max(1, int(os.getenv("MCP_WORKERS", "1")))
+    except ValueError:
+        return 1
+
+
+def create_http_app():
+    """Build the authenticated ASGI app for the streamable-http transport.
+
+    Everything is read from the environment so uvicorn can call this as an
+    app factory in each worker process. With more than one worker, MCP
+    sessions can't be pinned to a process, so the app runs stateless.
+    """
+    api_key = os.getenv("MCP_API_KEY")
+    if not api_key:
+        raise RuntimeError("MCP_API_KEY must be set for streamable-http transport")
+
+    app = mcp.http_app(stateless_http=True if _http_workers() > 1 else None)
+
+    # Parse allowed origins from env (comma-separated) or use defaults
+    allowed_origins_str = os.getenv("MCP_ALLOWED_ORIGINS", "")
+    allowed_origins = None
+    if allowed_origins_str.strip():
+        allowed_origins = {o.strip().rstrip("/").lower() for o in allowed_origins_str.split(",")}
+        logger.info("Allowed origins: %s", allowed_origins)
+
+    app = BearerAuthMiddleware(app, api_key, allowed_origins=allowed_origins)
+    logger.info("Bearer token auth and Origin validation enabled")
+    return app
+
+
 # Main execution
 def main():
     """Main entry point for the Enhanced pfSense MCP Server"""
-    import argparse
-
     parser = argparse.ArgumentParser(description="pfSense MCP Server")
     parser.add_argument(
         "-t", "--transport",
@@ -92,10 +143,13 @@ def main():
     )
     args = parser.parse_args()
 
-    logger.info(f"Starting Enhanced pfSense MCP Server v{VERSION}")
-    logger.info(f"Connecting to pfSense at: {os.getenv('PFSENSE_URL')}")
-    logger.info(f"Auth Method: {os.getenv('AUTH_METHOD', 'api_key')}")
-    logger.info(f"Transport: {args.transport}")
+    logger.info("Starting Enhanced pfSense MCP Server v%s", VERSION)
+    logger.info("Connecting to pfSense at: %s", os.getenv("PFSENSE_URL"))
+    logger.info("Auth Method: %s", os.getenv("AUTH_METHOD", "api_key"))
+    logger.info("Transport: %s", args.transport)
+
+    if _install_uvloop():
+        logger.info("Event loop: uvloop")
 
     # Security warnings per MCP spec best practices
     if os.getenv("VERIFY_SSL", "true").lower() == "false":
@@ -123,9 +177,7 @@ def main():
                 logger.error("Failed to connect to pfSense API: %s", result.get("error", "unknown error"))
                 return False
         except Exception as e:
-            logger.error(f"Connection error: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("Connection error: %s", e)
             return False
         finally:
             # Close the client and clear the singleton so the MCP server
@@ -149,32 +201,28 @@ def main():
         logger.info("Starting MCP server in stdio mode...")
         mcp.run(transport="stdio")
     elif args.transport == "streamable-http":
-        import uvicorn
-
-        from .middleware import BearerAuthMiddleware
-
-        app = mcp.http_app()
-
         # Require bearer auth for HTTP transport — fail closed
-        api_key = os.getenv("MCP_API_KEY")
-        if not api_key:
+        if not os.getenv("MCP_API_KEY"):
             logger.error(
                 "MCP_API_KEY must be set for streamable-http transport. "
                 "Set MCP_API_KEY or use --transport stdio."
             )
             sys.exit(1)
-        # Parse allowed origins from env (comma-separated) or use defaults
-        allowed_origins_str = os.getenv("MCP_ALLOWED_ORIGINS", "")
-        allowed_origins = None
-        if allowed_origins_str.strip():
-            allowed_origins = {o.strip().rstrip("/").lower() for o in allowed_origins_str.split(",")}
-            logger.info("Allowed origins: %s", allowed_origins)
-
-        app = BearerAuthMiddleware(app, api_key, allowed_origins=allowed_origins)
-        logger.info("Bearer token auth and Origin validation enabled")
-
-        logger.info(f"Starting MCP server on http://{args.host}:{args.port}/mcp")
-        uvicorn.run(app, host=args.host, port=args.port)
+
+        workers = _http_workers()
+        logger.info("Starting MCP server on http://%s:%s/mcp", args.host, args.port)
+        if workers > 1:
+            # Each worker process imports this module and builds its own app
+            logger.info("HTTP workers: %d (stateless sessions)", workers)
+            uvicorn.run(
+                "src.main:create_http_app",
+                factory=True,
+                host=args.host,
+                port=args.port,
+                workers=workers,
+            )
+        else:
+            uvicorn.run(create_http_app(), host=args.host, port=args.port)
 
 
 if __name__ == "__main__":
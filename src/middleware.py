@@ -20,6 +20,25 @@ _LOCAL_ORIGINS = frozenset({
 })
 
 
+def _json_error(status: int, body: bytes) -> tuple:
+    """Pre-encode an ASGI (start, body) message pair for a fixed JSON error."""
+    start = {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+
+# Rejections are constant, so their bytes are built once at import
+# instead of serializing a JSONResponse per refused request.
+_FORBIDDEN = _json_error(403, b'{"error":"Forbidden: Origin not allowed"}')
+_UNAUTHORIZED = _json_error(401, b'{"error":"Unauthorized"}')
+
+
 class BearerAuthMiddleware:
     """ASGI middleware that validates Origin headers and Bearer tokens.
 
@@ -40,6 +59,7 @@ class BearerAuthMiddleware:
         # Support multiple API keys (comma-separated MCP_API_KEY for per-user tokens)
         # Format: "token1,token2,token3" or just "single_token"
         self.api_keys = frozenset(k.strip() for k in api_key.split(",") if k.strip())
+        self._api_key_bytes = tuple(k.encode() for k in self.api_keys)
         self.allowed_origins = allowed_origins or _LOCAL_ORIGINS
 
     def _is_origin_allowed(self, origin: str) -> bool:
@@ -62,36 +82,42 @@ class BearerAuthMiddleware:
         base = f"{parsed.scheme}://{parsed.hostname}"
         return base in self.allowed_origins
 
+    @staticmethod
+    async def _reject(send, response: tuple) -> None:
+        start, body = response
+        await send(start)
+        await send(body)
+
     async def __call__(self, scope, receive, send):
         # Allow ASGI lifespan events (startup/shutdown) without auth
         if scope["type"] == "lifespan":
             await self.app(scope, receive, send)
             return
 
-        # All other scope types (http, websocket) require auth
-        headers = dict(scope.get("headers", []))
+        # All other scope types (http, websocket) require auth. Pull out the
+        # two headers we need in one pass instead of building a dict of all.
+        origin_raw = auth_raw = b""
+        for name, value in scope.get("headers", ()):
+            if name == b"authorization":
+                auth_raw = value
+            elif name == b"origin":
+                origin_raw = value
 
         # 1. Origin validation (MCP spec MUST)
-        origin = headers.get(b"origin", b"").decode()
+        origin = origin_raw.decode("latin-1") if origin_raw else ""
         if origin and not self._is_origin_allowed(origin):
             logger.warning("Rejected request with disallowed Origin: %s", origin)
             if scope["type"] == "websocket":
                 await send({"type": "websocket.close", "code": 4403})
             else:
-                from starlette.responses import JSONResponse
-                response = JSONResponse(
-                    {"error": "Forbidden: Origin not allowed"},
-                    status_code=403,
-                )
-                await response(scope, receive, send)
+                await self._reject(send, _FORBIDDEN)
             return
 
         # 2. Bearer token auth (supports multiple keys for per-user tokens)
-        auth_header = headers.get(b"authorization", b"").decode()
         token_valid = False
-        if auth_header.startswith("Bearer "):
-            presented_token = auth_header[7:]
-            for valid_key in self.api_keys:
+        if auth_raw.startswith(b"Bearer "):
+            presented_token = auth_raw[7:]
+            for valid_key in self._api_key_bytes:
                 if hmac.compare_digest(presented_token, valid_key):
                     token_valid = True
                     break
@@ -99,9 +125,7 @@ class BearerAuthMiddleware:
             if scope["type"] == "websocket":
                 await send({"type": "websocket.close", "code": 4401})
             else:
-                from starlette.responses import JSONResponse
-                response = JSONResponse({"error": "Unauthorized"}, status_code=401)
-                await response(scope, receive, send)
+                await self._reject(send, _UNAUTHORIZED)
             return
 
         await self.app(scope, receive, send)
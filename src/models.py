@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple, Union
 
 
 class PfSenseVersion(str, Enum):
@@ -20,7 +20,7 @@ class AuthMethod(str, Enum):
     JWT = "jwt"
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryFilter:
     """Represents a query filter for API requests"""
     field: str
@@ -47,7 +47,7 @@ class QueryFilter:
             return (f"{self.field}__{self.operator}", str(self.value))
 
 
-@dataclass
+@dataclass(slots=True)
 class SortOptions:
     """Represents sorting options for API requests"""
     sort_by: Optional[str] = None
@@ -62,7 +62,7 @@ class SortOptions:
         return params
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PaginationOptions:
     """Represents pagination options"""
     limit: Optional[int] = None
@@ -78,7 +78,7 @@ class PaginationOptions:
         return params
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlParameters:
     """Represents common control parameters"""
     apply: bool = False
@@ -101,3 +101,18 @@ class ControlParameters:
         if self.remove:
             params["remove"] = "true"
         return params
+
+    def to_body(self) -> Dict[str, Union[bool, int]]:
+        """Convert to native JSON body fields (bools and ints, not strings)"""
+        body: Dict[str, Union[bool, int]] = {}
+        if self.apply:
+            body["apply"] = True
+        if not self.async_mode:
+            body["async"] = False
+        if self.placement is not None:
+            body["placement"] = self.placement
+        if self.append:
+            body["append"] = True
+        if self.remove:
+            body["remove"] = True
+        return body
@@ -1,10 +1,14 @@
 """MCP server instance and API client singleton."""
 
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
@@ -26,10 +30,74 @@ logger = logging.getLogger(__name__)
 # Version
 VERSION = "1.0.0"
 
+
+async def _warm_up() -> None:
+    """Prime the connection pool (and the GET cache, when PFSENSE_CACHE_TTL
+    is set) with the reads most sessions start with.
+
+    Runs the requests concurrently so they share one TLS connection
+    (multiplexed over HTTP/2). Failures are only logged; tools report
+    connectivity errors themselves when called.
+    """
+    try:
+        client = get_api_client()
+    except ValueError as e:
+        logger.warning("Skipping warm-up: %s", e)
+        return
+    results = await asyncio.gather(
+        client.get_system_status(),
+        client.get_interfaces(),
+        client.get_services(),
+        return_exceptions=True,
+    )
+    failed = sum(isinstance(r, BaseException) for r in results)
+    if failed:
+        logger.warning("Warm-up: %d of %d requests failed", failed, len(results))
+    else:
+        logger.info("Warm-up complete")
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Own the API client for the lifetime of the server.
+
+    The client (and its connection pool) is built on the server's event
+    loop before any tool runs, and closed on shutdown so pooled
+    connections are released cleanly instead of left to the GC.
+    """
+    try:
+        get_api_client()
+    except ValueError as e:
+        # Misconfiguration is reported per tool call, as before
+        logger.warning("API client not initialized at startup: %s", e)
+    if _env_bool("PFSENSE_WARM_CACHE", "false"):
+        await _warm_up()
+    try:
+        yield
+    finally:
+        client = api_client
+        if client is not None:
+            await client.close()
+            reset_api_client()
+
+
+def _serialize_tool_result(data) -> str:
+    """Encode tool results with orjson (FastMCP's default is pydantic_core).
+
+    Tool results embed raw pfSense payloads — rule sets, leases, logs — and
+    orjson encodes those dicts several times faster. Unknown types fall
+    back to str() like the default; if orjson still fails (e.g. integers
+    beyond 64 bits), FastMCP retries with its own serializer.
+    """
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
     "pfSense Enhanced MCP Server",
     version=VERSION,
+    lifespan=_lifespan,
+    tool_serializer=_serialize_tool_result,
     instructions=(
         "You are managing a pfSense firewall via REST API v2. "
         "All destructive operations (delete, bulk block) require confirm=True. "
@@ -51,34 +119,65 @@ def reset_api_client():
     api_client = None
 
 
-def get_api_client() -> EnhancedPfSenseAPIClient:
-    """Get or create enhanced API client"""
-    global api_client
-    if api_client is None:
-        # Determine version
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() == "true"
+
+
+_VERSION_MAP = {
+    "CE_2_8_0": PfSenseVersion.CE_2_8_0,
+    "CE_2_8_1": PfSenseVersion.CE_2_8_1,
+    "CE_26_03": PfSenseVersion.CE_26_03,
+    "PLUS_24_11": PfSenseVersion.PLUS_24_11,
+    "PLUS_25_11": PfSenseVersion.PLUS_25_11,
+}
+
+_AUTH_METHOD_MAP = {method.value: method for method in AuthMethod}
+
+
+@dataclass(frozen=True, slots=True)
+class PfSenseSettings:
+    """pfSense connection settings, read from the environment once."""
+    url: str
+    auth_method: AuthMethod
+    version: PfSenseVersion
+    username: Optional[str]
+    password: Optional[str]
+    api_key: Optional[str]
+    verify_ssl: bool
+    timeout: int
+    enable_hateoas: bool
+    pool_size: int
+    http2: bool
+    cache_ttl: float
+
+    @classmethod
+    def from_env(cls) -> "PfSenseSettings":
         pf_version = os.getenv("PFSENSE_VERSION", "CE_2_8_0")
-        version_map = {
-            "CE_2_8_0": PfSenseVersion.CE_2_8_0,
-            "CE_2_8_1": PfSenseVersion.CE_2_8_1,
-            "CE_26_03": PfSenseVersion.CE_26_03,
-            "PLUS_24_11": PfSenseVersion.PLUS_24_11,
-            "PLUS_25_11": PfSenseVersion.PLUS_25_11,
-        }
-        version = version_map.get(pf_version)
+        version = _VERSION_MAP.get(pf_version)
         if version is None:
             raise ValueError(
                 f"PFSENSE_VERSION='{pf_version}' is not recognized. "
-                f"Valid options: {', '.join(version_map.keys())}"
+                f"Valid options: {', '.join(_VERSION_MAP.keys())}"
             )
 
-        # Determine auth method
-        auth_method_str = os.getenv("AUTH_METHOD", "api_key").lower()
-        if auth_method_str == "basic":
-            auth_method = AuthMethod.BASIC
-        elif auth_method_str == "jwt":
-            auth_method = AuthMethod.JWT
-        else:
-            auth_method = AuthMethod.API_KEY
+        # Unknown values fall back to API key auth
+        auth_method = _AUTH_METHOD_MAP.get(
+            os.getenv("AUTH_METHOD", "api_key").lower(), AuthMethod.API_KEY
+        )
 
         pfsense_url = os.getenv("PFSENSE_URL", "").strip()
         if not pfsense_url:
@@ -87,25 +186,52 @@ def get_api_client() -> EnhancedPfSenseAPIClient:
                 "or set the PFSENSE_URL environment variable."
             )
 
-        api_key = (os.getenv("PFSENSE_API_KEY") or "").strip() or None
-        if auth_method == AuthMethod.API_KEY and not api_key:
-            logger.warning("PFSENSE_API_KEY is not set — API calls will fail with 401")
-
-        try:
-            api_timeout = int(os.getenv("API_TIMEOUT", "30"))
-        except ValueError:
-            api_timeout = 30
-
-        api_client = EnhancedPfSenseAPIClient(
-            host=pfsense_url,
+        return cls(
+            url=pfsense_url,
             auth_method=auth_method,
+            version=version,
             username=os.getenv("PFSENSE_USERNAME"),
             password=os.getenv("PFSENSE_PASSWORD"),
-            api_key=api_key,
-            verify_ssl=os.getenv("VERIFY_SSL", "true").lower() == "true",
-            timeout=api_timeout,
-            version=version,
-            enable_hateoas=os.getenv("ENABLE_HATEOAS", "false").lower() == "true"
+            api_key=(os.getenv("PFSENSE_API_KEY") or "").strip() or None,
+            verify_ssl=_env_bool("VERIFY_SSL", "true"),
+            timeout=_env_int("API_TIMEOUT", 30),
+            enable_hateoas=_env_bool("ENABLE_HATEOAS", "false"),
+            pool_size=_env_int("PFSENSE_POOL_SIZE", 100),
+            http2=_env_bool("PFSENSE_HTTP2", "true"),
+            cache_ttl=_env_float("PFSENSE_CACHE_TTL", 0.0),
+        )
+
+
+# Parsed on first use and kept across reset_api_client(), so the preflight
+# client and the server's client share one read of the environment
+settings: Optional[PfSenseSettings] = None
+
+
+def get_api_client() -> EnhancedPfSenseAPIClient:
+    """Get or create enhanced API client"""
+    global api_client, settings
+    if api_client is None:
+        if settings is None:
+            settings = PfSenseSettings.from_env()
+        if settings.auth_method == AuthMethod.API_KEY and not settings.api_key:
+            logger.warning("PFSENSE_API_KEY is not set — API calls will fail with 401")
+
+        api_client = EnhancedPfSenseAPIClient(
+            host=settings.url,
+            auth_method=settings.auth_method,
+            username=settings.username,
+            password=settings.password,
+            api_key=settings.api_key,
+            verify_ssl=settings.verify_ssl,
+            timeout=settings.timeout,
+            version=settings.version,
+            enable_hateoas=settings.enable_hateoas,
+            pool_size=settings.pool_size,
+            http2=settings.http2,
+            cache_ttl=settings.cache_ttl,
+        )
+        logger.info(
+            "API client initialized for pfSense %s at %s",
+            settings.version.value, settings.url,
         )
-        logger.info(f"API client initialized for pfSense {version.value} at {pfsense_url}")
     return api_client
@@ -1,6 +1,5 @@
 """Alias tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from mcp.types import ToolAnnotations
@@ -10,6 +9,9 @@ from ..helpers import (
     VALID_ALIAS_TYPES,
     create_default_sort,
     create_pagination,
+    dedupe_alias_entries,
+    filter_by_search_term,
+    utc_now_iso,
     validate_alias_addresses,
     validate_alias_name,
 )
@@ -59,12 +61,7 @@ async def search_aliases(
 
         # Client-side filtering: search_term matches name or description
         if search_term:
-            term_lower = search_term.lower()
-            alias_list = [
-                a for a in alias_list
-                if term_lower in a.get("name", "").lower()
-                or term_lower in a.get("descr", "").lower()
-            ]
+            alias_list = filter_by_search_term(alias_list, search_term, ("name", "descr"))
 
         return {
             "success": True,
@@ -78,10 +75,10 @@ async def search_aliases(
             "count": len(alias_list),
             "aliases": alias_list,
             "links": client.extract_links(aliases),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to search aliases: {e}")
+        logger.error("Failed to search aliases: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -98,6 +95,7 @@ async def manage_alias_addresses(
         action: Action to perform ('add' or 'remove')
         addresses: List of addresses to add or remove
     """
+    addresses, _ = dedupe_alias_entries(addresses)
     client = get_api_client()
     try:
         if action.lower() == "add":
@@ -117,10 +115,10 @@ async def manage_alias_addresses(
             "addresses": addresses,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to manage alias addresses: {e}")
+        logger.error("Failed to manage alias addresses: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -160,6 +158,7 @@ async def create_alias(
     addr_error = validate_alias_addresses(alias_type, addresses)
     if addr_error:
         return {"success": False, "error": addr_error}
+    addresses, details = dedupe_alias_entries(addresses, details)
 
     client = get_api_client()
     try:
@@ -184,13 +183,22 @@ async def create_alias(
             "alias": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to create alias: {e}")
+        logger.error("Failed to create alias: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_ALIAS_FIELDS = {
+    "name": "name",
+    "alias_type": "type",
+    "addresses": "address",
+    "description": "descr",
+    "details": "detail",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_alias(
@@ -213,16 +221,10 @@ async def update_alias(
         details: New per-entry descriptions
         apply_immediately: Whether to apply changes immediately
     """
+    if addresses is not None:
+        addresses, details = dedupe_alias_entries(addresses, details)
     client = get_api_client()
     try:
-        field_map = {
-            "name": "name",
-            "alias_type": "type",
-            "addresses": "address",
-            "description": "descr",
-            "details": "detail",
-        }
-
         params = {
             "name": name,
             "alias_type": alias_type,
@@ -234,7 +236,7 @@ async def update_alias(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                updates[field_map[param_name]] = value
+                updates[_UPDATE_ALIAS_FIELDS[param_name]] = value
 
         if not updates:
             return {"success": False, "error": "No fields to update - provide at least one field"}
@@ -250,10 +252,10 @@ async def update_alias(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to update alias: {e}")
+        logger.error("Failed to update alias: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -285,8 +287,8 @@ async def delete_alias(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query aliases before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to delete alias: {e}")
+        logger.error("Failed to delete alias: %s", e)
         return {"success": False, "error": str(e)}
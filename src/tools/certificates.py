@@ -1,6 +1,5 @@
 """Certificate and PKI management tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,12 @@ from mcp.types import ToolAnnotations
 # Certificates
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -51,10 +55,10 @@ async def search_certificates(
             "count": len(result.get("data") or []),
             "certificates": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search certificates: {e}")
+        logger.error("Failed to search certificates: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -137,10 +141,10 @@ async def create_certificate(
             "message": f"Certificate '{descr}' created via method '{method}'",
             "certificate": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create certificate: {e}")
+        logger.error("Failed to create certificate: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -186,10 +190,10 @@ async def update_certificate(
             "fields_updated": [k for k in updates.keys() if k != "id"],
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update certificate: {e}")
+        logger.error("Failed to update certificate: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -221,10 +225,10 @@ async def delete_certificate(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query certificates before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete certificate: {e}")
+        logger.error("Failed to delete certificate: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -277,10 +281,10 @@ async def generate_certificate(
             "message": f"Certificate '{descr}' generated (signed by CA '{caref}')",
             "certificate": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to generate certificate: {e}")
+        logger.error("Failed to generate certificate: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -306,10 +310,10 @@ async def renew_certificate(
             "certificate_id": certificate_id,
             "certificate": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to renew certificate: {e}")
+        logger.error("Failed to renew certificate: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -341,10 +345,10 @@ async def export_certificate_pkcs12(
             "certificate_id": certificate_id,
             "export": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to export certificate as PKCS#12: {e}")
+        logger.error("Failed to export certificate as PKCS#12: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -390,10 +394,10 @@ async def search_certificate_authorities(
             "count": len(result.get("data") or []),
             "certificate_authorities": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search certificate authorities: {e}")
+        logger.error("Failed to search certificate authorities: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -470,10 +474,10 @@ async def create_certificate_authority(
             "message": f"Certificate Authority '{descr}' created via method '{method}'",
             "certificate_authority": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create certificate authority: {e}")
+        logger.error("Failed to create certificate authority: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -519,10 +523,10 @@ async def update_certificate_authority(
             "fields_updated": [k for k in updates.keys() if k != "id"],
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update certificate authority: {e}")
+        logger.error("Failed to update certificate authority: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -554,10 +558,10 @@ async def delete_certificate_authority(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query certificate authorities before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete certificate authority: {e}")
+        logger.error("Failed to delete certificate authority: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -603,10 +607,10 @@ async def search_crls(
             "count": len(result.get("data") or []),
             "crls": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search CRLs: {e}")
+        logger.error("Failed to search CRLs: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -647,10 +651,10 @@ async def create_crl(
             "message": f"CRL '{descr}' created for CA '{caref}'",
             "crl": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create CRL: {e}")
+        logger.error("Failed to create CRL: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -691,10 +695,10 @@ async def update_crl(
             "fields_updated": list(updates.keys()),
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update CRL: {e}")
+        logger.error("Failed to update CRL: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -726,8 +730,8 @@ async def delete_crl(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query CRLs before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete CRL: {e}")
+        logger.error("Failed to delete CRL: %s", e)
         return {"success": False, "error": str(e)}
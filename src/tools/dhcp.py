@@ -1,6 +1,5 @@
 """DHCP tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,10 @@ from ..guardrails import guarded, rate_limited
 from ..helpers import (
     create_default_sort,
     create_pagination,
+    filter_by_search_term,
     normalize_mac_address,
+    rows_to_columns,
+    utc_now_iso,
     validate_ip_address,
 )
 from ..models import ControlParameters, QueryFilter
@@ -43,7 +45,8 @@ async def search_dhcp_leases(
     state: str = "active",
     page: int = 1,
     page_size: int = 20,
-    sort_by: str = "starts"
+    sort_by: str = "starts",
+    columnar: bool = False,
 ) -> Dict:
     """Search DHCP leases with advanced filtering
 
@@ -56,6 +59,7 @@ async def search_dhcp_leases(
         page: Page number for pagination
         page_size: Number of results per page
         sort_by: Field to sort by (starts, ends, hostname, ip, mac)
+        columnar: Return rows as one list per field instead of a list of objects (smaller payload for large pages)
     """
     client = get_api_client()
     try:
@@ -88,13 +92,7 @@ async def search_dhcp_leases(
 
         # Client-side filtering: search_term matches hostname or IP
         if search_term:
-            term_lower = search_term.lower()
-            lease_data = [
-                entry for entry in lease_data
-                if term_lower in entry.get("hostname", "").lower()
-                or term_lower in entry.get("ip", "").lower()
-                or term_lower in entry.get("mac", "").lower()
-            ]
+            lease_data = filter_by_search_term(lease_data, search_term, ("hostname", "ip", "mac"))
 
         return {
             "success": True,
@@ -108,12 +106,12 @@ async def search_dhcp_leases(
                 "state": state
             },
             "count": len(lease_data),
-            "leases": lease_data,
+            "leases": rows_to_columns(lease_data) if columnar else lease_data,
             "links": client.extract_links(leases),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to search DHCP leases: {e}")
+        logger.error("Failed to search DHCP leases: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -174,7 +172,7 @@ async def search_dhcp_static_mappings(
             "count": len(result.get("data") or []),
             "static_mappings": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
         # 404 typically means DHCP is not enabled on the requested interface
@@ -187,9 +185,9 @@ async def search_dhcp_static_mappings(
                 "count": 0,
                 "static_mappings": [],
                 "message": f"No DHCP static mappings found. DHCP may not be enabled on interface '{interface}'.",
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": utc_now_iso()
             }
-        logger.error(f"Failed to search DHCP static mappings: {e}")
+        logger.error("Failed to search DHCP static mappings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -259,13 +257,22 @@ async def create_dhcp_static_mapping(
             "static_mapping": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to create DHCP static mapping: {e}")
+        logger.error("Failed to create DHCP static mapping: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_DHCP_STATIC_MAPPING_FIELDS = {
+    "mac_address": "mac",
+    "ip_address": "ipaddr",
+    "hostname": "hostname",
+    "description": "descr",
+    "interface": "parent_id",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_dhcp_static_mapping(
@@ -290,14 +297,6 @@ async def update_dhcp_static_mapping(
     """
     client = get_api_client()
     try:
-        field_map = {
-            "mac_address": "mac",
-            "ip_address": "ipaddr",
-            "hostname": "hostname",
-            "description": "descr",
-            "interface": "parent_id",
-        }
-
         params = {
             "mac_address": mac_address,
             "ip_address": ip_address,
@@ -309,7 +308,7 @@ async def update_dhcp_static_mapping(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                updates[field_map[param_name]] = value
+                updates[_UPDATE_DHCP_STATIC_MAPPING_FIELDS[param_name]] = value
 
         if not updates:
             return {"success": False, "error": "No fields to update - provide at least one field"}
@@ -329,10 +328,10 @@ async def update_dhcp_static_mapping(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to update DHCP static mapping: {e}")
+        logger.error("Failed to update DHCP static mapping: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -366,10 +365,10 @@ async def delete_dhcp_static_mapping(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query mappings before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to delete DHCP static mapping: {e}")
+        logger.error("Failed to delete DHCP static mapping: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -407,13 +406,25 @@ async def get_dhcp_server_config(
             "count": len(result.get("data") or []),
             "dhcp_servers": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to get DHCP server config: {e}")
+        logger.error("Failed to get DHCP server config: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_DHCP_SERVER_CONFIG_FIELDS = {
+    "range_from": "range_from",
+    "range_to": "range_to",
+    "gateway": "gateway",
+    "domain": "domain",
+    "dns_server": "dnsserver",
+    "default_lease_time": "defaultleasetime",
+    "max_lease_time": "maxleasetime",
+    "enable": "enable",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_dhcp_server_config(
@@ -453,17 +464,6 @@ async def update_dhcp_server_config(
 
     client = get_api_client()
     try:
-        field_map = {
-            "range_from": "range_from",
-            "range_to": "range_to",
-            "gateway": "gateway",
-            "domain": "domain",
-            "dns_server": "dnsserver",
-            "default_lease_time": "defaultleasetime",
-            "max_lease_time": "maxleasetime",
-            "enable": "enable",
-        }
-
         params = {
             "range_from": range_from,
             "range_to": range_to,
@@ -478,7 +478,7 @@ async def update_dhcp_server_config(
         updates = {"id": interface}
         for param_name, value in params.items():
             if value is not None:
-                updates[field_map[param_name]] = value
+                updates[_UPDATE_DHCP_SERVER_CONFIG_FIELDS[param_name]] = value
 
         if len(updates) <= 1:
             return {"success": False, "error": "No fields to update - provide at least one field"}
@@ -494,8 +494,8 @@ async def update_dhcp_server_config(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to update DHCP server config: {e}")
+        logger.error("Failed to update DHCP server config: %s", e)
         return {"success": False, "error": str(e)}
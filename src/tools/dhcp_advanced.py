@@ -1,6 +1,5 @@
 """DHCP advanced features tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,12 @@ from mcp.types import ToolAnnotations
 # DHCP Address Pools
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -55,10 +59,10 @@ async def search_dhcp_address_pools(
             "count": len(pools),
             "address_pools": pools,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search DHCP address pools: {e}")
+        logger.error("Failed to search DHCP address pools: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -102,10 +106,10 @@ async def create_dhcp_address_pool(
             "address_pool": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create DHCP address pool: {e}")
+        logger.error("Failed to create DHCP address pool: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -154,10 +158,10 @@ async def update_dhcp_address_pool(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update DHCP address pool: {e}")
+        logger.error("Failed to update DHCP address pool: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -192,10 +196,10 @@ async def delete_dhcp_address_pool(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query address pools before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete DHCP address pool: {e}")
+        logger.error("Failed to delete DHCP address pool: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -245,10 +249,10 @@ async def search_dhcp_custom_options(
             "count": len(options),
             "custom_options": options,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search DHCP custom options: {e}")
+        logger.error("Failed to search DHCP custom options: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -290,10 +294,10 @@ async def create_dhcp_custom_option(
             "custom_option": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create DHCP custom option: {e}")
+        logger.error("Failed to create DHCP custom option: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -342,10 +346,10 @@ async def update_dhcp_custom_option(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update DHCP custom option: {e}")
+        logger.error("Failed to update DHCP custom option: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -380,10 +384,10 @@ async def delete_dhcp_custom_option(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query custom options before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete DHCP custom option: {e}")
+        logger.error("Failed to delete DHCP custom option: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -407,10 +411,10 @@ async def apply_dhcp_changes() -> Dict:
             "message": "DHCP server changes applied",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to apply DHCP changes: {e}")
+        logger.error("Failed to apply DHCP changes: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -448,8 +452,8 @@ async def update_dhcp_backend(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update DHCP backend: {e}")
+        logger.error("Failed to update DHCP backend: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """Diagnostics tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional, Union
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,12 @@ from mcp.types import ToolAnnotations
 # Ping Diagnostic
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded
-from ..helpers import create_default_sort, create_pagination
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    utc_now_iso,
+)
 from ..server import get_api_client, logger, mcp
 
 
@@ -41,10 +45,10 @@ async def run_ping_diagnostic(
             "message": f"Ping to {host} completed ({count} packets)",
             "ping_result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to run ping diagnostic: {e}")
+        logger.error("Failed to run ping diagnostic: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -74,10 +78,10 @@ async def reboot_system(
             "message": "System reboot initiated",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to reboot system: {e}")
+        logger.error("Failed to reboot system: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -102,10 +106,10 @@ async def halt_system(
             "message": "System halt initiated",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to halt system: {e}")
+        logger.error("Failed to halt system: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -147,10 +151,10 @@ async def get_config_history(
             "count": len(revisions),
             "revisions": revisions,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get config history: {e}")
+        logger.error("Failed to get config history: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -175,10 +179,10 @@ async def get_config_revision(
             "revision_id": revision_id,
             "revision": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get config revision: {e}")
+        logger.error("Failed to get config revision: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -207,10 +211,10 @@ async def delete_config_revision(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query config history before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete config revision: {e}")
+        logger.error("Failed to delete config revision: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -248,11 +252,7 @@ async def search_pf_tables(
         tables = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            tables = [
-                t for t in tables
-                if term_lower in t.get("name", "").lower()
-            ]
+            tables = filter_by_search_term(tables, search_term, ("name",))
 
         return {
             "success": True,
@@ -262,10 +262,10 @@ async def search_pf_tables(
             "count": len(tables),
             "pf_tables": tables,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search pf tables: {e}")
+        logger.error("Failed to search pf tables: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -290,10 +290,10 @@ async def get_pf_table(
             "table_name": name,
             "table": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get pf table '{name}': {e}")
+        logger.error("Failed to get pf table '%s': %s", name, e)
         return {"success": False, "error": str(e)}
 
 
@@ -344,10 +344,10 @@ async def restore_config_backup(
             "revision_time": rev_data.get("time", "unknown"),
             "revision_description": rev_data.get("description", ""),
             "warning": "The running configuration has been replaced. All services will reload.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to restore config revision {revision_id}: {e}")
+        logger.error("Failed to restore config revision %s: %s", revision_id, e)
         return {"success": False, "error": str(e)}
 
 
@@ -394,8 +394,8 @@ async def compare_config_revisions(
                 "description": after_data.get("description", "") if after_data else "running config",
             },
             "note": "Use get_config_revision() on each ID to inspect full config XML.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to compare config revisions: {e}")
+        logger.error("Failed to compare config revisions: %s", e)
         return {"success": False, "error": str(e)}
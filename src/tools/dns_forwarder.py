@@ -1,6 +1,5 @@
 """DNS Forwarder (dnsmasq) tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # Settings
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -25,10 +30,10 @@ async def get_dns_forwarder_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get DNS forwarder settings: {e}")
+        logger.error("Failed to get DNS forwarder settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -66,14 +71,7 @@ async def search_dns_forwarder_host_overrides(
         overrides = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            overrides = [
-                o for o in overrides
-                if term_lower in o.get("host", "").lower()
-                or term_lower in o.get("domain", "").lower()
-                or term_lower in o.get("ip", "").lower()
-                or term_lower in o.get("descr", "").lower()
-            ]
+            overrides = filter_by_search_term(overrides, search_term, ("host", "domain", "ip", "descr"))
 
         return {
             "success": True,
@@ -83,10 +81,10 @@ async def search_dns_forwarder_host_overrides(
             "count": len(overrides),
             "host_overrides": overrides,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search DNS forwarder host overrides: {e}")
+        logger.error("Failed to search DNS forwarder host overrides: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -130,10 +128,10 @@ async def create_dns_forwarder_host_override(
             "host_override": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create DNS forwarder host override: {e}")
+        logger.error("Failed to create DNS forwarder host override: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -186,10 +184,10 @@ async def update_dns_forwarder_host_override(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update DNS forwarder host override: {e}")
+        logger.error("Failed to update DNS forwarder host override: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -224,10 +222,10 @@ async def delete_dns_forwarder_host_override(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query host overrides before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete DNS forwarder host override: {e}")
+        logger.error("Failed to delete DNS forwarder host override: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -274,10 +272,10 @@ async def search_dns_forwarder_host_override_aliases(
             "count": len(aliases),
             "aliases": aliases,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search DNS forwarder host override aliases: {e}")
+        logger.error("Failed to search DNS forwarder host override aliases: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -333,7 +331,7 @@ async def manage_dns_forwarder_host_override_alias(
                 "alias": result.get("data", result),
                 "applied": apply_immediately,
                 "links": client.extract_links(result),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         elif action_lower == "delete":
@@ -364,7 +362,7 @@ async def manage_dns_forwarder_host_override_alias(
                 "result": result.get("data", result),
                 "links": client.extract_links(result),
                 "note": "Object IDs have shifted after deletion. Re-query aliases before performing further operations by ID.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         else:
@@ -374,7 +372,7 @@ async def manage_dns_forwarder_host_override_alias(
             }
 
     except Exception as e:
-        logger.error(f"Failed to manage DNS forwarder host override alias: {e}")
+        logger.error("Failed to manage DNS forwarder host override alias: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -398,8 +396,8 @@ async def apply_dns_forwarder_changes() -> Dict:
             "message": "DNS Forwarder changes applied",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to apply DNS forwarder changes: {e}")
+        logger.error("Failed to apply DNS forwarder changes: %s", e)
         return {"success": False, "error": str(e)}
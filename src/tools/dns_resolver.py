@@ -1,6 +1,5 @@
 """DNS Resolver (Unbound) tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from mcp.types import ToolAnnotations
@@ -10,7 +9,9 @@ from ..guardrails import guarded, rate_limited
 from ..helpers import (
     create_default_sort,
     create_pagination,
+    filter_by_search_term,
     sanitize_description,
+    utc_now_iso,
     validate_fqdn,
 )
 from ..models import ControlParameters, QueryFilter
@@ -45,13 +46,23 @@ async def get_dns_resolver_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get DNS Resolver settings: {e}")
+        logger.error("Failed to get DNS Resolver settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_DNS_RESOLVER_SETTINGS_FIELDS = {
+    "enable": "enable",
+    "dnssec": "dnssec",
+    "forwarding": "forwarding",
+    "register_dhcp": "register_dhcp",
+    "register_dhcp_static": "register_dhcp_static",
+    "custom_options": "custom_options",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_dns_resolver_settings(
@@ -76,15 +87,6 @@ async def update_dns_resolver_settings(
     """
     client = get_api_client()
     try:
-        field_map = {
-            "enable": "enable",
-            "dnssec": "dnssec",
-            "forwarding": "forwarding",
-            "register_dhcp": "register_dhcp",
-            "register_dhcp_static": "register_dhcp_static",
-            "custom_options": "custom_options",
-        }
-
         params = {
             "enable": enable,
             "dnssec": dnssec,
@@ -97,7 +99,7 @@ async def update_dns_resolver_settings(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                updates[field_map[param_name]] = value
+                updates[_UPDATE_DNS_RESOLVER_SETTINGS_FIELDS[param_name]] = value
 
         if not updates:
             return {"success": False, "error": "No fields to update - provide at least one field"}
@@ -112,10 +114,10 @@ async def update_dns_resolver_settings(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update DNS Resolver settings: {e}")
+        logger.error("Failed to update DNS Resolver settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -165,13 +167,7 @@ async def search_dns_host_overrides(
 
         # Client-side filtering for general search term
         if search_term:
-            term_lower = search_term.lower()
-            overrides = [
-                o for o in overrides
-                if term_lower in o.get("host", "").lower()
-                or term_lower in o.get("domain", "").lower()
-                or term_lower in o.get("descr", "").lower()
-            ]
+            overrides = filter_by_search_term(overrides, search_term, ("host", "domain", "descr"))
 
         return {
             "success": True,
@@ -185,10 +181,10 @@ async def search_dns_host_overrides(
             "count": len(overrides),
             "host_overrides": overrides,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search DNS host overrides: {e}")
+        logger.error("Failed to search DNS host overrides: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -235,13 +231,22 @@ async def create_dns_host_override(
             "host_override": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create DNS host override: {e}")
+        logger.error("Failed to create DNS host override: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_DNS_HOST_OVERRIDE_FIELDS = {
+    "host": "host",
+    "domain": "domain",
+    "ip": "ip",
+    "descr": "descr",
+    "aliases": "aliases",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_dns_host_override(
@@ -266,14 +271,6 @@ async def update_dns_host_override(
     """
     client = get_api_client()
     try:
-        field_map = {
-            "host": "host",
-            "domain": "domain",
-            "ip": "ip",
-            "descr": "descr",
-            "aliases": "aliases",
-        }
-
         params = {
             "host": host,
             "domain": domain,
@@ -285,7 +282,7 @@ async def update_dns_host_override(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                updates[field_map[param_name]] = value
+                updates[_UPDATE_DNS_HOST_OVERRIDE_FIELDS[param_name]] = value
 
         if not updates:
             return {"success": False, "error": "No fields to update - provide at least one field"}
@@ -304,10 +301,10 @@ async def update_dns_host_override(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update DNS host override: {e}")
+        logger.error("Failed to update DNS host override: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -340,10 +337,10 @@ async def delete_dns_host_override(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query host overrides before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete DNS host override: {e}")
+        logger.error("Failed to delete DNS host override: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -387,10 +384,10 @@ async def search_dns_host_override_aliases(
             "count": len(result.get("data") or []),
             "aliases": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search DNS host override aliases: {e}")
+        logger.error("Failed to search DNS host override aliases: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -451,10 +448,10 @@ async def search_dns_domain_overrides(
             "count": len(result.get("data") or []),
             "domain_overrides": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search DNS domain overrides: {e}")
+        logger.error("Failed to search DNS domain overrides: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -503,13 +500,21 @@ async def create_dns_domain_override(
             "domain_override": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create DNS domain override: {e}")
+        logger.error("Failed to create DNS domain override: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_DNS_DOMAIN_OVERRIDE_FIELDS = {
+    "domain": "domain",
+    "ip": "ip",
+    "descr": "descr",
+    "forward_tls_upstream": "forward_tls_upstream",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_dns_domain_override(
@@ -532,13 +537,6 @@ async def update_dns_domain_override(
     """
     client = get_api_client()
     try:
-        field_map = {
-            "domain": "domain",
-            "ip": "ip",
-            "descr": "descr",
-            "forward_tls_upstream": "forward_tls_upstream",
-        }
-
         params = {
             "domain": domain,
             "ip": ip,
@@ -549,7 +547,7 @@ async def update_dns_domain_override(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                updates[field_map[param_name]] = value
+                updates[_UPDATE_DNS_DOMAIN_OVERRIDE_FIELDS[param_name]] = value
 
         if not updates:
             return {"success": False, "error": "No fields to update - provide at least one field"}
@@ -574,10 +572,10 @@ async def update_dns_domain_override(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update DNS domain override: {e}")
+        logger.error("Failed to update DNS domain override: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -610,10 +608,10 @@ async def delete_dns_domain_override(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query domain overrides before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete DNS domain override: {e}")
+        logger.error("Failed to delete DNS domain override: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -651,10 +649,10 @@ async def search_dns_access_lists(
             "count": len(result.get("data") or []),
             "access_lists": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search DNS access lists: {e}")
+        logger.error("Failed to search DNS access lists: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -706,10 +704,10 @@ async def create_dns_access_list(
             "access_list": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create DNS access list: {e}")
+        logger.error("Failed to create DNS access list: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -732,10 +730,10 @@ async def apply_dns_resolver_changes() -> Dict:
             "message": "DNS Resolver changes applied",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to apply DNS Resolver changes: {e}")
+        logger.error("Failed to apply DNS Resolver changes: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -783,10 +781,10 @@ async def update_dns_access_list(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update DNS access list: {e}")
+        logger.error("Failed to update DNS access list: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -821,8 +819,8 @@ async def delete_dns_access_list(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query access lists before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete DNS access list: {e}")
+        logger.error("Failed to delete DNS access list: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """Firewall tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional, Union
 
 from mcp.types import ToolAnnotations
@@ -12,14 +11,40 @@ from ..helpers import (
     create_interface_filter,
     create_pagination,
     create_port_filter,
+    rows_to_columns,
     safe_data_dict,
     sanitize_description,
+    utc_now_iso,
     validate_ip_address,
     validate_port_value,
 )
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
+_RULE_TYPES = frozenset({"pass", "block", "reject"})
+
+
+def _invalid_rule_type(rule_type: str) -> str:
+    return f"Invalid rule_type '{rule_type}'. Must be: pass, block, reject"
+
+
+async def _apply_or_warn(client, change: str) -> Optional[str]:
+    """Apply pending firewall changes, returning a warning instead of raising.
+
+    By the time this runs the change itself is committed, so an apply error
+    must not be reported as a failed change: retrying it would repeat the
+    change (or, after a delete, hit whichever rule now has that ID).
+    """
+    try:
+        await client.apply_firewall_changes()
+        return None
+    except Exception as e:
+        logger.error("Failed to apply firewall changes: %s", e)
+        return (
+            f"{change} but NOT applied to the running firewall. Do not retry the change; "
+            f"call apply_firewall_changes() to activate it. Apply error: {e}"
+        )
+
 
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True, destructiveHint=False))
 async def search_firewall_rules(
@@ -31,7 +56,8 @@ async def search_firewall_rules(
     search_description: Optional[str] = None,
     page: int = 1,
     page_size: int = 20,
-    sort_by: str = "tracker"
+    sort_by: str = "tracker",
+    columnar: bool = False,
 ) -> Dict:
     """Search firewall rules with advanced filtering and pagination.
 
@@ -45,6 +71,7 @@ async def search_firewall_rules(
         page: Page number for pagination
         page_size: Number of results per page (max 200)
         sort_by: Field to sort by (tracker, interface, type, descr, etc.)
+        columnar: Return rows as one list per field instead of a list of objects (smaller payload for large pages)
     """
     client = get_api_client()
     try:
@@ -76,6 +103,7 @@ async def search_firewall_rules(
             sort=sort,
             pagination=pagination
         )
+        rows = rules.get("data") or []
 
         return {
             "success": True,
@@ -89,13 +117,13 @@ async def search_firewall_rules(
                 "disabled": disabled,
                 "search_description": search_description,
             },
-            "count": len(rules.get("data") or []),
-            "rules": rules.get("data") or [],
+            "count": len(rows),
+            "rules": rows_to_columns(rows) if columnar else rows,
             "links": client.extract_links(rules),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to search firewall rules: {e}")
+        logger.error("Failed to search firewall rules: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -126,10 +154,10 @@ async def find_blocked_rules(
             "count": len(rules.get("data") or []),
             "blocked_rules": rules.get("data") or [],
             "links": client.extract_links(rules),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to find blocked rules: {e}")
+        logger.error("Failed to find blocked rules: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -174,8 +202,8 @@ async def create_firewall_rule_advanced(
     client = get_api_client()
 
     # Validate rule_type
-    if rule_type not in ("pass", "block", "reject"):
-        return {"success": False, "error": f"Invalid rule_type '{rule_type}'. Must be: pass, block, reject"}
+    if rule_type not in _RULE_TYPES:
+        return {"success": False, "error": _invalid_rule_type(rule_type)}
 
     # Validate protocol
     if protocol.lower() not in ("tcp", "udp", "tcp/udp", "icmp", "any"):
@@ -198,7 +226,7 @@ async def create_firewall_rule_advanced(
         "ipprotocol": ipprotocol,
         "source": source,
         "destination": destination,
-        "descr": sanitize_description(description) if description else f"Created via MCP at {datetime.now(timezone.utc).isoformat()}",
+        "descr": sanitize_description(description) if description else f"Created via MCP at {utc_now_iso()}",
         "log": log_matches,
         "statetype": "keep state",  # Required for pf filter compiler
         "disabled": disabled,
@@ -260,21 +288,26 @@ async def create_firewall_rule_advanced(
                         }
             else:
                 logger.warning("Rule created but ID not returned — cannot move to position %d", position)
-            # Apply after create+move (create was deferred above when position is set)
-            if apply_immediately:
-                await client.apply_firewall_changes()
 
-        return {
+        # Apply after create+move (create was deferred above when position is set)
+        warning = None
+        if position is not None and apply_immediately:
+            warning = await _apply_or_warn(client, "Firewall rule was created")
+
+        response = {
             "success": True,
             "message": "Firewall rule created with advanced options",
             "rule": result.get("data", result),
-            "applied_immediately": apply_immediately,
+            "applied_immediately": apply_immediately and warning is None,
             "position": position,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
+        if warning:
+            response["warning"] = warning
+        return response
     except Exception as e:
-        logger.error(f"Failed to create advanced firewall rule: {e}")
+        logger.error("Failed to create advanced firewall rule: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -310,13 +343,28 @@ async def move_firewall_rule(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to move firewall rule: {e}")
+        logger.error("Failed to move firewall rule: %s", e)
         return {"success": False, "error": str(e)}
 
 
+# Map Python parameter names to pfSense API field names
+_UPDATE_FIREWALL_RULE_FIELDS = {
+    "rule_type": "type",
+    "interface": "interface",
+    "protocol": "protocol",
+    "source": "source",
+    "destination": "destination",
+    "source_port": "source_port",
+    "destination_port": "destination_port",
+    "description": "descr",
+    "disabled": "disabled",
+    "log_matches": "log",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_firewall_rule(
@@ -353,32 +401,20 @@ async def update_firewall_rule(
     """
     client = get_api_client()
     try:
-        # Stale-ID guard: verify the rule still matches before updating
-        if verify_descr is not None:
-            id_err = await client.verify_object_id("/firewall/rules", rule_id, "descr", verify_descr)
-            if id_err:
-                return {"success": False, "error": id_err}
-
-        # Validate port formats before sending to API
+        # Validate locally first so bad input never costs a round trip
+        if rule_type is not None and rule_type not in _RULE_TYPES:
+            return {"success": False, "error": _invalid_rule_type(rule_type)}
         for port_param, port_val in [("source_port", source_port), ("destination_port", destination_port)]:
             if port_val:
                 port_error = validate_port_value(port_val, port_param)
                 if port_error:
                     return {"success": False, "error": port_error}
 
-        # Map Python parameter names to pfSense API field names
-        field_map = {
-            "rule_type": "type",
-            "interface": "interface",
-            "protocol": "protocol",
-            "source": "source",
-            "destination": "destination",
-            "source_port": "source_port",
-            "destination_port": "destination_port",
-            "description": "descr",
-            "disabled": "disabled",
-            "log_matches": "log",
-        }
+        # Stale-ID guard: verify the rule still matches before updating
+        if verify_descr is not None:
+            id_err = await client.verify_object_id("/firewall/rules", rule_id, "descr", verify_descr)
+            if id_err:
+                return {"success": False, "error": id_err}
 
         params = {
             "rule_type": rule_type,
@@ -396,7 +432,7 @@ async def update_firewall_rule(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                api_field = field_map[param_name]
+                api_field = _UPDATE_FIREWALL_RULE_FIELDS[param_name]
                 if param_name == "interface":
                     updates[api_field] = [value] if isinstance(value, str) else value
                 elif param_name == "protocol" and isinstance(value, str) and value.lower() == "any":
@@ -418,10 +454,10 @@ async def update_firewall_rule(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to update firewall rule: {e}")
+        logger.error("Failed to update firewall rule: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -460,10 +496,10 @@ async def delete_firewall_rule(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query rules before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to delete firewall rule: {e}")
+        logger.error("Failed to delete firewall rule: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -495,37 +531,50 @@ async def bulk_block_ips(
     client = get_api_client()
     results = []
     errors = []
+    duplicates = 0
+    seen = set()
+    pending = []
+
+    # Shared by every rule in the batch
+    base_rule = {
+        "interface": [interface] if isinstance(interface, str) else interface,
+        "type": "block",
+        "ipprotocol": "inet",
+        "protocol": None,  # null = any protocol
+        "destination": "any",
+        "log": True,
+        "statetype": "keep state",
+    }
 
     for ip in ip_addresses:
         # Validate IP/network before making API call
         try:
-            validate_ip_address(ip)
+            ip = validate_ip_address(ip)
         except ValueError:
-            logger.error(f"Invalid IP address/network: {ip}")
+            logger.error("Invalid IP address/network: %s", ip)
             errors.append({"ip": ip, "error": f"Invalid IP address or network: {ip}"})
             continue
 
-        try:
-            rule_data = {
-                "interface": [interface] if isinstance(interface, str) else interface,
-                "type": "block",
-                "ipprotocol": "inet",
-                "protocol": None,  # null = any protocol
-                "source": ip,
-                "destination": "any",
-                "descr": f"{description_prefix}: {ip}",
-                "log": True,
-                "statetype": "keep state",
-            }
-
-            # Don't apply immediately for bulk operations
-            control = ControlParameters(apply=False)
-            result = await client.create_firewall_rule(rule_data, control)
-            results.append({"ip": ip, "success": True, "rule_id": safe_data_dict(result).get("id")})
-
-        except Exception as e:
-            logger.error(f"Failed to block IP {ip}: {e}")
-            errors.append({"ip": ip, "error": str(e)})
+        # Repeated addresses would only create identical rules (one round-trip each)
+        if ip in seen:
+            duplicates += 1
+            continue
+        seen.add(ip)
+        pending.append(ip)
+
+    # Rules are created without applying; a single apply below activates
+    # the whole batch (and reports a pending batch if it fails)
+    outcomes = await client.create_firewall_rules(
+        [{**base_rule, "source": ip, "descr": f"{description_prefix}: {ip}"} for ip in pending],
+        apply_immediately=False,
+    )
+    for ip, outcome in zip(pending, outcomes):
+        if outcome["success"]:
+            rule_id = safe_data_dict(outcome["response"]).get("id")
+            results.append({"ip": ip, "success": True, "rule_id": rule_id})
+        else:
+            logger.error("Failed to block IP %s: %s", ip, outcome["error"])
+            errors.append({"ip": ip, "error": outcome["error"]})
 
     # Apply all changes at once
     warning = None
@@ -541,7 +590,7 @@ async def bulk_block_ips(
                 f"Call apply_firewall_changes() to activate them, or delete them to undo. "
                 f"Pending rule IDs: {pending_ids}. Apply error: {e}"
             )
-            logger.error(f"Failed to apply bulk changes: {e}")
+            logger.error("Failed to apply bulk changes: %s", e)
     else:
         applied = False
 
@@ -550,10 +599,11 @@ async def bulk_block_ips(
         "total_requested": len(ip_addresses),
         "successful": len(results),
         "failed": len(errors),
+        "duplicates_skipped": duplicates,
         "applied": applied,
         "results": results,
         "errors": errors,
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": utc_now_iso()
     }
     if warning:
         response["warning"] = warning
@@ -567,6 +617,8 @@ async def apply_firewall_changes() -> Dict:
     Use this after any firewall config change to ensure the compiled ruleset
     (/tmp/rules.debug) matches the configuration. The apply_immediately
     parameter on other tools doesn't always trigger full recompilation.
+    To batch several rule changes, pass apply_immediately=False to each and
+    call this once at the end.
     """
     client = get_api_client()
     try:
@@ -576,10 +628,10 @@ async def apply_firewall_changes() -> Dict:
             "success": True,
             "message": "Firewall changes applied and filter ruleset recompiled",
             "result": result.get("data", result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to apply firewall changes: {e}")
+        logger.error("Failed to apply firewall changes: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -597,8 +649,8 @@ async def get_pf_rules() -> Dict:
         return {
             "success": True,
             "compiled_rules": result.get("data", result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to read compiled rules: {e}")
+        logger.error("Failed to read compiled rules: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """Firewall schedule tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # Firewall Schedules
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -43,13 +48,7 @@ async def search_firewall_schedules(
         schedules = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            schedules = [
-                s for s in schedules
-                if term_lower in s.get("name", "").lower()
-                or term_lower in s.get("descr", "").lower()
-                or term_lower in s.get("schedlabel", "").lower()
-            ]
+            schedules = filter_by_search_term(schedules, search_term, ("name", "descr", "schedlabel"))
 
         return {
             "success": True,
@@ -59,10 +58,10 @@ async def search_firewall_schedules(
             "count": len(schedules),
             "schedules": schedules,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search firewall schedules: {e}")
+        logger.error("Failed to search firewall schedules: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -102,10 +101,10 @@ async def create_firewall_schedule(
             "schedule": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create firewall schedule: {e}")
+        logger.error("Failed to create firewall schedule: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -152,10 +151,10 @@ async def update_firewall_schedule(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update firewall schedule: {e}")
+        logger.error("Failed to update firewall schedule: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -188,10 +187,10 @@ async def delete_firewall_schedule(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query firewall schedules before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete firewall schedule: {e}")
+        logger.error("Failed to delete firewall schedule: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -234,11 +233,7 @@ async def search_schedule_time_ranges(
         time_ranges = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            time_ranges = [
-                tr for tr in time_ranges
-                if term_lower in tr.get("rangedescr", "").lower()
-            ]
+            time_ranges = filter_by_search_term(time_ranges, search_term, ("rangedescr",))
 
         return {
             "success": True,
@@ -252,10 +247,10 @@ async def search_schedule_time_ranges(
             "count": len(time_ranges),
             "time_ranges": time_ranges,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search schedule time ranges: {e}")
+        logger.error("Failed to search schedule time ranges: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -307,13 +302,23 @@ async def create_schedule_time_range(
             "time_range": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create schedule time range: {e}")
+        logger.error("Failed to create schedule time range: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_SCHEDULE_TIME_RANGE_FIELDS = {
+    "parent_id": "parent_id",
+    "month": "month",
+    "day": "day",
+    "hour": "hour",
+    "rangedescr": "rangedescr",
+    "position": "position",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_schedule_time_range(
@@ -340,15 +345,6 @@ async def update_schedule_time_range(
     """
     client = get_api_client()
     try:
-        field_map = {
-            "parent_id": "parent_id",
-            "month": "month",
-            "day": "day",
-            "hour": "hour",
-            "rangedescr": "rangedescr",
-            "position": "position",
-        }
-
         params = {
             "parent_id": parent_id,
             "month": month,
@@ -361,7 +357,7 @@ async def update_schedule_time_range(
         updates: Dict = {}
         for param_name, value in params.items():
             if value is not None:
-                api_field = field_map[param_name]
+                api_field = _UPDATE_SCHEDULE_TIME_RANGE_FIELDS[param_name]
                 if api_field == "rangedescr" and isinstance(value, str):
                     updates[api_field] = sanitize_description(value)
                 else:
@@ -381,10 +377,10 @@ async def update_schedule_time_range(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update schedule time range: {e}")
+        logger.error("Failed to update schedule time range: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -417,8 +413,8 @@ async def delete_schedule_time_range(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query schedule time ranges before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete schedule time range: {e}")
+        logger.error("Failed to delete schedule time range: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """Firewall state tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,12 @@ from mcp.types import ToolAnnotations
 # Firewall States
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded
-from ..helpers import create_default_sort, create_pagination
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    utc_now_iso,
+)
 from ..models import ControlParameters
 from ..server import get_api_client, logger, mcp
 
@@ -43,14 +47,7 @@ async def search_firewall_states(
         states = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            states = [
-                s for s in states
-                if term_lower in str(s.get("source", "")).lower()
-                or term_lower in str(s.get("destination", "")).lower()
-                or term_lower in str(s.get("protocol", "")).lower()
-                or term_lower in str(s.get("interface", "")).lower()
-            ]
+            states = filter_by_search_term(states, search_term, ("source", "destination", "protocol", "interface"))
 
         return {
             "success": True,
@@ -60,10 +57,10 @@ async def search_firewall_states(
             "count": len(states),
             "states": states,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search firewall states: {e}")
+        logger.error("Failed to search firewall states: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -95,10 +92,10 @@ async def delete_firewall_state(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query firewall states before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete firewall state: {e}")
+        logger.error("Failed to delete firewall state: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -121,10 +118,10 @@ async def get_firewall_state_size() -> Dict:
             "success": True,
             "state_size": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get firewall state size: {e}")
+        logger.error("Failed to get firewall state size: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -148,8 +145,8 @@ async def get_firewall_advanced_settings() -> Dict:
             "success": True,
             "advanced_settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get firewall advanced settings: {e}")
+        logger.error("Failed to get firewall advanced settings: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """Interface tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional, Union
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # Interface Configuration
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters
 from ..server import get_api_client, logger, mcp
 
@@ -43,13 +48,7 @@ async def search_interface_configs(
         interfaces = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            interfaces = [
-                i for i in interfaces
-                if term_lower in i.get("descr", "").lower()
-                or term_lower in i.get("if", "").lower()
-                or term_lower in i.get("ipaddr", "").lower()
-            ]
+            interfaces = filter_by_search_term(interfaces, search_term, ("descr", "if", "ipaddr"))
 
         return {
             "success": True,
@@ -59,10 +58,10 @@ async def search_interface_configs(
             "count": len(interfaces),
             "interfaces": interfaces,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search interface configs: {e}")
+        logger.error("Failed to search interface configs: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -125,10 +124,10 @@ async def create_interface(
             "interface": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create interface: {e}")
+        logger.error("Failed to create interface: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -198,10 +197,10 @@ async def update_interface(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update interface: {e}")
+        logger.error("Failed to update interface: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -234,10 +233,10 @@ async def delete_interface(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query interfaces before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete interface: {e}")
+        logger.error("Failed to delete interface: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -256,10 +255,10 @@ async def apply_interface_changes() -> Dict:
             "message": "Interface changes applied",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to apply interface changes: {e}")
+        logger.error("Failed to apply interface changes: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -297,13 +296,7 @@ async def search_vlans(
         vlans = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            vlans = [
-                v for v in vlans
-                if term_lower in str(v.get("tag", "")).lower()
-                or term_lower in v.get("if", "").lower()
-                or term_lower in v.get("descr", "").lower()
-            ]
+            vlans = filter_by_search_term(vlans, search_term, ("tag", "if", "descr"))
 
         return {
             "success": True,
@@ -313,10 +306,10 @@ async def search_vlans(
             "count": len(vlans),
             "vlans": vlans,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search VLANs: {e}")
+        logger.error("Failed to search VLANs: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -365,10 +358,10 @@ async def create_vlan(
             "vlan": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create VLAN: {e}")
+        logger.error("Failed to create VLAN: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -425,10 +418,10 @@ async def update_vlan(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update VLAN: {e}")
+        logger.error("Failed to update VLAN: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -461,10 +454,10 @@ async def delete_vlan(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query VLANs before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete VLAN: {e}")
+        logger.error("Failed to delete VLAN: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -502,13 +495,7 @@ async def search_interface_bridges(
         bridges = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            bridges = [
-                b for b in bridges
-                if term_lower in b.get("bridgeif", "").lower()
-                or term_lower in b.get("descr", "").lower()
-                or term_lower in str(b.get("members", "")).lower()
-            ]
+            bridges = filter_by_search_term(bridges, search_term, ("bridgeif", "descr", "members"))
 
         return {
             "success": True,
@@ -518,10 +505,10 @@ async def search_interface_bridges(
             "count": len(bridges),
             "bridges": bridges,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search interface bridges: {e}")
+        logger.error("Failed to search interface bridges: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -560,10 +547,10 @@ async def create_interface_bridge(
             "bridge": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create interface bridge: {e}")
+        logger.error("Failed to create interface bridge: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -601,13 +588,7 @@ async def search_interface_groups(
         groups = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            groups = [
-                g for g in groups
-                if term_lower in g.get("ifname", "").lower()
-                or term_lower in g.get("descr", "").lower()
-                or term_lower in str(g.get("members", "")).lower()
-            ]
+            groups = filter_by_search_term(groups, search_term, ("ifname", "descr", "members"))
 
         return {
             "success": True,
@@ -617,10 +598,10 @@ async def search_interface_groups(
             "count": len(groups),
             "interface_groups": groups,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search interface groups: {e}")
+        logger.error("Failed to search interface groups: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -659,10 +640,10 @@ async def create_interface_group(
             "interface_group": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create interface group: {e}")
+        logger.error("Failed to create interface group: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -682,8 +663,8 @@ async def get_available_interfaces() -> Dict:
             "success": True,
             "available_interfaces": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get available interfaces: {e}")
+        logger.error("Failed to get available interfaces: %s", e)
         return {"success": False, "error": str(e)}
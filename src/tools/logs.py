@@ -1,12 +1,17 @@
 """Log analysis tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
+from collections import Counter, defaultdict
 from typing import Dict, Optional
 
 import httpx
 from mcp.types import ToolAnnotations
 
-from ..helpers import VALID_LOG_TYPES, parse_filterlog_entry, validate_ip_address
+from ..helpers import (
+    VALID_LOG_TYPES,
+    parse_filterlog_entry,
+    utc_now_iso,
+    validate_ip_address,
+)
 from ..models import QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -105,13 +110,18 @@ async def get_firewall_log(
         # Falls back to substring matching for lines that cannot be parsed.
         entries = logs.get("data") or []
         if entries:
+            # Lower-case the filter values once rather than per entry/field
+            action_lc = action_filter.lower() if action_filter else None
+            interface_lc = interface.lower() if interface else None
+            protocol_lc = protocol.lower() if protocol else None
+
             def _matches(entry):
                 text = entry.get("text", "")
                 parsed = parse_filterlog_entry(text)
                 if parsed:
-                    if action_filter and parsed.get("action", "").lower() != action_filter.lower():
+                    if action_lc and parsed.get("action", "").lower() != action_lc:
                         return False
-                    if interface and parsed.get("interface", "").lower() != interface.lower():
+                    if interface_lc and parsed.get("interface", "").lower() != interface_lc:
                         return False
                     if source_ip and parsed.get("src_ip", "") != source_ip:
                         return False
@@ -119,13 +129,14 @@ async def get_firewall_log(
                         return False
                     if destination_port and parsed.get("dst_port", "") != destination_port:
                         return False
-                    if protocol and parsed.get("protocol", "").lower() != protocol.lower():
+                    if protocol_lc and parsed.get("protocol", "").lower() != protocol_lc:
                         return False
                 else:
                     # Fallback: raw text substring match for non-filterlog lines
-                    if action_filter and action_filter.lower() not in text.lower():
+                    text_lc = text.lower()
+                    if action_lc and action_lc not in text_lc:
                         return False
-                    if interface and interface.lower() not in text.lower():
+                    if interface_lc and interface_lc not in text_lc:
                         return False
                     if source_ip and source_ip not in text:
                         return False
@@ -133,7 +144,7 @@ async def get_firewall_log(
                         return False
                     if destination_port and destination_port not in text:
                         return False
-                    if protocol and protocol.lower() not in text.lower():
+                    if protocol_lc and protocol_lc not in text_lc:
                         return False
                 return True
             entries = [e for e in entries if _matches(e)]
@@ -153,13 +164,13 @@ async def get_firewall_log(
             "count": len(logs.get("data") or []),
             "log_entries": logs.get("data") or [],
             "links": client.extract_links(logs),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
         if _is_oom_error(e):
             logger.error("Log endpoint OOM/timeout: %s", e)
             return _LOG_OOM_ERROR
-        logger.error(f"Failed to get firewall log: {e}")
+        logger.error("Failed to get firewall log: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -196,41 +207,36 @@ async def analyze_blocked_traffic(
             # This correctly extracts src_ip/dst_ip by field position rather
             # than fragile regex ordering, and supports both IPv4 and IPv6.
 
-            source_stats: dict = {}
+            hits: Counter = Counter()
+            destinations: defaultdict = defaultdict(set)
+            samples: Dict[str, str] = {}
             for entry in log_data:
                 text = entry.get("text", "")
                 parsed = parse_filterlog_entry(text)
                 src_ip = parsed.get("src_ip", "unknown") if parsed else "unknown"
                 dst_ip = parsed.get("dst_ip") if parsed else None
 
-                if src_ip not in source_stats:
-                    source_stats[src_ip] = {
-                        "count": 0,
-                        "destinations": set(),
-                        "sample_line": "",
-                    }
-
-                source_stats[src_ip]["count"] += 1
+                hits[src_ip] += 1
                 if dst_ip:
-                    source_stats[src_ip]["destinations"].add(dst_ip)
-                if not source_stats[src_ip]["sample_line"]:
-                    source_stats[src_ip]["sample_line"] = text[:200]
-
-            # Convert sets to lists and add threat score (0-10 heuristic: count/5, capped)
-            for stats in source_stats.values():
-                stats["destinations"] = sorted(stats["destinations"])
-                stats["threat_score"] = round(min(10, stats["count"] / 5), 1)
-
-            sorted_sources = sorted(
-                source_stats.items(),
-                key=lambda x: x[1]["count"],
-                reverse=True
-            )
+                    destinations[src_ip].add(dst_ip)
+                if not samples.get(src_ip):
+                    samples[src_ip] = text[:200]
+
+            # Build the top sources with a threat score (0-10 heuristic: count/5, capped)
+            top_sources = {
+                src_ip: {
+                    "count": count,
+                    "destinations": sorted(destinations.get(src_ip, ())),
+                    "sample_line": samples[src_ip],
+                    "threat_score": round(min(10, count / 5), 1),
+                }
+                for src_ip, count in hits.most_common(20)
+            }
 
             analysis = {
                 "grouped_by": "source_ip",
-                "total_unique_sources": len(source_stats),
-                "top_sources": dict(sorted_sources[:20])
+                "total_unique_sources": len(hits),
+                "top_sources": top_sources
             }
         else:
             analysis = {
@@ -244,16 +250,25 @@ async def analyze_blocked_traffic(
             "total_entries_analyzed": len(log_data),
             "analysis": analysis,
             "links": client.extract_links(logs),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
         if _is_oom_error(e):
             logger.error("Log endpoint OOM/timeout: %s", e)
             return _LOG_OOM_ERROR
-        logger.error(f"Failed to analyze blocked traffic: {e}")
+        logger.error("Failed to analyze blocked traffic: %s", e)
         return {"success": False, "error": str(e)}
 
 
+def _classify_verdict(text: str) -> Optional[str]:
+    """Bucket a lowercased log line as blocked, allowed, or neither."""
+    if "block" in text or "reject" in text:
+        return "blocked"
+    if "pass" in text:
+        return "allowed"
+    return None
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True, destructiveHint=False))
 async def search_logs_by_ip(
     ip_address: str,
@@ -304,18 +319,15 @@ async def search_logs_by_ip(
         # Pattern analysis on raw text lines
         # Firewall log entries are raw text; we search for keywords
         if log_type == "firewall" and log_entries:
+            verdicts = Counter(
+                _classify_verdict(entry.get("text", "").lower())
+                for entry in log_entries
+            )
             patterns = {
                 "total_entries": len(log_entries),
-                "blocked_count": 0,
-                "allowed_count": 0,
+                "blocked_count": verdicts["blocked"],
+                "allowed_count": verdicts["allowed"],
             }
-
-            for entry in log_entries:
-                text = entry.get("text", "").lower()
-                if "block" in text or "reject" in text:
-                    patterns["blocked_count"] += 1
-                elif "pass" in text:
-                    patterns["allowed_count"] += 1
         else:
             patterns = None
 
@@ -327,11 +339,11 @@ async def search_logs_by_ip(
             "patterns": patterns,
             "log_entries": log_entries,
             "links": client.extract_links(logs),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
         if _is_oom_error(e):
             logger.error("Log endpoint OOM/timeout: %s", e)
             return _LOG_OOM_ERROR
-        logger.error(f"Failed to search logs by IP: {e}")
+        logger.error("Failed to search logs by IP: %s", e)
         return {"success": False, "error": str(e)}
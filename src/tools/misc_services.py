@@ -1,6 +1,5 @@
 """Miscellaneous services tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from mcp.types import ToolAnnotations
@@ -12,8 +11,10 @@ from ..guardrails import guarded, rate_limited
 from ..helpers import (
     create_default_sort,
     create_pagination,
+    filter_by_search_term,
     normalize_mac_address,
     sanitize_description,
+    utc_now_iso,
 )
 from ..models import ControlParameters
 from ..server import get_api_client, logger, mcp
@@ -30,10 +31,10 @@ async def get_ntp_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get NTP settings: {e}")
+        logger.error("Failed to get NTP settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -81,10 +82,10 @@ async def update_ntp_settings(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update NTP settings: {e}")
+        logger.error("Failed to update NTP settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -126,10 +127,10 @@ async def search_ntp_time_servers(
             "count": len(servers),
             "time_servers": servers,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search NTP time servers: {e}")
+        logger.error("Failed to search NTP time servers: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -185,7 +186,7 @@ async def manage_ntp_time_server(
                 "time_server": result.get("data", result),
                 "applied": apply_immediately,
                 "links": client.extract_links(result),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         elif action_lower == "delete":
@@ -212,7 +213,7 @@ async def manage_ntp_time_server(
                 "result": result.get("data", result),
                 "links": client.extract_links(result),
                 "note": "Object IDs have shifted after deletion. Re-query time servers before performing further operations by ID.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         else:
@@ -222,7 +223,7 @@ async def manage_ntp_time_server(
             }
 
     except Exception as e:
-        logger.error(f"Failed to manage NTP time server: {e}")
+        logger.error("Failed to manage NTP time server: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -260,12 +261,7 @@ async def search_cron_jobs(
         jobs = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            jobs = [
-                j for j in jobs
-                if term_lower in j.get("command", "").lower()
-                or term_lower in j.get("who", "").lower()
-            ]
+            jobs = filter_by_search_term(jobs, search_term, ("command", "who"))
 
         return {
             "success": True,
@@ -275,10 +271,10 @@ async def search_cron_jobs(
             "count": len(jobs),
             "cron_jobs": jobs,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search cron jobs: {e}")
+        logger.error("Failed to search cron jobs: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -327,10 +323,10 @@ async def create_cron_job(
             "cron_job": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create cron job: {e}")
+        logger.error("Failed to create cron job: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -363,10 +359,10 @@ async def delete_cron_job(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query cron jobs before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete cron job: {e}")
+        logger.error("Failed to delete cron job: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -408,10 +404,10 @@ async def search_service_watchdogs(
             "count": len(watchdogs),
             "service_watchdogs": watchdogs,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search service watchdogs: {e}")
+        logger.error("Failed to search service watchdogs: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -459,7 +455,7 @@ async def manage_service_watchdog(
                 "service_watchdog": result.get("data", result),
                 "applied": apply_immediately,
                 "links": client.extract_links(result),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         elif action_lower == "delete":
@@ -486,7 +482,7 @@ async def manage_service_watchdog(
                 "result": result.get("data", result),
                 "links": client.extract_links(result),
                 "note": "Object IDs have shifted after deletion. Re-query service watchdogs before performing further operations by ID.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         else:
@@ -496,7 +492,7 @@ async def manage_service_watchdog(
             }
 
     except Exception as e:
-        logger.error(f"Failed to manage service watchdog: {e}")
+        logger.error("Failed to manage service watchdog: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -516,10 +512,10 @@ async def get_ssh_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get SSH settings: {e}")
+        logger.error("Failed to get SSH settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -565,10 +561,10 @@ async def update_ssh_settings(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update SSH settings: {e}")
+        logger.error("Failed to update SSH settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -606,10 +602,10 @@ async def send_wake_on_lan(
             "mac": normalized_mac,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except ValueError as e:
         return {"success": False, "error": str(e)}
     except Exception as e:
-        logger.error(f"Failed to send Wake-on-LAN: {e}")
+        logger.error("Failed to send Wake-on-LAN: %s", e)
         return {"success": False, "error": str(e)}
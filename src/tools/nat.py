@@ -1,6 +1,5 @@
 """NAT port forward tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional, Union
 
 from mcp.types import ToolAnnotations
@@ -11,6 +10,7 @@ from ..helpers import (
     create_interface_filter,
     create_pagination,
     sanitize_description,
+    utc_now_iso,
     validate_ip_address,
     validate_port_value,
     validate_protocol,
@@ -78,10 +78,10 @@ async def search_nat_port_forwards(
             "count": len(result.get("data") or []),
             "port_forwards": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to search NAT port forwards: {e}")
+        logger.error("Failed to search NAT port forwards: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -154,7 +154,7 @@ async def create_nat_port_forward(
         if description:
             forward_data["descr"] = sanitize_description(description)
         else:
-            forward_data["descr"] = f"Port forward via MCP at {datetime.now(timezone.utc).isoformat()}"
+            forward_data["descr"] = f"Port forward via MCP at {utc_now_iso()}"
 
         if nat_reflection:
             allowed = ("enable", "disable", "purenat")
@@ -173,10 +173,10 @@ async def create_nat_port_forward(
             "applied": apply_immediately,
             "associated_rule_created": create_associated_rule,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to create NAT port forward: {e}")
+        logger.error("Failed to create NAT port forward: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -208,13 +208,27 @@ async def delete_nat_port_forward(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query port forwards before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to delete NAT port forward: {e}")
+        logger.error("Failed to delete NAT port forward: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_NAT_PORT_FORWARD_FIELDS = {
+    "interface": "interface",
+    "protocol": "protocol",
+    "destination": "destination",
+    "destination_port": "destination_port",
+    "target": "target",
+    "local_port": "local_port",
+    "source": "source",
+    "description": "descr",
+    "disabled": "disabled",
+    "nat_reflection": "natreflection",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_nat_port_forward(
@@ -260,19 +274,6 @@ async def update_nat_port_forward(
         if nat_reflection is not None and nat_reflection not in ("enable", "disable", "purenat"):
             return {"success": False, "error": f"Invalid nat_reflection '{nat_reflection}'. Must be: enable, disable, purenat"}
 
-        field_map = {
-            "interface": "interface",
-            "protocol": "protocol",
-            "destination": "destination",
-            "destination_port": "destination_port",
-            "target": "target",
-            "local_port": "local_port",
-            "source": "source",
-            "description": "descr",
-            "disabled": "disabled",
-            "nat_reflection": "natreflection",
-        }
-
         params = {
             "interface": interface,
             "protocol": protocol,
@@ -289,7 +290,7 @@ async def update_nat_port_forward(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                api_field = field_map[param_name]
+                api_field = _UPDATE_NAT_PORT_FORWARD_FIELDS[param_name]
                 updates[api_field] = value
 
         if not updates:
@@ -307,8 +308,8 @@ async def update_nat_port_forward(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to update NAT port forward: {e}")
+        logger.error("Failed to update NAT port forward: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """NAT 1:1 mapping tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # 1:1 NAT Mappings
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -51,14 +56,7 @@ async def search_nat_onetoone_mappings(
         mappings = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            mappings = [
-                m for m in mappings
-                if term_lower in m.get("descr", "").lower()
-                or term_lower in m.get("source", "").lower()
-                or term_lower in m.get("destination", "").lower()
-                or term_lower in m.get("external", "").lower()
-            ]
+            mappings = filter_by_search_term(mappings, search_term, ("descr", "source", "destination", "external"))
 
         return {
             "success": True,
@@ -71,10 +69,10 @@ async def search_nat_onetoone_mappings(
             "count": len(mappings),
             "onetoone_mappings": mappings,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search 1:1 NAT mappings: {e}")
+        logger.error("Failed to search 1:1 NAT mappings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -127,13 +125,24 @@ async def create_nat_onetoone_mapping(
             "onetoone_mapping": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create 1:1 NAT mapping: {e}")
+        logger.error("Failed to create 1:1 NAT mapping: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_NAT_ONETOONE_MAPPING_FIELDS = {
+    "interface": "interface",
+    "type": "type",
+    "external": "external",
+    "source": "source",
+    "destination": "destination",
+    "descr": "descr",
+    "disabled": "disabled",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_nat_onetoone_mapping(
@@ -162,16 +171,6 @@ async def update_nat_onetoone_mapping(
     """
     client = get_api_client()
     try:
-        field_map = {
-            "interface": "interface",
-            "type": "type",
-            "external": "external",
-            "source": "source",
-            "destination": "destination",
-            "descr": "descr",
-            "disabled": "disabled",
-        }
-
         params = {
             "interface": interface,
             "type": type,
@@ -185,7 +184,7 @@ async def update_nat_onetoone_mapping(
         updates: Dict = {}
         for param_name, value in params.items():
             if value is not None:
-                api_field = field_map[param_name]
+                api_field = _UPDATE_NAT_ONETOONE_MAPPING_FIELDS[param_name]
                 if api_field == "descr" and isinstance(value, str):
                     updates[api_field] = sanitize_description(value)
                 else:
@@ -205,10 +204,10 @@ async def update_nat_onetoone_mapping(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update 1:1 NAT mapping: {e}")
+        logger.error("Failed to update 1:1 NAT mapping: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -241,10 +240,10 @@ async def delete_nat_onetoone_mapping(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query 1:1 NAT mappings before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete 1:1 NAT mapping: {e}")
+        logger.error("Failed to delete 1:1 NAT mapping: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -269,8 +268,8 @@ async def apply_nat_onetoone_changes() -> Dict:
             "message": "1:1 NAT changes applied",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to apply 1:1 NAT changes: {e}")
+        logger.error("Failed to apply 1:1 NAT changes: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """NAT outbound mapping tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # Outbound NAT Mappings
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -51,14 +56,7 @@ async def search_nat_outbound_mappings(
         mappings = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            mappings = [
-                m for m in mappings
-                if term_lower in m.get("descr", "").lower()
-                or term_lower in m.get("source", "").lower()
-                or term_lower in m.get("destination", "").lower()
-                or term_lower in m.get("target", "").lower()
-            ]
+            mappings = filter_by_search_term(mappings, search_term, ("descr", "source", "destination", "target"))
 
         return {
             "success": True,
@@ -71,10 +69,10 @@ async def search_nat_outbound_mappings(
             "count": len(mappings),
             "outbound_mappings": mappings,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search outbound NAT mappings: {e}")
+        logger.error("Failed to search outbound NAT mappings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -148,13 +146,29 @@ async def create_nat_outbound_mapping(
             "outbound_mapping": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create outbound NAT mapping: {e}")
+        logger.error("Failed to create outbound NAT mapping: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_NAT_OUTBOUND_MAPPING_FIELDS = {
+    "interface": "interface",
+    "source": "source",
+    "sourceport": "sourceport",
+    "destination": "destination",
+    "dstport": "dstport",
+    "target": "target",
+    "targetip": "targetip",
+    "targetip_subnet": "targetip_subnet",
+    "poolopts": "poolopts",
+    "protocol": "protocol",
+    "descr": "descr",
+    "disabled": "disabled",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_nat_outbound_mapping(
@@ -193,21 +207,6 @@ async def update_nat_outbound_mapping(
     """
     client = get_api_client()
     try:
-        field_map = {
-            "interface": "interface",
-            "source": "source",
-            "sourceport": "sourceport",
-            "destination": "destination",
-            "dstport": "dstport",
-            "target": "target",
-            "targetip": "targetip",
-            "targetip_subnet": "targetip_subnet",
-            "poolopts": "poolopts",
-            "protocol": "protocol",
-            "descr": "descr",
-            "disabled": "disabled",
-        }
-
         params = {
             "interface": interface,
             "source": source,
@@ -226,7 +225,7 @@ async def update_nat_outbound_mapping(
         updates: Dict = {}
         for param_name, value in params.items():
             if value is not None:
-                api_field = field_map[param_name]
+                api_field = _UPDATE_NAT_OUTBOUND_MAPPING_FIELDS[param_name]
                 if api_field == "descr" and isinstance(value, str):
                     updates[api_field] = sanitize_description(value)
                 else:
@@ -246,10 +245,10 @@ async def update_nat_outbound_mapping(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update outbound NAT mapping: {e}")
+        logger.error("Failed to update outbound NAT mapping: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -282,10 +281,10 @@ async def delete_nat_outbound_mapping(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query outbound NAT mappings before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete outbound NAT mapping: {e}")
+        logger.error("Failed to delete outbound NAT mapping: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -305,10 +304,10 @@ async def get_nat_outbound_mode() -> Dict:
             "success": True,
             "outbound_mode": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get outbound NAT mode: {e}")
+        logger.error("Failed to get outbound NAT mode: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -345,10 +344,10 @@ async def update_nat_outbound_mode(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update outbound NAT mode: {e}")
+        logger.error("Failed to update outbound NAT mode: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -373,8 +372,8 @@ async def apply_nat_changes() -> Dict:
             "message": "NAT changes applied",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to apply NAT changes: {e}")
+        logger.error("Failed to apply NAT changes: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """ACME / Let's Encrypt package tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # Certificates
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters
 from ..server import get_api_client, logger, mcp
 
@@ -45,12 +50,7 @@ async def search_acme_certificates(
         certificates = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            certificates = [
-                c for c in certificates
-                if term_lower in c.get("name", "").lower()
-                or term_lower in c.get("descr", "").lower()
-            ]
+            certificates = filter_by_search_term(certificates, search_term, ("name", "descr"))
 
         return {
             "success": True,
@@ -60,10 +60,10 @@ async def search_acme_certificates(
             "count": len(certificates),
             "certificates": certificates,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search ACME certificates: {e}")
+        logger.error("Failed to search ACME certificates: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -105,10 +105,10 @@ async def create_acme_certificate(
             "certificate": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create ACME certificate: {e}")
+        logger.error("Failed to create ACME certificate: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -163,10 +163,10 @@ async def update_acme_certificate(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update ACME certificate: {e}")
+        logger.error("Failed to update ACME certificate: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -199,10 +199,10 @@ async def delete_acme_certificate(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query certificates before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete ACME certificate: {e}")
+        logger.error("Failed to delete ACME certificate: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -234,10 +234,10 @@ async def issue_acme_certificate(
             "certificate_id": id,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to issue ACME certificate: {e}")
+        logger.error("Failed to issue ACME certificate: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -264,10 +264,10 @@ async def renew_acme_certificate(
             "certificate_id": id,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to renew ACME certificate: {e}")
+        logger.error("Failed to renew ACME certificate: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -305,13 +305,7 @@ async def search_acme_account_keys(
         account_keys = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            account_keys = [
-                k for k in account_keys
-                if term_lower in k.get("name", "").lower()
-                or term_lower in k.get("descr", "").lower()
-                or term_lower in k.get("email", "").lower()
-            ]
+            account_keys = filter_by_search_term(account_keys, search_term, ("name", "descr", "email"))
 
         return {
             "success": True,
@@ -321,10 +315,10 @@ async def search_acme_account_keys(
             "count": len(account_keys),
             "account_keys": account_keys,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search ACME account keys: {e}")
+        logger.error("Failed to search ACME account keys: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -367,10 +361,10 @@ async def create_acme_account_key(
             "account_key": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create ACME account key: {e}")
+        logger.error("Failed to create ACME account key: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -397,10 +391,10 @@ async def register_acme_account_key(
             "account_key_id": id,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to register ACME account key: {e}")
+        logger.error("Failed to register ACME account key: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -420,8 +414,8 @@ async def get_acme_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get ACME settings: {e}")
+        logger.error("Failed to get ACME settings: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """BIND DNS server package tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # Zones
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -55,12 +60,7 @@ async def search_bind_zones(
         zones = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            zones = [
-                z for z in zones
-                if term_lower in z.get("name", "").lower()
-                or term_lower in z.get("descr", "").lower()
-            ]
+            zones = filter_by_search_term(zones, search_term, ("name", "descr"))
 
         return {
             "success": True,
@@ -73,10 +73,10 @@ async def search_bind_zones(
             "count": len(zones),
             "zones": zones,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search BIND zones: {e}")
+        logger.error("Failed to search BIND zones: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -118,10 +118,10 @@ async def create_bind_zone(
             "zone": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create BIND zone: {e}")
+        logger.error("Failed to create BIND zone: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -176,10 +176,10 @@ async def update_bind_zone(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update BIND zone: {e}")
+        logger.error("Failed to update BIND zone: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -214,10 +214,10 @@ async def delete_bind_zone(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query zones before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete BIND zone: {e}")
+        logger.error("Failed to delete BIND zone: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -265,12 +265,7 @@ async def search_bind_zone_records(
         records = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            records = [
-                r for r in records
-                if term_lower in r.get("name", "").lower()
-                or term_lower in r.get("rdata", "").lower()
-            ]
+            records = filter_by_search_term(records, search_term, ("name", "rdata"))
 
         return {
             "success": True,
@@ -284,10 +279,10 @@ async def search_bind_zone_records(
             "count": len(records),
             "records": records,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search BIND zone records: {e}")
+        logger.error("Failed to search BIND zone records: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -342,7 +337,7 @@ async def manage_bind_zone_record(
                 "record": result.get("data", result),
                 "applied": apply_immediately,
                 "links": client.extract_links(result),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         elif action_lower == "delete":
@@ -371,7 +366,7 @@ async def manage_bind_zone_record(
                 "result": result.get("data", result),
                 "links": client.extract_links(result),
                 "note": "Object IDs have shifted after deletion. Re-query records before performing further operations by ID.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         else:
@@ -380,7 +375,7 @@ async def manage_bind_zone_record(
                 "error": f"Invalid action '{action}'. Must be 'create' or 'delete'.",
             }
     except Exception as e:
-        logger.error(f"Failed to manage BIND zone record: {e}")
+        logger.error("Failed to manage BIND zone record: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -400,10 +395,10 @@ async def get_bind_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get BIND settings: {e}")
+        logger.error("Failed to get BIND settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -458,10 +453,10 @@ async def update_bind_settings(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update BIND settings: {e}")
+        logger.error("Failed to update BIND settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -499,12 +494,7 @@ async def search_bind_access_lists(
         access_lists = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            access_lists = [
-                a for a in access_lists
-                if term_lower in a.get("name", "").lower()
-                or term_lower in a.get("descr", "").lower()
-            ]
+            access_lists = filter_by_search_term(access_lists, search_term, ("name", "descr"))
 
         return {
             "success": True,
@@ -514,10 +504,10 @@ async def search_bind_access_lists(
             "count": len(access_lists),
             "access_lists": access_lists,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search BIND access lists: {e}")
+        logger.error("Failed to search BIND access lists: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -565,7 +555,7 @@ async def manage_bind_access_list(
                 "access_list": result.get("data", result),
                 "applied": apply_immediately,
                 "links": client.extract_links(result),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         elif action_lower == "delete":
@@ -590,7 +580,7 @@ async def manage_bind_access_list(
                 "result": result.get("data", result),
                 "links": client.extract_links(result),
                 "note": "Object IDs have shifted after deletion. Re-query access lists before performing further operations by ID.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         else:
@@ -599,5 +589,5 @@ async def manage_bind_access_list(
                 "error": f"Invalid action '{action}'. Must be 'create' or 'delete'.",
             }
     except Exception as e:
-        logger.error(f"Failed to manage BIND access list: {e}")
+        logger.error("Failed to manage BIND access list: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """FreeRADIUS server package tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # Users
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters
 from ..server import get_api_client, logger, mcp
 
@@ -45,12 +50,7 @@ async def search_freeradius_users(
         users = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            users = [
-                u for u in users
-                if term_lower in u.get("username", "").lower()
-                or term_lower in u.get("descr", "").lower()
-            ]
+            users = filter_by_search_term(users, search_term, ("username", "descr"))
 
         return {
             "success": True,
@@ -60,10 +60,10 @@ async def search_freeradius_users(
             "count": len(users),
             "users": users,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search FreeRADIUS users: {e}")
+        logger.error("Failed to search FreeRADIUS users: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -106,10 +106,10 @@ async def create_freeradius_user(
             "user": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create FreeRADIUS user: {e}")
+        logger.error("Failed to create FreeRADIUS user: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -164,10 +164,10 @@ async def update_freeradius_user(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update FreeRADIUS user: {e}")
+        logger.error("Failed to update FreeRADIUS user: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -200,10 +200,10 @@ async def delete_freeradius_user(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query users before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete FreeRADIUS user: {e}")
+        logger.error("Failed to delete FreeRADIUS user: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -241,13 +241,7 @@ async def search_freeradius_clients(
         clients = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            clients = [
-                c for c in clients
-                if term_lower in c.get("shortname", "").lower()
-                or term_lower in c.get("ip", "").lower()
-                or term_lower in c.get("descr", "").lower()
-            ]
+            clients = filter_by_search_term(clients, search_term, ("shortname", "ip", "descr"))
 
         return {
             "success": True,
@@ -257,10 +251,10 @@ async def search_freeradius_clients(
             "count": len(clients),
             "clients": clients,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search FreeRADIUS clients: {e}")
+        logger.error("Failed to search FreeRADIUS clients: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -303,10 +297,10 @@ async def create_freeradius_client(
             "client": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create FreeRADIUS client: {e}")
+        logger.error("Failed to create FreeRADIUS client: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -361,10 +355,10 @@ async def update_freeradius_client(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update FreeRADIUS client: {e}")
+        logger.error("Failed to update FreeRADIUS client: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -397,8 +391,8 @@ async def delete_freeradius_client(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query clients before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete FreeRADIUS client: {e}")
+        logger.error("Failed to delete FreeRADIUS client: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """HAProxy load balancer package tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # Backends
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -45,12 +50,7 @@ async def search_haproxy_backends(
         backends = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            backends = [
-                b for b in backends
-                if term_lower in b.get("name", "").lower()
-                or term_lower in b.get("descr", "").lower()
-            ]
+            backends = filter_by_search_term(backends, search_term, ("name", "descr"))
 
         return {
             "success": True,
@@ -60,10 +60,10 @@ async def search_haproxy_backends(
             "count": len(backends),
             "backends": backends,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search HAProxy backends: {e}")
+        logger.error("Failed to search HAProxy backends: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -113,10 +113,10 @@ async def create_haproxy_backend(
             "backend": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create HAProxy backend: {e}")
+        logger.error("Failed to create HAProxy backend: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -177,10 +177,10 @@ async def update_haproxy_backend(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update HAProxy backend: {e}")
+        logger.error("Failed to update HAProxy backend: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -213,10 +213,10 @@ async def delete_haproxy_backend(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query backends before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete HAProxy backend: {e}")
+        logger.error("Failed to delete HAProxy backend: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -259,12 +259,7 @@ async def search_haproxy_backend_servers(
         servers = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            servers = [
-                s for s in servers
-                if term_lower in s.get("name", "").lower()
-                or term_lower in s.get("address", "").lower()
-            ]
+            servers = filter_by_search_term(servers, search_term, ("name", "address"))
 
         return {
             "success": True,
@@ -275,10 +270,10 @@ async def search_haproxy_backend_servers(
             "count": len(servers),
             "servers": servers,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search HAProxy backend servers: {e}")
+        logger.error("Failed to search HAProxy backend servers: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -341,7 +336,7 @@ async def manage_haproxy_backend_server(
                 "server": result.get("data", result),
                 "applied": apply_immediately,
                 "links": client.extract_links(result),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         elif action_lower == "delete":
@@ -370,7 +365,7 @@ async def manage_haproxy_backend_server(
                 "result": result.get("data", result),
                 "links": client.extract_links(result),
                 "note": "Object IDs have shifted after deletion. Re-query servers before performing further operations by ID.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         else:
@@ -379,7 +374,7 @@ async def manage_haproxy_backend_server(
                 "error": f"Invalid action '{action}'. Must be 'create' or 'delete'.",
             }
     except Exception as e:
-        logger.error(f"Failed to manage HAProxy backend server: {e}")
+        logger.error("Failed to manage HAProxy backend server: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -417,12 +412,7 @@ async def search_haproxy_frontends(
         frontends = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            frontends = [
-                f for f in frontends
-                if term_lower in f.get("name", "").lower()
-                or term_lower in f.get("descr", "").lower()
-            ]
+            frontends = filter_by_search_term(frontends, search_term, ("name", "descr"))
 
         return {
             "success": True,
@@ -432,10 +422,10 @@ async def search_haproxy_frontends(
             "count": len(frontends),
             "frontends": frontends,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search HAProxy frontends: {e}")
+        logger.error("Failed to search HAProxy frontends: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -485,10 +475,10 @@ async def create_haproxy_frontend(
             "frontend": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create HAProxy frontend: {e}")
+        logger.error("Failed to create HAProxy frontend: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -549,10 +539,10 @@ async def update_haproxy_frontend(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update HAProxy frontend: {e}")
+        logger.error("Failed to update HAProxy frontend: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -585,10 +575,10 @@ async def delete_haproxy_frontend(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query frontends before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete HAProxy frontend: {e}")
+        logger.error("Failed to delete HAProxy frontend: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -626,11 +616,7 @@ async def search_haproxy_files(
         files = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            files = [
-                f for f in files
-                if term_lower in f.get("name", "").lower()
-            ]
+            files = filter_by_search_term(files, search_term, ("name",))
 
         return {
             "success": True,
@@ -640,10 +626,10 @@ async def search_haproxy_files(
             "count": len(files),
             "files": files,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search HAProxy files: {e}")
+        logger.error("Failed to search HAProxy files: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -687,7 +673,7 @@ async def manage_haproxy_file(
                 "file": result.get("data", result),
                 "applied": apply_immediately,
                 "links": client.extract_links(result),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         elif action_lower == "delete":
@@ -712,7 +698,7 @@ async def manage_haproxy_file(
                 "result": result.get("data", result),
                 "links": client.extract_links(result),
                 "note": "Object IDs have shifted after deletion. Re-query files before performing further operations by ID.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         else:
@@ -721,7 +707,7 @@ async def manage_haproxy_file(
                 "error": f"Invalid action '{action}'. Must be 'create' or 'delete'.",
             }
     except Exception as e:
-        logger.error(f"Failed to manage HAProxy file: {e}")
+        logger.error("Failed to manage HAProxy file: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -741,10 +727,10 @@ async def get_haproxy_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get HAProxy settings: {e}")
+        logger.error("Failed to get HAProxy settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -799,10 +785,10 @@ async def update_haproxy_settings(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update HAProxy settings: {e}")
+        logger.error("Failed to update HAProxy settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -821,8 +807,8 @@ async def apply_haproxy_changes() -> Dict:
             "message": "HAProxy changes applied",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to apply HAProxy changes: {e}")
+        logger.error("Failed to apply HAProxy changes: %s", e)
         return {"success": False, "error": str(e)}
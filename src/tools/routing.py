@@ -1,6 +1,5 @@
 """Routing tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional, Union
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,14 @@ from mcp.types import ToolAnnotations
 # Gateways
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    rows_to_columns,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -58,13 +64,7 @@ async def search_gateways(
         gateways = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            gateways = [
-                gw for gw in gateways
-                if term_lower in gw.get("name", "").lower()
-                or term_lower in gw.get("descr", "").lower()
-                or term_lower in gw.get("gateway", "").lower()
-            ]
+            gateways = filter_by_search_term(gateways, search_term, ("name", "descr", "gateway"))
 
         return {
             "success": True,
@@ -78,10 +78,10 @@ async def search_gateways(
             "count": len(gateways),
             "gateways": gateways,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search gateways: {e}")
+        logger.error("Failed to search gateways: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -143,13 +143,25 @@ async def create_gateway(
             "gateway": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create gateway: {e}")
+        logger.error("Failed to create gateway: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_GATEWAY_FIELDS = {
+    "interface": "interface",
+    "name": "name",
+    "gateway": "gateway",
+    "ipprotocol": "ipprotocol",
+    "monitor": "monitor",
+    "weight": "weight",
+    "descr": "descr",
+    "disabled": "disabled",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_gateway(
@@ -186,17 +198,6 @@ async def update_gateway(
 
     client = get_api_client()
     try:
-        field_map = {
-            "interface": "interface",
-            "name": "name",
-            "gateway": "gateway",
-            "ipprotocol": "ipprotocol",
-            "monitor": "monitor",
-            "weight": "weight",
-            "descr": "descr",
-            "disabled": "disabled",
-        }
-
         params = {
             "interface": interface,
             "name": name,
@@ -211,7 +212,7 @@ async def update_gateway(
         updates: Dict[str, Union[str, int, bool]] = {}
         for param_name, value in params.items():
             if value is not None:
-                api_field = field_map[param_name]
+                api_field = _UPDATE_GATEWAY_FIELDS[param_name]
                 if api_field == "descr" and isinstance(value, str):
                     updates[api_field] = sanitize_description(value)
                 else:
@@ -231,10 +232,10 @@ async def update_gateway(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update gateway: {e}")
+        logger.error("Failed to update gateway: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -267,10 +268,10 @@ async def delete_gateway(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query gateways before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete gateway: {e}")
+        logger.error("Failed to delete gateway: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -290,10 +291,10 @@ async def get_default_gateway() -> Dict:
             "success": True,
             "default_gateway": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get default gateway: {e}")
+        logger.error("Failed to get default gateway: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -333,10 +334,10 @@ async def update_default_gateway(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update default gateway: {e}")
+        logger.error("Failed to update default gateway: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -374,12 +375,7 @@ async def search_gateway_groups(
         groups = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            groups = [
-                g for g in groups
-                if term_lower in g.get("name", "").lower()
-                or term_lower in g.get("descr", "").lower()
-            ]
+            groups = filter_by_search_term(groups, search_term, ("name", "descr"))
 
         return {
             "success": True,
@@ -389,10 +385,10 @@ async def search_gateway_groups(
             "count": len(groups),
             "gateway_groups": groups,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search gateway groups: {e}")
+        logger.error("Failed to search gateway groups: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -434,10 +430,10 @@ async def create_gateway_group(
             "gateway_group": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create gateway group: {e}")
+        logger.error("Failed to create gateway group: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -488,10 +484,10 @@ async def update_gateway_group(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update gateway group: {e}")
+        logger.error("Failed to update gateway group: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -524,10 +520,10 @@ async def delete_gateway_group(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query gateway groups before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete gateway group: {e}")
+        logger.error("Failed to delete gateway group: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -543,6 +539,7 @@ async def search_static_routes(
     page: int = 1,
     page_size: int = 20,
     sort_by: str = "network",
+    columnar: bool = False,
 ) -> Dict:
     """Search static routes with filtering and pagination
 
@@ -552,6 +549,7 @@ async def search_static_routes(
         page: Page number for pagination
         page_size: Number of results per page
         sort_by: Field to sort by (network, gateway, descr, etc.)
+        columnar: Return rows as one list per field instead of a list of objects (smaller payload for large pages)
     """
     client = get_api_client()
     try:
@@ -573,13 +571,7 @@ async def search_static_routes(
         routes = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            routes = [
-                r for r in routes
-                if term_lower in r.get("network", "").lower()
-                or term_lower in r.get("descr", "").lower()
-                or term_lower in r.get("gateway", "").lower()
-            ]
+            routes = filter_by_search_term(routes, search_term, ("network", "descr", "gateway"))
 
         return {
             "success": True,
@@ -590,12 +582,12 @@ async def search_static_routes(
                 "gateway": gateway,
             },
             "count": len(routes),
-            "static_routes": routes,
+            "static_routes": rows_to_columns(routes) if columnar else routes,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search static routes: {e}")
+        logger.error("Failed to search static routes: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -637,10 +629,10 @@ async def create_static_route(
             "static_route": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create static route: {e}")
+        logger.error("Failed to create static route: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -691,10 +683,10 @@ async def update_static_route(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update static route: {e}")
+        logger.error("Failed to update static route: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -727,10 +719,10 @@ async def delete_static_route(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query static routes before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete static route: {e}")
+        logger.error("Failed to delete static route: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -754,10 +746,10 @@ async def apply_routing_changes() -> Dict:
             "message": "Routing changes applied",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to apply routing changes: {e}")
+        logger.error("Failed to apply routing changes: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -772,8 +764,8 @@ async def get_gateway_status() -> Dict:
             "success": True,
             "gateway_status": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get gateway status: {e}")
+        logger.error("Failed to get gateway status: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,10 +1,10 @@
 """Service tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
 
+from ..helpers import VALID_SERVICE_ACTIONS, filter_by_search_term, utc_now_iso
 from ..models import QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -37,12 +37,7 @@ async def search_services(
         services = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            services = [
-                s for s in services
-                if term_lower in s.get("name", "").lower()
-                or term_lower in s.get("description", "").lower()
-            ]
+            services = filter_by_search_term(services, search_term, ("name", "description"))
 
         return {
             "success": True,
@@ -53,10 +48,10 @@ async def search_services(
             "count": len(services),
             "services": services,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to search services: {e}")
+        logger.error("Failed to search services: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -76,17 +71,12 @@ async def control_service(
     client = get_api_client()
     try:
         action_lower = action.lower()
-        if action_lower == "start":
-            result = await client.start_service(service_name)
-        elif action_lower == "stop":
-            result = await client.stop_service(service_name)
-        elif action_lower == "restart":
-            result = await client.restart_service(service_name)
-        else:
+        if action_lower not in VALID_SERVICE_ACTIONS:
             return {
                 "success": False,
                 "error": f"Invalid action '{action}'. Must be 'start', 'stop', or 'restart'",
             }
+        result = await client.control_service(service_name, action_lower)
 
         return {
             "success": True,
@@ -94,8 +84,8 @@ async def control_service(
             "service": service_name,
             "action": action_lower,
             "result": result.get("data", result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to {action} service {service_name}: {e}")
+        logger.error("Failed to %s service %s: %s", action, service_name, e)
         return {"success": False, "error": str(e)}
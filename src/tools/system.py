@@ -1,11 +1,15 @@
 """System tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from mcp.types import ToolAnnotations
 
-from ..helpers import create_default_sort, create_pagination
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    rows_to_columns,
+    utc_now_iso,
+)
 from ..models import QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -24,10 +28,10 @@ async def system_status() -> Dict:
             "success": True,
             "data": status.get("data", status),
             "links": links,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to get system status: {e}")
+        logger.error("Failed to get system status: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -74,10 +78,10 @@ async def search_interfaces(
             "count": len(interfaces.get("data") or []),
             "interfaces": interfaces.get("data") or [],
             "links": client.extract_links(interfaces),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to search interfaces: {e}")
+        logger.error("Failed to search interfaces: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -98,10 +102,10 @@ async def find_interfaces_by_status(status: str) -> Dict:
             "count": len(interfaces.get("data") or []),
             "interfaces": interfaces.get("data") or [],
             "links": client.extract_links(interfaces),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to find interfaces by status: {e}")
+        logger.error("Failed to find interfaces by status: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -112,6 +116,7 @@ async def get_arp_table(
     interface: Optional[str] = None,
     page: int = 1,
     page_size: int = 50,
+    columnar: bool = False,
 ) -> Dict:
     """Get the ARP table to discover devices on the network.
 
@@ -124,6 +129,7 @@ async def get_arp_table(
         interface: Filter by interface (lan, opt1, etc.)
         page: Page number for pagination
         page_size: Number of results per page
+        columnar: Return rows as one list per field instead of a list of objects (smaller payload for large pages)
     """
     client = get_api_client()
     try:
@@ -144,6 +150,7 @@ async def get_arp_table(
             filters=filters if filters else None,
             pagination=pagination
         )
+        rows = result.get("data") or []
 
         return {
             "success": True,
@@ -154,11 +161,11 @@ async def get_arp_table(
                 "mac_address": mac_address,
                 "interface": interface,
             },
-            "count": len(result.get("data") or []),
-            "arp_entries": result.get("data") or [],
+            "count": len(rows),
+            "arp_entries": rows_to_columns(rows) if columnar else rows,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to get ARP table: {e}")
+        logger.error("Failed to get ARP table: %s", e)
         return {"success": False, "error": str(e)}
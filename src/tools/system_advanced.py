@@ -1,11 +1,11 @@
 """Advanced system settings, REST API management, and remaining system endpoints for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from mcp.types import ToolAnnotations
 
 from ..guardrails import rate_limited
+from ..helpers import utc_now_iso
 from ..models import ControlParameters
 from ..server import get_api_client, logger, mcp
 
@@ -25,10 +25,10 @@ async def get_system_timezone() -> Dict:
             "success": True,
             "timezone": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get system timezone: {e}")
+        logger.error("Failed to get system timezone: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -59,10 +59,10 @@ async def update_system_timezone(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update system timezone: {e}")
+        logger.error("Failed to update system timezone: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -82,10 +82,10 @@ async def get_system_console() -> Dict:
             "success": True,
             "console": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get system console settings: {e}")
+        logger.error("Failed to get system console settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -133,10 +133,10 @@ async def update_system_console(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update system console settings: {e}")
+        logger.error("Failed to update system console settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -156,10 +156,10 @@ async def get_webgui_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get WebGUI settings: {e}")
+        logger.error("Failed to get WebGUI settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -230,10 +230,10 @@ async def update_webgui_settings(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update WebGUI settings: {e}")
+        logger.error("Failed to update WebGUI settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -253,10 +253,10 @@ async def get_email_notification_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get email notification settings: {e}")
+        logger.error("Failed to get email notification settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -334,10 +334,10 @@ async def update_email_notification_settings(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update email notification settings: {e}")
+        logger.error("Failed to update email notification settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -357,10 +357,10 @@ async def get_log_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get log settings: {e}")
+        logger.error("Failed to get log settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -490,10 +490,10 @@ async def update_log_settings(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update log settings: {e}")
+        logger.error("Failed to update log settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -513,10 +513,10 @@ async def get_dhcp_relay_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get DHCP relay settings: {e}")
+        logger.error("Failed to get DHCP relay settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -564,10 +564,10 @@ async def update_dhcp_relay_settings(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update DHCP relay settings: {e}")
+        logger.error("Failed to update DHCP relay settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -644,10 +644,10 @@ async def update_firewall_advanced_settings(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update firewall advanced settings: {e}")
+        logger.error("Failed to update firewall advanced settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -692,8 +692,8 @@ async def update_firewall_state_size(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update firewall state size: {e}")
+        logger.error("Failed to update firewall state size: %s", e)
         return {"success": False, "error": str(e)}
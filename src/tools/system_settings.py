@@ -1,6 +1,5 @@
 """System settings tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional, Union
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # DNS
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters
 from ..server import get_api_client, logger, mcp
 
@@ -25,10 +30,10 @@ async def get_system_dns() -> Dict:
             "success": True,
             "dns": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get system DNS: {e}")
+        logger.error("Failed to get system DNS: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -68,10 +73,10 @@ async def update_system_dns(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update system DNS: {e}")
+        logger.error("Failed to update system DNS: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -91,10 +96,10 @@ async def get_system_hostname() -> Dict:
             "success": True,
             "hostname": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get system hostname: {e}")
+        logger.error("Failed to get system hostname: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -134,10 +139,10 @@ async def update_system_hostname(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update system hostname: {e}")
+        logger.error("Failed to update system hostname: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -175,13 +180,7 @@ async def search_system_tunables(
         tunables = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            tunables = [
-                t for t in tunables
-                if term_lower in t.get("tunable", "").lower()
-                or term_lower in str(t.get("value", "")).lower()
-                or term_lower in t.get("descr", "").lower()
-            ]
+            tunables = filter_by_search_term(tunables, search_term, ("tunable", "value", "descr"))
 
         return {
             "success": True,
@@ -191,10 +190,10 @@ async def search_system_tunables(
             "count": len(tunables),
             "tunables": tunables,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search system tunables: {e}")
+        logger.error("Failed to search system tunables: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -233,10 +232,10 @@ async def create_system_tunable(
             "tunable": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create system tunable: {e}")
+        logger.error("Failed to create system tunable: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -288,10 +287,10 @@ async def update_system_tunable(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update system tunable: {e}")
+        logger.error("Failed to update system tunable: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -324,10 +323,10 @@ async def delete_system_tunable(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query tunables before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete system tunable: {e}")
+        logger.error("Failed to delete system tunable: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -347,10 +346,10 @@ async def get_system_version() -> Dict:
             "success": True,
             "version": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get system version: {e}")
+        logger.error("Failed to get system version: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -370,10 +369,10 @@ async def get_carp_status() -> Dict:
             "success": True,
             "carp_status": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get CARP status: {e}")
+        logger.error("Failed to get CARP status: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -413,10 +412,10 @@ async def update_carp_maintenance(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update CARP maintenance: {e}")
+        logger.error("Failed to update CARP maintenance: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -454,13 +453,7 @@ async def search_installed_packages(
         packages = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            packages = [
-                p for p in packages
-                if term_lower in p.get("name", "").lower()
-                or term_lower in p.get("descr", "").lower()
-                or term_lower in p.get("version", "").lower()
-            ]
+            packages = filter_by_search_term(packages, search_term, ("name", "descr", "version"))
 
         return {
             "success": True,
@@ -470,8 +463,8 @@ async def search_installed_packages(
             "count": len(packages),
             "packages": packages,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search installed packages: {e}")
+        logger.error("Failed to search installed packages: %s", e)
         return {"success": False, "error": str(e)}
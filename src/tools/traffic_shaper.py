@@ -1,6 +1,5 @@
 """Traffic shaper tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional, Union
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # Traffic Shapers
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -51,13 +56,7 @@ async def search_traffic_shapers(
         shapers = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            shapers = [
-                s for s in shapers
-                if term_lower in s.get("interface", "").lower()
-                or term_lower in s.get("descr", "").lower()
-                or term_lower in s.get("scheduler", "").lower()
-            ]
+            shapers = filter_by_search_term(shapers, search_term, ("interface", "descr", "scheduler"))
 
         return {
             "success": True,
@@ -70,10 +69,10 @@ async def search_traffic_shapers(
             "count": len(shapers),
             "traffic_shapers": shapers,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search traffic shapers: {e}")
+        logger.error("Failed to search traffic shapers: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -121,10 +120,10 @@ async def create_traffic_shaper(
             "traffic_shaper": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create traffic shaper: {e}")
+        logger.error("Failed to create traffic shaper: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -185,10 +184,10 @@ async def update_traffic_shaper(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update traffic shaper: {e}")
+        logger.error("Failed to update traffic shaper: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -221,10 +220,10 @@ async def delete_traffic_shaper(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query traffic shapers before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete traffic shaper: {e}")
+        logger.error("Failed to delete traffic shaper: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -262,12 +261,7 @@ async def search_shaper_queues(
         queues = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            queues = [
-                q for q in queues
-                if term_lower in q.get("name", "").lower()
-                or term_lower in q.get("descr", "").lower()
-            ]
+            queues = filter_by_search_term(queues, search_term, ("name", "descr"))
 
         return {
             "success": True,
@@ -277,10 +271,10 @@ async def search_shaper_queues(
             "count": len(queues),
             "shaper_queues": queues,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search shaper queues: {e}")
+        logger.error("Failed to search shaper queues: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -338,10 +332,10 @@ async def create_shaper_queue(
             "shaper_queue": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create shaper queue: {e}")
+        logger.error("Failed to create shaper queue: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -405,10 +399,10 @@ async def update_shaper_queue(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update shaper queue: {e}")
+        logger.error("Failed to update shaper queue: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -441,10 +435,10 @@ async def delete_shaper_queue(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query shaper queues before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete shaper queue: {e}")
+        logger.error("Failed to delete shaper queue: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -482,12 +476,7 @@ async def search_traffic_limiters(
         limiters = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            limiters = [
-                lim for lim in limiters
-                if term_lower in lim.get("name", "").lower()
-                or term_lower in lim.get("descr", "").lower()
-            ]
+            limiters = filter_by_search_term(limiters, search_term, ("name", "descr"))
 
         return {
             "success": True,
@@ -497,10 +486,10 @@ async def search_traffic_limiters(
             "count": len(limiters),
             "traffic_limiters": limiters,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search traffic limiters: {e}")
+        logger.error("Failed to search traffic limiters: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -553,10 +542,10 @@ async def create_traffic_limiter(
             "traffic_limiter": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create traffic limiter: {e}")
+        logger.error("Failed to create traffic limiter: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -620,10 +609,10 @@ async def update_traffic_limiter(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update traffic limiter: {e}")
+        logger.error("Failed to update traffic limiter: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -656,8 +645,8 @@ async def delete_traffic_limiter(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query traffic limiters before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete traffic limiter: {e}")
+        logger.error("Failed to delete traffic limiter: %s", e)
         return {"success": False, "error": str(e)}
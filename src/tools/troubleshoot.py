@@ -4,18 +4,27 @@ All tools in this module are READ-ONLY — they diagnose issues without making
 any configuration changes to the pfSense appliance.
 """
 
-import json
+import asyncio
 import os
-from datetime import datetime, timezone
+from collections import deque
 from typing import Dict, List, Optional
 
+import orjson
 from mcp.types import ToolAnnotations
 
 from ..guardrails import get_rollback_history
-from ..helpers import parse_filterlog_entry
+from ..helpers import parse_filterlog_entry, utc_now_iso
 from ..models import QueryFilter
 from ..server import get_api_client, logger, mcp
 
+
+def _unwrap(result):
+    """Re-raise an exception captured by asyncio.gather(return_exceptions=True)."""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
 # ---------------------------------------------------------------------------
 # 1. Diagnose Connectivity
 # ---------------------------------------------------------------------------
@@ -44,7 +53,7 @@ async def diagnose_connectivity(
         "arp_entry": None,
         "gateway_status": None,
         "issues": [],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
     # --- Ping ---
@@ -152,7 +161,7 @@ async def diagnose_blocked_traffic(
         "alias_memberships": [],
         "suggestions": [],
         "issues": [],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
     # --- Search firewall logs for source IP ---
@@ -312,7 +321,7 @@ async def diagnose_interface_issues(
         "gateway_status": None,
         "arp_count": 0,
         "issues": [],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
     # --- Interface status ---
@@ -444,12 +453,22 @@ async def diagnose_vpn_status() -> Dict:
         "wireguard_peers": None,
         "summary": {},
         "issues": [],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
+    # The four status endpoints are independent — fetch them concurrently and
+    # then evaluate each result in order, as if it had been awaited inline.
+    ovpn_servers_r, ovpn_clients_r, ipsec_r, wg_r = await asyncio.gather(
+        client.crud_get_settings("/status/openvpn/servers"),
+        client.crud_get_settings("/status/openvpn/clients"),
+        client.crud_list("/status/ipsec/sas"),
+        client.crud_list("/vpn/wireguard/peers"),
+        return_exceptions=True,
+    )
+
     # --- OpenVPN Servers ---
     try:
-        ovpn_servers = await client.crud_get_settings("/status/openvpn/servers")
+        ovpn_servers = _unwrap(ovpn_servers_r)
         servers_data = ovpn_servers.get("data") or []
         if isinstance(servers_data, dict):
             servers_data = [servers_data] if servers_data else []
@@ -464,7 +483,7 @@ async def diagnose_vpn_status() -> Dict:
 
     # --- OpenVPN Clients ---
     try:
-        ovpn_clients = await client.crud_get_settings("/status/openvpn/clients")
+        ovpn_clients = _unwrap(ovpn_clients_r)
         clients_data = ovpn_clients.get("data") or []
         if isinstance(clients_data, dict):
             clients_data = [clients_data] if clients_data else []
@@ -490,7 +509,7 @@ async def diagnose_vpn_status() -> Dict:
 
     # --- IPsec SAs ---
     try:
-        ipsec_result = await client.crud_list("/status/ipsec/sas")
+        ipsec_result = _unwrap(ipsec_r)
         sas_data = ipsec_result.get("data") or []
         established = sum(
             1 for sa in sas_data
@@ -513,7 +532,7 @@ async def diagnose_vpn_status() -> Dict:
 
     # --- WireGuard Peers ---
     try:
-        wg_result = await client.crud_list("/vpn/wireguard/peers")
+        wg_result = _unwrap(wg_r)
         peers_data = wg_result.get("data") or []
         results["wireguard_peers"] = peers_data
         results["summary"]["wireguard"] = {
@@ -565,7 +584,7 @@ async def diagnose_dhcp_issues(
         "conflicts": [],
         "specific_lease": None,
         "issues": [],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
     # --- DHCP server config ---
@@ -719,12 +738,22 @@ async def diagnose_dns_resolution() -> Dict:
         "system_dns_servers": None,
         "connectivity_check": None,
         "issues": [],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
+    # The checks read independent endpoints — issue them concurrently
+    resolver_r, host_r, domain_r, sys_status_r, ping_r = await asyncio.gather(
+        client.crud_get_settings("/services/dns_resolver/settings"),
+        client.crud_list("/services/dns_resolver/host_overrides"),
+        client.crud_list("/services/dns_resolver/domain_overrides"),
+        client.get_system_status(),
+        client.crud_create("/diagnostics/ping", {"host": "8.8.8.8", "count": 2}),
+        return_exceptions=True,
+    )
+
     # --- DNS Resolver settings ---
     try:
-        resolver = await client.crud_get_settings("/services/dns_resolver/settings")
+        resolver = _unwrap(resolver_r)
         resolver_data = resolver.get("data", resolver)
         results["resolver_settings"] = {
             "enabled": resolver_data.get("enable", False) if isinstance(resolver_data, dict) else None,
@@ -740,7 +769,7 @@ async def diagnose_dns_resolution() -> Dict:
 
     # --- Host overrides ---
     try:
-        host_overrides = await client.crud_list("/services/dns_resolver/host_overrides")
+        host_overrides = _unwrap(host_r)
         overrides = host_overrides.get("data") or []
         results["host_overrides_count"] = len(overrides)
     except Exception as e:
@@ -749,7 +778,7 @@ async def diagnose_dns_resolution() -> Dict:
 
     # --- Domain overrides ---
     try:
-        domain_overrides = await client.crud_list("/services/dns_resolver/domain_overrides")
+        domain_overrides = _unwrap(domain_r)
         overrides = domain_overrides.get("data") or []
         results["domain_overrides_count"] = len(overrides)
     except Exception as e:
@@ -758,7 +787,7 @@ async def diagnose_dns_resolution() -> Dict:
 
     # --- System DNS servers ---
     try:
-        sys_status = await client.get_system_status()
+        sys_status = _unwrap(sys_status_r)
         sys_data = sys_status.get("data", sys_status)
         if isinstance(sys_data, dict):
             dns_servers = sys_data.get("dns_servers") or sys_data.get("dnsserver") or []
@@ -773,9 +802,7 @@ async def diagnose_dns_resolution() -> Dict:
 
     # --- Connectivity check (ping 8.8.8.8) ---
     try:
-        ping_result = await client.crud_create(
-            "/diagnostics/ping", {"host": "8.8.8.8", "count": 2}
-        )
+        ping_result = _unwrap(ping_r)
         ping_data = ping_result.get("data", ping_result)
         ping_text = str(ping_data)
         if "0 packets received" in ping_text or "100% packet loss" in ping_text.lower():
@@ -821,12 +848,16 @@ async def diagnose_service_health() -> Dict:
         "stopped_services": [],
         "system_resources": None,
         "issues": [],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
+    svc_r, sys_status_r = await asyncio.gather(
+        client.get_services(), client.get_system_status(), return_exceptions=True
+    )
+
     # --- Service status ---
     try:
-        svc_result = await client.get_services()
+        svc_result = _unwrap(svc_r)
         services = svc_result.get("data") or []
         running = []
         stopped = []
@@ -864,7 +895,7 @@ async def diagnose_service_health() -> Dict:
 
     # --- System resources ---
     try:
-        sys_status = await client.get_system_status()
+        sys_status = _unwrap(sys_status_r)
         sys_data = sys_status.get("data", sys_status)
         if isinstance(sys_data, dict):
             results["system_resources"] = {
@@ -940,12 +971,18 @@ async def diagnose_high_availability() -> Dict:
         "virtual_ips": None,
         "carp_vip_summary": [],
         "issues": [],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
+    carp_r, vip_r = await asyncio.gather(
+        client.crud_get_settings("/status/carp"),
+        client.crud_list("/firewall/virtual_ips"),
+        return_exceptions=True,
+    )
+
     # --- CARP status ---
     try:
-        carp_result = await client.crud_get_settings("/status/carp")
+        carp_result = _unwrap(carp_r)
         carp_data = carp_result.get("data", carp_result)
         results["carp_status"] = carp_data
         if isinstance(carp_data, dict):
@@ -962,7 +999,7 @@ async def diagnose_high_availability() -> Dict:
 
     # --- Virtual IPs ---
     try:
-        vip_result = await client.crud_list("/firewall/virtual_ips")
+        vip_result = _unwrap(vip_r)
         vips = vip_result.get("data") or []
         results["virtual_ips"] = vips
 
@@ -1051,12 +1088,31 @@ async def get_system_health_report() -> Dict:
         "blocked_traffic_count": 0,
         "firewall_rule_count": 0,
         "findings": [],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
+    # Every section reads an independent endpoint — fetch them all
+    # concurrently, then evaluate each result as if awaited inline.
+    (
+        sys_status_r, iface_r, svc_r, gw_r, ovpn_s_r, ovpn_c_r, ipsec_r,
+        lease_r, blocked_r, rules_r,
+    ) = await asyncio.gather(
+        client.get_system_status(),
+        client.get_interfaces(),
+        client.get_services(),
+        client.crud_list("/routing/gateways"),
+        client.crud_get_settings("/status/openvpn/servers"),
+        client.crud_get_settings("/status/openvpn/clients"),
+        client.crud_list("/status/ipsec/sas"),
+        client.get_dhcp_leases(),
+        client.get_blocked_traffic_logs(lines=50),
+        client.get_firewall_rules(),
+        return_exceptions=True,
+    )
+
     # --- System status ---
     try:
-        sys_status = await client.get_system_status()
+        sys_status = _unwrap(sys_status_r)
         sys_data = sys_status.get("data", sys_status)
         report["system_status"] = {
             "cpu_usage": sys_data.get("cpu_usage") or sys_data.get("cpu_load") if isinstance(sys_data, dict) else None,
@@ -1101,7 +1157,7 @@ async def get_system_health_report() -> Dict:
 
     # --- Interface status ---
     try:
-        iface_result = await client.get_interfaces()
+        iface_result = _unwrap(iface_r)
         interfaces = iface_result.get("data") or []
         iface_summary = []
         for iface in interfaces:
@@ -1125,7 +1181,7 @@ async def get_system_health_report() -> Dict:
 
     # --- Service health ---
     try:
-        svc_result = await client.get_services()
+        svc_result = _unwrap(svc_r)
         services = svc_result.get("data") or []
         running = 0
         stopped_list = []
@@ -1156,7 +1212,7 @@ async def get_system_health_report() -> Dict:
 
     # --- Gateway status ---
     try:
-        gw_result = await client.crud_list("/routing/gateways")
+        gw_result = _unwrap(gw_r)
         gateways = gw_result.get("data") or []
         gw_summary = []
         for gw in gateways:
@@ -1181,7 +1237,7 @@ async def get_system_health_report() -> Dict:
     try:
         vpn_info = {}
         try:
-            ovpn_s = await client.crud_get_settings("/status/openvpn/servers")
+            ovpn_s = _unwrap(ovpn_s_r)
             s_data = ovpn_s.get("data") or []
             if isinstance(s_data, dict):
                 s_data = [s_data] if s_data else []
@@ -1190,7 +1246,7 @@ async def get_system_health_report() -> Dict:
             vpn_info["openvpn_servers"] = "unavailable"
 
         try:
-            ovpn_c = await client.crud_get_settings("/status/openvpn/clients")
+            ovpn_c = _unwrap(ovpn_c_r)
             c_data = ovpn_c.get("data") or []
             if isinstance(c_data, dict):
                 c_data = [c_data] if c_data else []
@@ -1209,8 +1265,7 @@ async def get_system_health_report() -> Dict:
             vpn_info["openvpn_clients"] = "unavailable"
 
         try:
-            ipsec_r = await client.crud_list("/status/ipsec/sas")
-            ipsec_data = ipsec_r.get("data") or []
+            ipsec_data = _unwrap(ipsec_r).get("data") or []
             vpn_info["ipsec_sas"] = len(ipsec_data)
         except Exception:
             vpn_info["ipsec_sas"] = "unavailable"
@@ -1222,7 +1277,7 @@ async def get_system_health_report() -> Dict:
 
     # --- DHCP utilization ---
     try:
-        lease_result = await client.get_dhcp_leases()
+        lease_result = _unwrap(lease_r)
         leases = lease_result.get("data") or []
         report["dhcp_summary"] = {
             "total_active_leases": len(leases),
@@ -1233,7 +1288,7 @@ async def get_system_health_report() -> Dict:
 
     # --- Recent blocked traffic count ---
     try:
-        blocked_result = await client.get_blocked_traffic_logs(lines=50)
+        blocked_result = _unwrap(blocked_r)
         blocked_entries = blocked_result.get("data") or []
         report["blocked_traffic_count"] = len(blocked_entries)
         if len(blocked_entries) >= 50:
@@ -1248,7 +1303,7 @@ async def get_system_health_report() -> Dict:
 
     # --- Firewall rule count ---
     try:
-        rules_result = await client.get_firewall_rules()
+        rules_result = _unwrap(rules_r)
         rules = rules_result.get("data") or []
         report["firewall_rule_count"] = len(rules)
     except Exception as e:
@@ -1284,6 +1339,15 @@ async def get_system_health_report() -> Dict:
 # ---------------------------------------------------------------------------
 
 
+def _tail_lines(path: str, count: int) -> Optional[deque]:
+    """Return the last ``count`` lines of a file, or None if it doesn't exist."""
+    try:
+        with open(path, "r") as f:
+            return deque(f, maxlen=count)
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True, destructiveHint=False))
 async def search_audit_trail(
     limit: int = 20,
@@ -1307,7 +1371,7 @@ async def search_audit_trail(
         "audit_log_entries": [],
         "audit_log_configured": False,
         "issues": [],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
     # --- In-memory rollback history ---
@@ -1329,19 +1393,20 @@ async def search_audit_trail(
 
     if audit_log_path:
         try:
-            if os.path.isfile(audit_log_path):
-                with open(audit_log_path, "r") as f:
-                    lines = f.readlines()
-
-                # Read the last N lines
-                recent_lines = lines[-limit * 2:]  # Read extra to account for filtering
+            # Read extra lines to account for filtering. The existence check
+            # and the read both run in a worker thread so neither stalls the
+            # event loop.
+            recent_lines = await asyncio.to_thread(
+                _tail_lines, audit_log_path, limit * 2
+            )
+            if recent_lines is not None:
                 entries = []
                 for line in recent_lines:
                     line = line.strip()
                     if not line:
                         continue
                     try:
-                        entry = json.loads(line)
+                        entry = orjson.loads(line)
                         # Apply filters
                         if tool_filter:
                             if tool_filter.lower() not in (entry.get("tool") or "").lower():
@@ -1350,7 +1415,7 @@ async def search_audit_trail(
                             if (entry.get("risk_level") or "").lower() != risk_filter.lower():
                                 continue
                         entries.append(entry)
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         continue
 
                 results["audit_log_entries"] = entries[-limit:]
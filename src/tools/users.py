@@ -1,6 +1,5 @@
 """User and group management tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,12 @@ from mcp.types import ToolAnnotations
 # Users
 # ------------------------------------------------------------------ #
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -55,10 +59,10 @@ async def search_users(
             "count": len(result.get("data") or []),
             "users": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search users: {e}")
+        logger.error("Failed to search users: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -121,13 +125,25 @@ async def create_user(
             "message": f"User '{name}' created successfully",
             "user": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create user: {e}")
+        logger.error("Failed to create user: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_USER_FIELDS = {
+    "name": "name",
+    "password": "password",
+    "priv": "priv",
+    "descr": "descr",
+    "disabled": "disabled",
+    "expires": "expires",
+    "authorizedkeys": "authorizedkeys",
+    "ipsecpsk": "ipsecpsk",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_user(
@@ -156,17 +172,6 @@ async def update_user(
     """
     client = get_api_client()
     try:
-        field_map = {
-            "name": "name",
-            "password": "password",
-            "priv": "priv",
-            "descr": "descr",
-            "disabled": "disabled",
-            "expires": "expires",
-            "authorizedkeys": "authorizedkeys",
-            "ipsecpsk": "ipsecpsk",
-        }
-
         params = {
             "name": name,
             "password": password,
@@ -181,7 +186,7 @@ async def update_user(
         updates: Dict = {}
         for param_name, value in params.items():
             if value is not None:
-                api_field = field_map[param_name]
+                api_field = _UPDATE_USER_FIELDS[param_name]
                 if param_name == "descr" and isinstance(value, str):
                     updates[api_field] = sanitize_description(value)
                 else:
@@ -201,10 +206,10 @@ async def update_user(
             "fields_updated": [k for k in updates.keys() if k != "id"],
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update user: {e}")
+        logger.error("Failed to update user: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -233,10 +238,10 @@ async def delete_user(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query users before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete user: {e}")
+        logger.error("Failed to delete user: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -286,10 +291,10 @@ async def search_groups(
             "count": len(result.get("data") or []),
             "groups": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search groups: {e}")
+        logger.error("Failed to search groups: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -340,13 +345,22 @@ async def create_group(
             "message": f"Group '{name}' created successfully",
             "group": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create group: {e}")
+        logger.error("Failed to create group: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_GROUP_FIELDS = {
+    "name": "name",
+    "scope": "scope",
+    "descr": "descr",
+    "priv": "priv",
+    "member": "member",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_group(
@@ -372,14 +386,6 @@ async def update_group(
         if scope is not None and scope not in ("local", "remote"):
             return {"success": False, "error": "scope must be 'local' or 'remote'"}
 
-        field_map = {
-            "name": "name",
-            "scope": "scope",
-            "descr": "descr",
-            "priv": "priv",
-            "member": "member",
-        }
-
         params = {
             "name": name,
             "scope": scope,
@@ -391,7 +397,7 @@ async def update_group(
         updates: Dict = {}
         for param_name, value in params.items():
             if value is not None:
-                api_field = field_map[param_name]
+                api_field = _UPDATE_GROUP_FIELDS[param_name]
                 if param_name == "descr" and isinstance(value, str):
                     updates[api_field] = sanitize_description(value)
                 else:
@@ -411,10 +417,10 @@ async def update_group(
             "fields_updated": [k for k in updates.keys() if k != "id"],
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update group: {e}")
+        logger.error("Failed to update group: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -443,10 +449,10 @@ async def delete_group(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query groups before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete group: {e}")
+        logger.error("Failed to delete group: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -496,10 +502,10 @@ async def search_auth_servers(
             "count": len(result.get("data") or []),
             "auth_servers": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search auth servers: {e}")
+        logger.error("Failed to search auth servers: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -625,13 +631,35 @@ async def create_auth_server(
             "message": f"Auth server '{name}' ({type}) created successfully",
             "auth_server": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create auth server: {e}")
+        logger.error("Failed to create auth server: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_AUTH_SERVER_FIELDS = {
+    "name": "name",
+    "type": "type",
+    "host": "host",
+    "port": "port",
+    "transport": "transport",
+    "scope": "scope",
+    "basedn": "basedn",
+    "authcn": "authcn",
+    "ldap_attr_user": "ldap_attr_user",
+    "ldap_attr_group": "ldap_attr_group",
+    "ldap_attr_member": "ldap_attr_member",
+    "ldap_binddn": "ldap_binddn",
+    "ldap_bindpw": "ldap_bindpw",
+    "radius_secret": "radius_secret",
+    "radius_auth_port": "radius_auth_port",
+    "radius_acct_port": "radius_acct_port",
+    "radius_protocol": "radius_protocol",
+    "radius_timeout": "radius_timeout",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_auth_server(
@@ -695,27 +723,6 @@ async def update_auth_server(
             if radius_protocol not in allowed_protocols:
                 return {"success": False, "error": f"radius_protocol must be one of: {', '.join(allowed_protocols)}"}
 
-        field_map = {
-            "name": "name",
-            "type": "type",
-            "host": "host",
-            "port": "port",
-            "transport": "transport",
-            "scope": "scope",
-            "basedn": "basedn",
-            "authcn": "authcn",
-            "ldap_attr_user": "ldap_attr_user",
-            "ldap_attr_group": "ldap_attr_group",
-            "ldap_attr_member": "ldap_attr_member",
-            "ldap_binddn": "ldap_binddn",
-            "ldap_bindpw": "ldap_bindpw",
-            "radius_secret": "radius_secret",
-            "radius_auth_port": "radius_auth_port",
-            "radius_acct_port": "radius_acct_port",
-            "radius_protocol": "radius_protocol",
-            "radius_timeout": "radius_timeout",
-        }
-
         params = {
             "name": name,
             "type": type,
@@ -740,7 +747,7 @@ async def update_auth_server(
         updates: Dict = {}
         for param_name, value in params.items():
             if value is not None:
-                api_field = field_map[param_name]
+                api_field = _UPDATE_AUTH_SERVER_FIELDS[param_name]
                 updates[api_field] = value
 
         if not updates:
@@ -757,10 +764,10 @@ async def update_auth_server(
             "fields_updated": [k for k in updates.keys() if k != "id"],
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update auth server: {e}")
+        logger.error("Failed to update auth server: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -789,8 +796,8 @@ async def delete_auth_server(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query auth servers before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete auth server: {e}")
+        logger.error("Failed to delete auth server: %s", e)
         return {"success": False, "error": str(e)}
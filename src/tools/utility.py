@@ -1,12 +1,11 @@
 """Utility tools for pfSense MCP server."""
 
-import os
-from datetime import datetime, timezone
 from typing import Dict
 
 from mcp.types import ToolAnnotations
 
-from ..guardrails import classify_risk, get_rollback_history
+from ..guardrails import RiskLevel, classify_risk, get_rollback_history
+from ..helpers import utc_now_iso
 from ..models import PaginationOptions, QueryFilter, SortOptions
 from ..server import get_api_client, logger, mcp
 
@@ -17,6 +16,15 @@ _SAFE_ENDPOINT_PREFIXES = (
     "/user/", "/certificates/",
 )
 
+# Human-readable guardrail summary per risk level (check_tool_risk)
+_RISK_DESCRIPTIONS = {
+    RiskLevel.READ: "No state change. Safe to call freely.",
+    RiskLevel.LOW: "Reversible settings change. No confirmation required.",
+    RiskLevel.MEDIUM: "Creates or modifies configuration. Rate-limited.",
+    RiskLevel.HIGH: "Destructive/irreversible. Requires confirm=True. Rate-limited.",
+    RiskLevel.CRITICAL: "System-level destructive. Requires confirm=True. Strictly rate-limited.",
+}
+
 
 def _validate_endpoint(endpoint: str) -> str:
     """Validate a user-supplied API endpoint path."""
@@ -59,10 +67,10 @@ async def follow_api_link(link_url: str) -> Dict:
             "followed_link": link_url,
             "data": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to follow link: {e}")
+        logger.error("Failed to follow link: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -90,10 +98,10 @@ async def enable_hateoas(confirm: bool = False) -> Dict:
             "success": True,
             "message": "HATEOAS enabled on pfSense REST API server — all API responses will now include navigation links",
             "result": result.get("data", result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to enable HATEOAS: {e}")
+        logger.error("Failed to enable HATEOAS: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -121,10 +129,10 @@ async def disable_hateoas(confirm: bool = False) -> Dict:
             "success": True,
             "message": "HATEOAS disabled on pfSense REST API server — API responses will be more compact",
             "result": result.get("data", result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to disable HATEOAS: {e}")
+        logger.error("Failed to disable HATEOAS: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -150,10 +158,10 @@ async def refresh_object_ids(endpoint: str) -> Dict:
             "objects": result.get("data") or [],
             "message": "Object IDs refreshed - use updated IDs for future operations",
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to refresh object IDs: {e}")
+        logger.error("Failed to refresh object IDs: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -187,7 +195,7 @@ async def find_object_by_field(
                 "found": True,
                 "object": obj,
                 "object_id": obj.get("id"),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": utc_now_iso()
             }
         else:
             return {
@@ -197,10 +205,10 @@ async def find_object_by_field(
                 "search_value": value,
                 "found": False,
                 "message": "No object found matching criteria",
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": utc_now_iso()
             }
     except Exception as e:
-        logger.error(f"Failed to find object by field: {e}")
+        logger.error("Failed to find object by field: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -215,7 +223,7 @@ async def get_api_capabilities() -> Dict:
             "success": True,
             "api_version": "v2",
             "package": "jaredhendrickson13/pfsense-api",
-            "pfsense_version": os.getenv("PFSENSE_VERSION", "CE_2_8_0"),
+            "pfsense_version": client.version.name,
             "capabilities": capabilities.get("data", capabilities),
             "features": {
                 "object_ids": "Dynamic, non-persistent",
@@ -226,10 +234,10 @@ async def get_api_capabilities() -> Dict:
                 "control_parameters": "Apply, async, placement, append, remove"
             },
             "links": client.extract_links(capabilities),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Failed to get API capabilities: {e}")
+        logger.error("Failed to get API capabilities: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -246,7 +254,7 @@ async def test_enhanced_connection() -> Dict:
                 "success": False,
                 "message": "Basic connection failed",
                 "error": conn_result.get("error", "unknown"),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": utc_now_iso()
             }
 
         # Test advanced features
@@ -292,10 +300,10 @@ async def test_enhanced_connection() -> Dict:
             "basic_connection": True,
             "feature_tests": tests,
             "hateoas_enabled": client.hateoas_enabled,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
     except Exception as e:
-        logger.error(f"Enhanced connection test failed: {e}")
+        logger.error("Enhanced connection test failed: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -321,7 +329,7 @@ async def get_guardrail_status() -> Dict:
             },
         },
         "recent_rollback_entries": get_rollback_history(limit=10),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
 
@@ -333,19 +341,13 @@ async def check_tool_risk(tool_name: str) -> Dict:
         tool_name: Name of the MCP tool to check (e.g., "delete_firewall_rule")
     """
     risk = classify_risk(tool_name)
-    requires_confirm = risk.value in ("high", "critical")
+    requires_confirm = risk.requires_confirmation
 
     return {
         "success": True,
         "tool": tool_name,
         "risk_level": risk.value,
         "requires_confirm": requires_confirm,
-        "description": {
-            "read": "No state change. Safe to call freely.",
-            "low": "Reversible settings change. No confirmation required.",
-            "medium": "Creates or modifies configuration. Rate-limited.",
-            "high": "Destructive/irreversible. Requires confirm=True. Rate-limited.",
-            "critical": "System-level destructive. Requires confirm=True. Strictly rate-limited.",
-        }.get(risk.value, "Unknown risk level."),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "description": _RISK_DESCRIPTIONS.get(risk, "Unknown risk level."),
+        "timestamp": utc_now_iso(),
     }
@@ -1,6 +1,5 @@
 """Virtual IP tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional, Union
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,13 @@ from mcp.types import ToolAnnotations
 # Virtual IPs
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    filter_by_search_term,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -58,13 +63,7 @@ async def search_virtual_ips(
         vips = result.get("data") or []
 
         if search_term:
-            term_lower = search_term.lower()
-            vips = [
-                v for v in vips
-                if term_lower in v.get("subnet", "").lower()
-                or term_lower in v.get("descr", "").lower()
-                or term_lower in v.get("interface", "").lower()
-            ]
+            vips = filter_by_search_term(vips, search_term, ("subnet", "descr", "interface"))
 
         return {
             "success": True,
@@ -78,10 +77,10 @@ async def search_virtual_ips(
             "count": len(vips),
             "virtual_ips": vips,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search virtual IPs: {e}")
+        logger.error("Failed to search virtual IPs: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -151,10 +150,10 @@ async def create_virtual_ip(
             "virtual_ip": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create virtual IP: {e}")
+        logger.error("Failed to create virtual IP: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -233,10 +232,10 @@ async def update_virtual_ip(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update virtual IP: {e}")
+        logger.error("Failed to update virtual IP: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -269,10 +268,10 @@ async def delete_virtual_ip(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query virtual IPs before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete virtual IP: {e}")
+        logger.error("Failed to delete virtual IP: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -291,8 +290,8 @@ async def apply_virtual_ip_changes() -> Dict:
             "message": "Virtual IP changes applied",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to apply virtual IP changes: {e}")
+        logger.error("Failed to apply virtual IP changes: %s", e)
         return {"success": False, "error": str(e)}
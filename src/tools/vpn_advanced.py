@@ -1,6 +1,5 @@
 """VPN advanced features tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -9,7 +8,12 @@ from mcp.types import ToolAnnotations
 # IPsec Phase 2 Encryptions
 # ---------------------------------------------------------------------------
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination, sanitize_description
+from ..helpers import (
+    create_default_sort,
+    create_pagination,
+    sanitize_description,
+    utc_now_iso,
+)
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -55,10 +59,10 @@ async def search_ipsec_phase2_encryptions(
             "count": len(encryptions),
             "encryptions": encryptions,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search IPsec Phase 2 encryptions: {e}")
+        logger.error("Failed to search IPsec Phase 2 encryptions: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -111,10 +115,10 @@ async def create_ipsec_phase2_encryption(
             "encryption": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create IPsec Phase 2 encryption: {e}")
+        logger.error("Failed to create IPsec Phase 2 encryption: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -171,10 +175,10 @@ async def update_ipsec_phase2_encryption(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update IPsec Phase 2 encryption: {e}")
+        logger.error("Failed to update IPsec Phase 2 encryption: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -209,10 +213,10 @@ async def delete_ipsec_phase2_encryption(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query encryptions before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete IPsec Phase 2 encryption: {e}")
+        logger.error("Failed to delete IPsec Phase 2 encryption: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -262,10 +266,10 @@ async def search_wireguard_tunnel_addresses(
             "count": len(addresses),
             "tunnel_addresses": addresses,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search WireGuard tunnel addresses: {e}")
+        logger.error("Failed to search WireGuard tunnel addresses: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -316,7 +320,7 @@ async def manage_wireguard_tunnel_address(
                 "tunnel_address": result.get("data", result),
                 "applied": apply_immediately,
                 "links": client.extract_links(result),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         elif action_lower == "delete":
@@ -347,7 +351,7 @@ async def manage_wireguard_tunnel_address(
                 "result": result.get("data", result),
                 "links": client.extract_links(result),
                 "note": "Object IDs have shifted after deletion. Re-query tunnel addresses before performing further operations by ID.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         else:
@@ -357,7 +361,7 @@ async def manage_wireguard_tunnel_address(
             }
 
     except Exception as e:
-        logger.error(f"Failed to manage WireGuard tunnel address: {e}")
+        logger.error("Failed to manage WireGuard tunnel address: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -377,10 +381,10 @@ async def get_openvpn_server_status() -> Dict:
             "success": True,
             "servers": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get OpenVPN server status: {e}")
+        logger.error("Failed to get OpenVPN server status: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -395,10 +399,10 @@ async def get_openvpn_client_status() -> Dict:
             "success": True,
             "clients": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get OpenVPN client status: {e}")
+        logger.error("Failed to get OpenVPN client status: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -443,10 +447,10 @@ async def search_openvpn_server_connections(
             "count": len(connections),
             "connections": connections,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search OpenVPN server connections: {e}")
+        logger.error("Failed to search OpenVPN server connections: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -477,10 +481,10 @@ async def disconnect_openvpn_client(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query connections before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to disconnect OpenVPN client: {e}")
+        logger.error("Failed to disconnect OpenVPN client: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -525,10 +529,10 @@ async def search_openvpn_server_routes(
             "count": len(routes),
             "routes": routes,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search OpenVPN server routes: {e}")
+        logger.error("Failed to search OpenVPN server routes: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -578,8 +582,8 @@ async def search_openvpn_client_export_configs(
             "count": len(configs),
             "export_configs": configs,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search OpenVPN client export configs: {e}")
+        logger.error("Failed to search OpenVPN client export configs: %s", e)
         return {"success": False, "error": str(e)}
@@ -1,6 +1,5 @@
 """IPsec VPN tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -13,6 +12,7 @@ from ..helpers import (
     create_default_sort,
     create_pagination,
     sanitize_description,
+    utc_now_iso,
     validate_ip_address,
 )
 from ..models import ControlParameters, QueryFilter
@@ -73,10 +73,10 @@ async def search_ipsec_phase1s(
             "count": len(result.get("data") or []),
             "phase1s": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search IPsec Phase 1 entries: {e}")
+        logger.error("Failed to search IPsec Phase 1 entries: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -154,7 +154,7 @@ async def create_ipsec_phase1(
         if descr:
             phase1_data["descr"] = sanitize_description(descr)
         else:
-            phase1_data["descr"] = f"IPsec P1 via MCP at {datetime.now(timezone.utc).isoformat()}"
+            phase1_data["descr"] = f"IPsec P1 via MCP at {utc_now_iso()}"
 
         control = ControlParameters(apply=apply_immediately)
 
@@ -166,13 +166,30 @@ async def create_ipsec_phase1(
             "phase1": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create IPsec Phase 1: {e}")
+        logger.error("Failed to create IPsec Phase 1: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_IPSEC_PHASE1_FIELDS = {
+    "iketype": "iketype",
+    "protocol": "protocol",
+    "interface": "interface",
+    "remote_gateway": "remote_gateway",
+    "authentication_method": "authentication_method",
+    "pre_shared_key": "pre_shared_key",
+    "myid_type": "myid_type",
+    "myid_data": "myid_data",
+    "peerid_type": "peerid_type",
+    "peerid_data": "peerid_data",
+    "lifetime": "lifetime",
+    "descr": "descr",
+    "disabled": "disabled",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_ipsec_phase1(
@@ -216,22 +233,6 @@ async def update_ipsec_phase1(
 
     client = get_api_client()
     try:
-        field_map = {
-            "iketype": "iketype",
-            "protocol": "protocol",
-            "interface": "interface",
-            "remote_gateway": "remote_gateway",
-            "authentication_method": "authentication_method",
-            "pre_shared_key": "pre_shared_key",
-            "myid_type": "myid_type",
-            "myid_data": "myid_data",
-            "peerid_type": "peerid_type",
-            "peerid_data": "peerid_data",
-            "lifetime": "lifetime",
-            "descr": "descr",
-            "disabled": "disabled",
-        }
-
         params = {
             "iketype": iketype,
             "protocol": protocol,
@@ -251,7 +252,7 @@ async def update_ipsec_phase1(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                updates[field_map[param_name]] = value
+                updates[_UPDATE_IPSEC_PHASE1_FIELDS[param_name]] = value
 
         if not updates:
             return {"success": False, "error": "No fields to update - provide at least one field"}
@@ -268,10 +269,10 @@ async def update_ipsec_phase1(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update IPsec Phase 1: {e}")
+        logger.error("Failed to update IPsec Phase 1: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -304,10 +305,10 @@ async def delete_ipsec_phase1(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query Phase 1 entries before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete IPsec Phase 1: {e}")
+        logger.error("Failed to delete IPsec Phase 1: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -370,10 +371,10 @@ async def search_ipsec_phase2s(
             "count": len(result.get("data") or []),
             "phase2s": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search IPsec Phase 2 entries: {e}")
+        logger.error("Failed to search IPsec Phase 2 entries: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -439,7 +440,7 @@ async def create_ipsec_phase2(
         if descr:
             phase2_data["descr"] = sanitize_description(descr)
         else:
-            phase2_data["descr"] = f"IPsec P2 via MCP at {datetime.now(timezone.utc).isoformat()}"
+            phase2_data["descr"] = f"IPsec P2 via MCP at {utc_now_iso()}"
 
         control = ControlParameters(apply=apply_immediately)
 
@@ -451,13 +452,28 @@ async def create_ipsec_phase2(
             "phase2": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create IPsec Phase 2: {e}")
+        logger.error("Failed to create IPsec Phase 2: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_IPSEC_PHASE2_FIELDS = {
+    "ikeid": "ikeid",
+    "mode": "mode",
+    "localid_type": "localid_type",
+    "localid_address": "localid_address",
+    "localid_netbits": "localid_netbits",
+    "remoteid_type": "remoteid_type",
+    "remoteid_address": "remoteid_address",
+    "remoteid_netbits": "remoteid_netbits",
+    "protocol": "protocol",
+    "lifetime": "lifetime",
+    "descr": "descr",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_ipsec_phase2(
@@ -497,20 +513,6 @@ async def update_ipsec_phase2(
 
     client = get_api_client()
     try:
-        field_map = {
-            "ikeid": "ikeid",
-            "mode": "mode",
-            "localid_type": "localid_type",
-            "localid_address": "localid_address",
-            "localid_netbits": "localid_netbits",
-            "remoteid_type": "remoteid_type",
-            "remoteid_address": "remoteid_address",
-            "remoteid_netbits": "remoteid_netbits",
-            "protocol": "protocol",
-            "lifetime": "lifetime",
-            "descr": "descr",
-        }
-
         params = {
             "ikeid": ikeid,
             "mode": mode,
@@ -528,7 +530,7 @@ async def update_ipsec_phase2(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                updates[field_map[param_name]] = value
+                updates[_UPDATE_IPSEC_PHASE2_FIELDS[param_name]] = value
 
         if not updates:
             return {"success": False, "error": "No fields to update - provide at least one field"}
@@ -545,10 +547,10 @@ async def update_ipsec_phase2(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update IPsec Phase 2: {e}")
+        logger.error("Failed to update IPsec Phase 2: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -581,10 +583,10 @@ async def delete_ipsec_phase2(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query Phase 2 entries before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete IPsec Phase 2: {e}")
+        logger.error("Failed to delete IPsec Phase 2: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -635,10 +637,10 @@ async def search_ipsec_phase1_encryptions(
             "count": len(result.get("data") or []),
             "encryptions": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search IPsec Phase 1 encryptions: {e}")
+        logger.error("Failed to search IPsec Phase 1 encryptions: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -690,10 +692,10 @@ async def create_ipsec_phase1_encryption(
             "encryption": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create IPsec Phase 1 encryption: {e}")
+        logger.error("Failed to create IPsec Phase 1 encryption: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -726,10 +728,10 @@ async def delete_ipsec_phase1_encryption(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query encryptions before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete IPsec Phase 1 encryption: {e}")
+        logger.error("Failed to delete IPsec Phase 1 encryption: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -754,10 +756,10 @@ async def apply_ipsec_changes() -> Dict:
             "message": "IPsec changes applied successfully",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to apply IPsec changes: {e}")
+        logger.error("Failed to apply IPsec changes: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -777,10 +779,10 @@ async def get_ipsec_status() -> Dict:
             "count": len(result.get("data") or []),
             "sas": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get IPsec SA status: {e}")
+        logger.error("Failed to get IPsec SA status: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -800,8 +802,8 @@ async def get_ipsec_child_sa_status() -> Dict:
             "count": len(result.get("data") or []),
             "child_sas": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get IPsec Child SA status: {e}")
+        logger.error("Failed to get IPsec Child SA status: %s", e)
         return {"success": False, "error": str(e)}
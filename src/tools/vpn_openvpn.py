@@ -1,6 +1,5 @@
 """OpenVPN management tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from mcp.types import ToolAnnotations
@@ -13,6 +12,7 @@ from ..helpers import (
     create_default_sort,
     create_pagination,
     sanitize_description,
+    utc_now_iso,
     validate_port_value,
     validate_subnet,
 )
@@ -77,10 +77,10 @@ async def search_openvpn_servers(
             "count": len(result.get("data") or []),
             "openvpn_servers": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search OpenVPN servers: {e}")
+        logger.error("Failed to search OpenVPN servers: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -179,7 +179,7 @@ async def create_openvpn_server(
         if description:
             server_data["descr"] = sanitize_description(description)
         else:
-            server_data["descr"] = f"OpenVPN server via MCP at {datetime.now(timezone.utc).isoformat()}"
+            server_data["descr"] = f"OpenVPN server via MCP at {utc_now_iso()}"
 
         optional_fields = {
             "tls": tls,
@@ -215,10 +215,10 @@ async def create_openvpn_server(
             "openvpn_server": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create OpenVPN server: {e}")
+        logger.error("Failed to create OpenVPN server: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -352,10 +352,10 @@ async def update_openvpn_server(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update OpenVPN server: {e}")
+        logger.error("Failed to update OpenVPN server: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -393,10 +393,10 @@ async def delete_openvpn_server(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query servers before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete OpenVPN server: {e}")
+        logger.error("Failed to delete OpenVPN server: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -461,10 +461,10 @@ async def search_openvpn_clients(
             "count": len(result.get("data") or []),
             "openvpn_clients": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search OpenVPN clients: {e}")
+        logger.error("Failed to search OpenVPN clients: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -551,7 +551,7 @@ async def create_openvpn_client(
         if description:
             client_data["descr"] = sanitize_description(description)
         else:
-            client_data["descr"] = f"OpenVPN client via MCP at {datetime.now(timezone.utc).isoformat()}"
+            client_data["descr"] = f"OpenVPN client via MCP at {utc_now_iso()}"
 
         optional_fields = {
             "tls": tls,
@@ -584,10 +584,10 @@ async def create_openvpn_client(
             "openvpn_client": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create OpenVPN client: {e}")
+        logger.error("Failed to create OpenVPN client: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -708,10 +708,10 @@ async def update_openvpn_client(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update OpenVPN client: {e}")
+        logger.error("Failed to update OpenVPN client: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -749,10 +749,10 @@ async def delete_openvpn_client(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query clients before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete OpenVPN client: {e}")
+        logger.error("Failed to delete OpenVPN client: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -815,10 +815,10 @@ async def search_openvpn_csos(
             "count": len(result.get("data") or []),
             "openvpn_csos": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search OpenVPN CSOs: {e}")
+        logger.error("Failed to search OpenVPN CSOs: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -900,7 +900,7 @@ async def manage_openvpn_cso(
                 "result": result.get("data", result),
                 "links": client.extract_links(result),
                 "note": "Object IDs have shifted after deletion. Re-query CSOs before performing further operations by ID.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         # --- BUILD DATA for create/update ---
@@ -940,7 +940,7 @@ async def manage_openvpn_cso(
                 return {"success": False, "error": "common_name is required for create action."}
 
             if "descr" not in cso_data:
-                cso_data["descr"] = f"CSO for {common_name} via MCP at {datetime.now(timezone.utc).isoformat()}"
+                cso_data["descr"] = f"CSO for {common_name} via MCP at {utc_now_iso()}"
 
             result = await client.crud_create("/vpn/openvpn/cso", cso_data, control)
 
@@ -950,7 +950,7 @@ async def manage_openvpn_cso(
                 "openvpn_cso": result.get("data", result),
                 "applied": apply_immediately,
                 "links": client.extract_links(result),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         # --- UPDATE ---
@@ -970,11 +970,11 @@ async def manage_openvpn_cso(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
 
     except Exception as e:
-        logger.error(f"Failed to {action_lower} OpenVPN CSO: {e}")
+        logger.error("Failed to %s OpenVPN CSO: %s", action_lower, e)
         return {"success": False, "error": str(e)}
 
 
@@ -1008,10 +1008,10 @@ async def get_openvpn_status() -> Dict:
                 **client.extract_links(server_status),
                 **client.extract_links(client_status),
             },
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get OpenVPN status: {e}")
+        logger.error("Failed to get OpenVPN status: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -1089,8 +1089,8 @@ async def export_openvpn_client_config(
             "common_name": common_name,
             "export": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to export OpenVPN client config: {e}")
+        logger.error("Failed to export OpenVPN client config: %s", e)
         return {"success": False, "error": str(e)}
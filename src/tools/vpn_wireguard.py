@@ -1,13 +1,12 @@
 """WireGuard VPN tools for pfSense MCP server."""
 
-from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from mcp.types import ToolAnnotations
 
 # API endpoint constants
 from ..guardrails import guarded, rate_limited
-from ..helpers import create_default_sort, create_pagination
+from ..helpers import create_default_sort, create_pagination, utc_now_iso
 from ..models import ControlParameters, QueryFilter
 from ..server import get_api_client, logger, mcp
 
@@ -72,10 +71,10 @@ async def search_wireguard_tunnels(
             "count": len(result.get("data") or []),
             "tunnels": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search WireGuard tunnels: {e}")
+        logger.error("Failed to search WireGuard tunnels: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -124,13 +123,23 @@ async def create_wireguard_tunnel(
             "tunnel": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create WireGuard tunnel: {e}")
+        logger.error("Failed to create WireGuard tunnel: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_WIREGUARD_TUNNEL_FIELDS = {
+    "name": "name",
+    "listenport": "listenport",
+    "privatekey": "privatekey",
+    "mtu": "mtu",
+    "descr": "descr",
+    "enabled": "enabled",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_wireguard_tunnel(
@@ -157,15 +166,6 @@ async def update_wireguard_tunnel(
     """
     client = get_api_client()
     try:
-        field_map = {
-            "name": "name",
-            "listenport": "listenport",
-            "privatekey": "privatekey",
-            "mtu": "mtu",
-            "descr": "descr",
-            "enabled": "enabled",
-        }
-
         params = {
             "name": name,
             "listenport": listenport,
@@ -178,7 +178,7 @@ async def update_wireguard_tunnel(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                updates[field_map[param_name]] = value
+                updates[_UPDATE_WIREGUARD_TUNNEL_FIELDS[param_name]] = value
 
         if not updates:
             return {"success": False, "error": "No fields to update - provide at least one field"}
@@ -194,10 +194,10 @@ async def update_wireguard_tunnel(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update WireGuard tunnel: {e}")
+        logger.error("Failed to update WireGuard tunnel: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -230,10 +230,10 @@ async def delete_wireguard_tunnel(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query tunnels before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete WireGuard tunnel: {e}")
+        logger.error("Failed to delete WireGuard tunnel: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -288,10 +288,10 @@ async def search_wireguard_peers(
             "count": len(result.get("data") or []),
             "peers": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search WireGuard peers: {e}")
+        logger.error("Failed to search WireGuard peers: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -346,13 +346,24 @@ async def create_wireguard_peer(
             "peer": result.get("data", result),
             "applied": apply_immediately,
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to create WireGuard peer: {e}")
+        logger.error("Failed to create WireGuard peer: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_WIREGUARD_PEER_FIELDS = {
+    "tun": "tun",
+    "publickey": "publickey",
+    "descr": "descr",
+    "endpoint": "endpoint",
+    "port": "port",
+    "presharedkey": "presharedkey",
+    "keepalive": "keepalive",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_wireguard_peer(
@@ -381,16 +392,6 @@ async def update_wireguard_peer(
     """
     client = get_api_client()
     try:
-        field_map = {
-            "tun": "tun",
-            "publickey": "publickey",
-            "descr": "descr",
-            "endpoint": "endpoint",
-            "port": "port",
-            "presharedkey": "presharedkey",
-            "keepalive": "keepalive",
-        }
-
         params = {
             "tun": tun,
             "publickey": publickey,
@@ -404,7 +405,7 @@ async def update_wireguard_peer(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                updates[field_map[param_name]] = value
+                updates[_UPDATE_WIREGUARD_PEER_FIELDS[param_name]] = value
 
         if not updates:
             return {"success": False, "error": "No fields to update - provide at least one field"}
@@ -420,10 +421,10 @@ async def update_wireguard_peer(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update WireGuard peer: {e}")
+        logger.error("Failed to update WireGuard peer: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -456,10 +457,10 @@ async def delete_wireguard_peer(
             "result": result.get("data", result),
             "links": client.extract_links(result),
             "note": "Object IDs have shifted after deletion. Re-query peers before performing further operations by ID.",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to delete WireGuard peer: {e}")
+        logger.error("Failed to delete WireGuard peer: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -508,10 +509,10 @@ async def search_wireguard_peer_allowed_ips(
             "count": len(result.get("data") or []),
             "allowed_ips": result.get("data") or [],
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to search WireGuard peer allowed IPs: {e}")
+        logger.error("Failed to search WireGuard peer allowed IPs: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -560,7 +561,7 @@ async def manage_wireguard_peer_allowed_ip(
                 "allowed_ip": result.get("data", result),
                 "applied": apply_immediately,
                 "links": client.extract_links(result),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         elif action_lower == "delete":
@@ -589,7 +590,7 @@ async def manage_wireguard_peer_allowed_ip(
                 "result": result.get("data", result),
                 "links": client.extract_links(result),
                 "note": "Object IDs have shifted after deletion. Re-query allowed IPs before performing further operations by ID.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
             }
 
         else:
@@ -598,7 +599,7 @@ async def manage_wireguard_peer_allowed_ip(
                 "error": f"Invalid action '{action}'. Must be 'create' or 'delete'.",
             }
     except Exception as e:
-        logger.error(f"Failed to manage WireGuard peer allowed IP: {e}")
+        logger.error("Failed to manage WireGuard peer allowed IP: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -616,13 +617,21 @@ async def get_wireguard_settings() -> Dict:
             "success": True,
             "settings": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to get WireGuard settings: {e}")
+        logger.error("Failed to get WireGuard settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
+_UPDATE_WIREGUARD_SETTINGS_FIELDS = {
+    "enable": "enable",
+    "keep_conf": "keep_conf",
+    "resolve_interval": "resolve_interval",
+    "interface_group": "interface_group",
+}
+
+
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False, idempotentHint=True))
 @rate_limited
 async def update_wireguard_settings(
@@ -643,13 +652,6 @@ async def update_wireguard_settings(
     """
     client = get_api_client()
     try:
-        field_map = {
-            "enable": "enable",
-            "keep_conf": "keep_conf",
-            "resolve_interval": "resolve_interval",
-            "interface_group": "interface_group",
-        }
-
         params = {
             "enable": enable,
             "keep_conf": keep_conf,
@@ -660,7 +662,7 @@ async def update_wireguard_settings(
         updates = {}
         for param_name, value in params.items():
             if value is not None:
-                updates[field_map[param_name]] = value
+                updates[_UPDATE_WIREGUARD_SETTINGS_FIELDS[param_name]] = value
 
         if not updates:
             return {"success": False, "error": "No fields to update - provide at least one field"}
@@ -675,10 +677,10 @@ async def update_wireguard_settings(
             "applied": apply_immediately,
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to update WireGuard settings: {e}")
+        logger.error("Failed to update WireGuard settings: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -698,8 +700,8 @@ async def apply_wireguard_changes() -> Dict:
             "message": "WireGuard changes applied",
             "result": result.get("data", result),
             "links": client.extract_links(result),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
         }
     except Exception as e:
-        logger.error(f"Failed to apply WireGuard changes: {e}")
+        logger.error("Failed to apply WireGuard changes: %s", e)
         return {"success": False, "error": str(e)}
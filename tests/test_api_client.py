@@ -4,7 +4,10 @@ Covers dataclass serialisation, helper functions, Content-Type logic,
 query-param assembly, and field remapping in higher-level methods.
 """
 
+import asyncio
+import dataclasses
 import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -41,6 +44,11 @@ class TestQueryFilter:
     def test_gte(self):
         assert QueryFilter("age", "18", "gte").to_param() == ("age__gte", "18")
 
+    def test_slotted(self):
+        f = QueryFilter("name", "foo")
+        assert not hasattr(f, "__dict__")
+        assert f.VALID_OPERATORS is QueryFilter.VALID_OPERATORS
+
 
 class TestSortOptions:
     def test_to_params(self):
@@ -61,6 +69,20 @@ class TestPaginationOptions:
         p = PaginationOptions()
         assert p.to_params() == {}
 
+    def test_frozen(self):
+        p = PaginationOptions(limit=10)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            p.limit = 20
+
+    @pytest.mark.asyncio
+    async def test_default_pagination_is_shared(self, mock_client):
+        mock_client._make_request.return_value = {"data": []}
+        await mock_client.get_interfaces()
+        await mock_client.get_interfaces()
+        first, second = mock_client._make_request.call_args_list
+        assert first.kwargs["pagination"] is second.kwargs["pagination"]
+        assert first.kwargs["pagination"].limit == 200
+
 
 class TestControlParameters:
     def test_apply(self):
@@ -81,6 +103,11 @@ class TestControlParameters:
         c = ControlParameters(async_mode=False)
         assert c.to_params()["async"] == "false"
 
+    def test_to_body_native_types(self):
+        c = ControlParameters(apply=True, async_mode=False, placement=0, remove=True)
+        assert c.to_body() == {"apply": True, "async": False, "placement": 0, "remove": True}
+        assert ControlParameters().to_body() == {}
+
 
 # ---------------------------------------------------------------------------
 # Helper functions
@@ -180,8 +207,9 @@ class TestMakeRequestContentType:
     def _mock_response(self, status=200, body=None):
         resp = MagicMock(spec=httpx.Response)
         resp.status_code = status
-        resp.json.return_value = body or {"data": []}
+        resp.headers = httpx.Headers()
         resp.text = json.dumps(body or {"data": []})
+        resp.content = resp.text.encode()
         return resp
 
     async def test_get_omits_content_type(self):
@@ -197,14 +225,14 @@ class TestMakeRequestContentType:
         resp = self._mock_response()
         with patch.object(self.client, "_ensure_client"):
             self.client.client = MagicMock()
-            self.client.client.post = AsyncMock(return_value=resp)
+            self.client.client.request = AsyncMock(return_value=resp)
             await self.client._make_request("POST", "/firewall/rule", data={"type": "pass"})
-            headers = self.client.client.post.call_args.kwargs["headers"]
+            headers = self.client.client.request.call_args.kwargs["headers"]
             assert headers["Content-Type"] == "application/json"
 
     async def test_delete_with_body_includes_content_type(self):
         # DELETE is routed through client.request() because httpx.delete()
-        # does not accept a json= kwarg (issue #12).
+        # does not accept a request body (issue #12).
         resp = self._mock_response()
         with patch.object(self.client, "_ensure_client"):
             self.client.client = MagicMock()
@@ -213,7 +241,20 @@ class TestMakeRequestContentType:
             assert self.client.client.request.call_args.args[0] == "DELETE"
             headers = self.client.client.request.call_args.kwargs["headers"]
             assert headers["Content-Type"] == "application/json"
-            assert self.client.client.request.call_args.kwargs["json"] == {"id": 0}
+            assert self.client.client.request.call_args.kwargs["content"] == b'{"id":0}'
+
+    async def test_patch_uses_request(self):
+        resp = self._mock_response()
+        with patch.object(self.client, "_ensure_client"):
+            self.client.client = MagicMock()
+            self.client.client.request = AsyncMock(return_value=resp)
+            await self.client._make_request("patch", "/firewall/rule", data={"id": 1})
+            assert self.client.client.request.call_args.args[0] == "PATCH"
+
+    async def test_unsupported_method(self):
+        with patch.object(self.client, "_ensure_client"):
+            with pytest.raises(ValueError, match="Unsupported HTTP method"):
+                await self.client._make_request("TRACE", "/firewall/rule")
 
     async def test_delete_without_body_omits_content_type(self):
         resp = self._mock_response()
@@ -224,6 +265,350 @@ class TestMakeRequestContentType:
             assert self.client.client.request.call_args.args[0] == "DELETE"
             headers = self.client.client.request.call_args.kwargs["headers"]
             assert "Content-Type" not in headers
+            assert self.client.client.request.call_args.kwargs["content"] is None
+
+
+# ---------------------------------------------------------------------------
+# HTTP client construction
+# ---------------------------------------------------------------------------
+
+class TestEnsureClient:
+    def test_pool_limits_and_http2(self):
+        client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.API_KEY,
+            api_key="k",
+            verify_ssl=False,
+            pool_size=20,
+            http2=True,
+        )
+        with patch("src.client.httpx.AsyncClient") as mock_cls:
+            client._ensure_client()
+        kwargs = mock_cls.call_args.kwargs
+        assert kwargs["http2"] is True
+        assert kwargs["limits"].max_connections == 20
+        assert kwargs["limits"].max_keepalive_connections == 10
+
+
+class TestCoalescedGet:
+    """Identical concurrent GETs share one upstream request."""
+
+    @pytest.fixture(autouse=True)
+    def _setup_client(self):
+        self.client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.API_KEY,
+            api_key="test-key",
+            verify_ssl=False,
+        )
+
+    async def test_concurrent_gets_share_one_request(self):
+        release = asyncio.Event()
+        resp = MagicMock(spec=httpx.Response)
+        resp.status_code = 200
+        resp.headers = httpx.Headers()
+        resp.content = b'{"data": {"version": "2.8.0"}}'
+
+        async def slow_get(*args, **kwargs):
+            await release.wait()
+            return resp
+
+        with patch.object(self.client, "_ensure_client"):
+            self.client.client = MagicMock()
+            self.client.client.get = AsyncMock(side_effect=slow_get)
+            tasks = [
+                asyncio.create_task(self.client._make_request("GET", "/status/system"))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert self.client.client.get.await_count == 1
+        assert all(r == {"data": {"version": "2.8.0"}} for r in results)
+        # Each caller decodes its own dict
+        assert results[0] is not results[1]
+        assert self.client._inflight == {}
+
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        release = asyncio.Event()
+        resp = MagicMock(spec=httpx.Response)
+        resp.status_code = 200
+        resp.headers = httpx.Headers()
+        resp.content = b'{"data": {}}'
+
+        async def slow_get(*args, **kwargs):
+            await release.wait()
+            return resp
+
+        with patch.object(self.client, "_ensure_client"):
+            self.client.client = MagicMock()
+            self.client.client.get = AsyncMock(side_effect=slow_get)
+            leader = asyncio.create_task(self.client._make_request("GET", "/status/system"))
+            await asyncio.sleep(0)
+            waiters = [
+                asyncio.create_task(self.client._make_request("GET", "/status/system"))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            leader.cancel()
+            # Wait for a waiter to start the replacement flight
+            for _ in range(10):
+                if self.client.client.get.await_count == 2:
+                    break
+                await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert results == [{"data": {}}, {"data": {}}]
+        # The waiters re-issued the GET once between them
+        assert self.client.client.get.await_count == 2
+        assert self.client._inflight == {}
+
+    async def test_get_after_write_does_not_join_older_flight(self):
+        release = asyncio.Event()
+        bodies = iter([b'{"data": "pre-write"}', b'{"data": "post-write"}'])
+
+        async def slow_get(*args, **kwargs):
+            resp = MagicMock(spec=httpx.Response)
+            resp.status_code = 200
+            resp.headers = httpx.Headers()
+            resp.content = next(bodies)
+            await release.wait()
+            return resp
+
+        written = MagicMock(spec=httpx.Response)
+        written.status_code = 200
+        written.headers = httpx.Headers()
+        written.content = b'{"data": {}}'
+
+        with patch.object(self.client, "_ensure_client"):
+            self.client.client = MagicMock()
+            self.client.client.get = AsyncMock(side_effect=slow_get)
+            self.client.client.request = AsyncMock(return_value=written)
+            before = asyncio.create_task(self.client._make_request("GET", "/firewall/rules"))
+            await asyncio.sleep(0)
+            await self.client._make_request("POST", "/firewall/rule", data={"type": "pass"})
+            after = asyncio.create_task(self.client._make_request("GET", "/firewall/rules"))
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(before, after)
+
+        assert results == [{"data": "pre-write"}, {"data": "post-write"}]
+        assert self.client.client.get.await_count == 2
+
+    async def test_error_propagates_to_all_waiters(self):
+        release = asyncio.Event()
+
+        async def failing_get(*args, **kwargs):
+            await release.wait()
+            raise httpx.ConnectError("unreachable")
+
+        with patch.object(self.client, "_ensure_client"):
+            self.client.client = MagicMock()
+            self.client.client.get = AsyncMock(side_effect=failing_get)
+            tasks = [
+                asyncio.create_task(self.client._make_request("GET", "/status/system"))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert self.client.client.get.await_count == 1
+        assert all(isinstance(r, httpx.ConnectError) for r in results)
+
+    async def test_concurrent_service_actions_share_lookup(self):
+        """Different concurrent tool calls amortize their common read."""
+        release = asyncio.Event()
+        services = MagicMock(spec=httpx.Response)
+        services.status_code = 200
+        services.headers = httpx.Headers()
+        services.content = b'{"data": [{"id": 0, "name": "dhcpd"}, {"id": 1, "name": "unbound"}]}'
+        ok = MagicMock(spec=httpx.Response)
+        ok.status_code = 200
+        ok.headers = httpx.Headers()
+        ok.content = b'{"data": {}}'
+
+        async def slow_get(*args, **kwargs):
+            await release.wait()
+            return services
+
+        with patch.object(self.client, "_ensure_client"):
+            self.client.client = MagicMock()
+            self.client.client.get = AsyncMock(side_effect=slow_get)
+            self.client.client.request = AsyncMock(return_value=ok)
+            tasks = [
+                asyncio.create_task(self.client.control_service("dhcpd", "restart")),
+                asyncio.create_task(self.client.control_service("unbound", "restart")),
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(*tasks)
+
+        assert self.client.client.get.await_count == 1
+        ids = sorted(
+            json.loads(c.kwargs["content"])["id"]
+            for c in self.client.client.request.await_args_list
+        )
+        assert ids == [0, 1]
+
+    async def test_lowercase_method_is_coalesced(self):
+        resp = MagicMock(spec=httpx.Response)
+        resp.status_code = 200
+        resp.headers = httpx.Headers()
+        resp.content = b'{"data": {}}'
+
+        with patch.object(self.client, "_ensure_client"):
+            self.client.client = MagicMock()
+            self.client.client.get = AsyncMock(return_value=resp)
+            result = await self.client._make_request("get", "/status/system")
+
+        assert result == {"data": {}}
+        self.client.client.get.assert_awaited_once()
+
+
+class TestResponseCache:
+    """Opt-in GET cache (cache_ttl > 0), cleared by any write."""
+
+    @pytest.fixture(autouse=True)
+    def _setup_client(self):
+        self.client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.API_KEY,
+            api_key="test-key",
+            verify_ssl=False,
+            cache_ttl=30,
+        )
+        resp = MagicMock(spec=httpx.Response)
+        resp.status_code = 200
+        resp.headers = httpx.Headers()
+        resp.content = b'{"data": []}'
+        self.client.client = MagicMock()
+        self.client.client.get = AsyncMock(return_value=resp)
+        self.client.client.request = AsyncMock(return_value=resp)
+
+    async def test_hit_returns_fresh_dict(self):
+        with patch.object(self.client, "_ensure_client"):
+            first = await self.client._make_request("GET", "/firewall/rules")
+            first["data"].append("mutated")
+            second = await self.client._make_request("GET", "/firewall/rules")
+        assert self.client.client.get.await_count == 1
+        assert second == {"data": []}
+
+    async def test_write_invalidates(self):
+        with patch.object(self.client, "_ensure_client"):
+            await self.client._make_request("GET", "/firewall/rules")
+            await self.client._make_request("DELETE", "/firewall/rule", data={"id": 1})
+            await self.client._make_request("GET", "/firewall/rules")
+        assert self.client.client.get.await_count == 2
+
+    async def test_expired_entry_refetched(self):
+        with patch.object(self.client, "_ensure_client"):
+            await self.client._make_request("GET", "/firewall/rules")
+            url = next(iter(self.client._response_cache))
+            self.client._response_cache[url] = (0.0, b'{"data": ["stale"]}')
+            result = await self.client._make_request("GET", "/firewall/rules")
+        assert result == {"data": []}
+        assert self.client.client.get.await_count == 2
+
+    async def test_connection_check_bypasses_cache(self):
+        with patch.object(self.client, "_ensure_client"):
+            await self.client.get_system_status()
+            self.client.client.get = AsyncMock(side_effect=httpx.ConnectError("unreachable"))
+            result = await self.client.test_connection()
+        assert result["connected"] is False
+        assert "Cannot reach" in result["error"]
+        assert self.client.client.get.await_count == 1
+
+    async def test_disabled_by_default(self):
+        self.client.cache_ttl = 0
+        with patch.object(self.client, "_ensure_client"):
+            await self.client._make_request("GET", "/firewall/rules")
+            await self.client._make_request("GET", "/firewall/rules")
+        assert self.client.client.get.await_count == 2
+        assert self.client._response_cache == {}
+
+
+class TestEtagRevalidation:
+    @pytest.fixture(autouse=True)
+    def _setup_client(self):
+        self.client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.API_KEY,
+            api_key="test-key",
+            verify_ssl=False,
+        )
+        self.client.client = MagicMock()
+
+    @staticmethod
+    def _response(status, content=b"", headers=None):
+        resp = MagicMock(spec=httpx.Response)
+        resp.status_code = status
+        resp.headers = httpx.Headers(headers or {})
+        resp.content = content
+        return resp
+
+    async def test_not_modified_reuses_body(self):
+        self.client.client.get = AsyncMock(side_effect=[
+            self._response(200, b'{"data": [1]}', {"ETag": '"v1"'}),
+            self._response(304),
+        ])
+        with patch.object(self.client, "_ensure_client"):
+            first = await self.client.get_aliases()
+            second = await self.client.get_aliases()
+        assert first == second == {"data": [1]}
+        sent = self.client.client.get.call_args_list[1].kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        # The shared auth header dict is left untouched
+        assert "If-None-Match" not in await self.client._get_auth_headers(False)
+
+    async def test_unconditional_get_does_not_join_conditional_flight(self):
+        release = asyncio.Event()
+        self.client._etag_cache[
+            "https://192.0.2.1/api/v2/firewall/aliases?limit=200"
+        ] = ('"v1"', b'{"data": [1]}')
+
+        async def fake_get(url, headers, **kwargs):
+            await release.wait()
+            if "If-None-Match" in headers:
+                return self._response(304)
+            return self._response(200, b'{"data": [2]}')
+
+        self.client.client.get = AsyncMock(side_effect=fake_get)
+        with patch.object(self.client, "_ensure_client"):
+            conditional = asyncio.create_task(self.client.get_aliases())
+            plain = asyncio.create_task(
+                self.client._make_request(
+                    "GET", "/firewall/aliases", pagination=PaginationOptions(limit=200)
+                )
+            )
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(conditional, plain)
+        assert results == [{"data": [1]}, {"data": [2]}]
+        assert self.client.client.get.await_count == 2
+
+    async def test_not_modified_never_stored(self):
+        # An unsolicited 304 (no validator sent) has no body to reuse
+        self.client.client.get = AsyncMock(
+            return_value=self._response(304, headers={"ETag": '"v1"'})
+        )
+        with patch.object(self.client, "_ensure_client"):
+            with pytest.raises(ValueError):
+                await self.client.get_aliases()
+        assert self.client._etag_cache == {}
+
+    async def test_only_opted_in_getters_store_etags(self):
+        self.client.client.get = AsyncMock(
+            return_value=self._response(200, b'{"data": []}', {"ETag": '"v1"'})
+        )
+        with patch.object(self.client, "_ensure_client"):
+            await self.client._make_request("GET", "/firewall/rules")
+            await self.client._make_request("GET", "/firewall/rules")
+        assert "If-None-Match" not in self.client.client.get.call_args.kwargs["headers"]
+        assert self.client._etag_cache == {}
 
 
 # ---------------------------------------------------------------------------
@@ -241,13 +626,32 @@ class TestMakeRequestErrors:
         resp = MagicMock(spec=httpx.Response)
         resp.status_code = 404
         resp.text = '{"message":"not found"}'
-        resp.json.return_value = {"message": "not found"}
+        resp.content = resp.text.encode()
 
         with patch.object(client, "_ensure_client"):
             client.client = MagicMock()
             client.client.get = AsyncMock(return_value=resp)
-            with pytest.raises(Exception, match="404"):
+            with pytest.raises(Exception, match="404") as exc_info:
                 await client._make_request("GET", "/nope")
+        assert '"message": "not found"' in str(exc_info.value)
+
+    async def test_non_json_error_body_uses_text(self):
+        client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.API_KEY,
+            api_key="test-key",
+            verify_ssl=False,
+        )
+        resp = MagicMock(spec=httpx.Response)
+        resp.status_code = 502
+        resp.text = "<html>Bad Gateway</html>"
+        resp.content = resp.text.encode()
+
+        with patch.object(client, "_ensure_client"):
+            client.client = MagicMock()
+            client.client.request = AsyncMock(return_value=resp)
+            with pytest.raises(Exception, match="Bad Gateway"):
+                await client._make_request("POST", "/nope", data={})
 
 
 # ---------------------------------------------------------------------------
@@ -462,6 +866,118 @@ class TestFirewallApply:
         assert result["data"]["status"] == "applied"
 
 
+class TestBulkFirewallRules:
+    async def test_create_applies_once(self, mock_client, mock_make_request):
+        mock_make_request.return_value = {"data": {"id": 1}}
+        results = await mock_client.create_firewall_rules([{"descr": "a"}, {"descr": "b"}])
+        assert [r["success"] for r in results] == [True, True]
+        calls = mock_make_request.call_args_list
+        assert [c.args for c in calls] == [
+            ("POST", "/firewall/rule"),
+            ("POST", "/firewall/rule"),
+            ("POST", "/firewall/apply"),
+        ]
+        assert all(c.kwargs["control"].apply is False for c in calls[:2])
+
+    async def test_failure_does_not_stop_the_rest(self, mock_client, mock_make_request):
+        async def fake_request(method, endpoint, **kwargs):
+            if kwargs.get("data", {}).get("id") == 3:
+                raise Exception("not found")
+            return {"data": {}}
+
+        mock_make_request.side_effect = fake_request
+        results = await mock_client.update_firewall_rules(
+            [{"id": 3, "descr": "x"}, {"id": 4, "descr": "y"}], apply_immediately=False
+        )
+        assert results[0] == {"success": False, "error": "not found"}
+        assert results[1]["success"] is True
+        assert mock_make_request.call_args_list[1].kwargs["data"] == {"descr": "y", "id": 4}
+        assert mock_make_request.call_count == 2
+
+    async def test_update_without_id_is_item_failure(self, mock_client, mock_make_request):
+        mock_make_request.return_value = {"data": {}}
+        results = await mock_client.update_firewall_rules(
+            [{"descr": "no id"}, {"id": 4, "descr": "y"}]
+        )
+        assert results[0] == {"success": False, "error": "Update entry has no 'id'"}
+        assert results[1]["success"] is True
+        assert [c.args for c in mock_make_request.call_args_list] == [
+            ("PATCH", "/firewall/rule"),
+            ("POST", "/firewall/apply"),
+        ]
+
+    async def test_delete_highest_id_first(self, mock_client, mock_make_request):
+        mock_make_request.return_value = {"data": {}}
+        results = await mock_client.delete_firewall_rules([2, 7, 5, 7])
+        assert [r["id"] for r in results] == [7, 5, 2]
+        deleted = [c.kwargs["data"]["id"] for c in mock_make_request.call_args_list[:-1]]
+        assert deleted == [7, 5, 2]
+        assert mock_make_request.call_args.args == ("POST", "/firewall/apply")
+
+    async def test_no_apply_when_all_fail(self, mock_client, mock_make_request):
+        mock_make_request.side_effect = Exception("boom")
+        results = await mock_client.delete_firewall_rules([1])
+        assert results == [{"id": 1, "success": False, "error": "boom"}]
+        assert mock_make_request.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Connection check
+# ---------------------------------------------------------------------------
+
+class TestConnectionCheck:
+    async def test_every_call_probes(self, mock_client, mock_make_request):
+        mock_make_request.return_value = {"data": {}}
+        assert (await mock_client.test_connection())["connected"] is True
+        mock_make_request.side_effect = Exception("401 Unauthorized")
+        result = await mock_client.test_connection()
+        assert result["connected"] is False
+        assert "401" in result["error"]
+        assert mock_make_request.await_count == 2
+
+
+class TestApplyCoalescing:
+    async def test_concurrent_applies_share_a_follow_up(self, mock_client, mock_make_request):
+        release = asyncio.Event()
+
+        async def slow_apply(*args, **kwargs):
+            await release.wait()
+            return {"data": {"applied": True}}
+
+        mock_make_request.side_effect = slow_apply
+        tasks = [asyncio.ensure_future(mock_client.apply_firewall_changes()) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        # One apply already running + one follow-up covering the other four
+        assert mock_make_request.await_count == 2
+        assert all(r == {"data": {"applied": True}} for r in results)
+
+    async def test_sequential_applies_not_skipped(self, mock_client, mock_make_request):
+        mock_make_request.return_value = {"data": {}}
+        await mock_client.apply_firewall_changes()
+        await mock_client.apply_firewall_changes()
+        assert mock_make_request.await_count == 2
+
+    async def test_failed_apply_retried_by_waiters(self, mock_client, mock_make_request):
+        calls = 0
+
+        async def flaky_apply(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            if calls == 1:
+                raise Exception("apply failed")
+            return {"data": {}}
+
+        mock_make_request.side_effect = flaky_apply
+        first = asyncio.ensure_future(mock_client.apply_firewall_changes())
+        second = asyncio.ensure_future(mock_client.apply_firewall_changes())
+        results = await asyncio.gather(first, second, return_exceptions=True)
+        assert isinstance(results[0], Exception)
+        assert results[1] == {"data": {}}
+
+
 # ---------------------------------------------------------------------------
 # DHCP server CRUD
 # ---------------------------------------------------------------------------
@@ -529,7 +1045,18 @@ class TestAuthMethods:
             verify_ssl=False,
         )
         headers = await client._get_auth_headers()
-        assert headers["Authorization"].startswith("Basic ")
+        # base64("admin:secret")
+        assert headers["Authorization"] == "Basic YWRtaW46c2VjcmV0"
+
+    async def test_basic_auth_missing_password(self):
+        client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.BASIC,
+            username="admin",
+            verify_ssl=False,
+        )
+        with pytest.raises(ValueError, match="Username and password required"):
+            await client._get_auth_headers()
 
     async def test_missing_creds_error(self):
         client = EnhancedPfSenseAPIClient(
@@ -540,6 +1067,93 @@ class TestAuthMethods:
         with pytest.raises(ValueError, match="API key required"):
             await client._get_auth_headers()
 
+    async def test_api_key_headers_without_content_type(self):
+        client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.API_KEY,
+            api_key="my-test-key",
+            verify_ssl=False,
+        )
+        headers = await client._get_auth_headers(include_content_type=False)
+        assert headers == {"X-API-Key": "my-test-key"}
+
+    async def test_static_headers_built_once(self):
+        client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.API_KEY,
+            api_key="my-test-key",
+            verify_ssl=False,
+        )
+        first = await client._get_auth_headers()
+        assert await client._get_auth_headers() is first
+        assert await client._get_auth_headers(include_content_type=False) is not first
+
+    async def test_jwt_headers_rebuilt_on_refresh(self):
+        client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.JWT,
+            username="admin",
+            password="secret",
+            verify_ssl=False,
+        )
+        tokens = iter(["tok-1", "tok-2"])
+
+        async def fake_post(url, **kwargs):
+            resp = MagicMock()
+            resp.content = json.dumps({"data": {"token": next(tokens)}}).encode()
+            return resp
+
+        with patch.object(client, "_ensure_client"):
+            client.client = MagicMock()
+            client.client.post = AsyncMock(side_effect=fake_post)
+
+            first = await client._get_auth_headers()
+            assert first["Authorization"] == "Bearer tok-1"
+            assert await client._get_auth_headers() is first
+
+            client.jwt_expiry = None
+            second = await client._get_auth_headers()
+            assert second["Authorization"] == "Bearer tok-2"
+        assert client.client.post.await_count == 2
+
+    async def test_concurrent_jwt_refresh_shared(self):
+        client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.JWT,
+            username="admin",
+            password="secret",
+            verify_ssl=False,
+        )
+
+        async def fake_post(url, **kwargs):
+            await asyncio.sleep(0)
+            resp = MagicMock()
+            resp.content = b'{"data": {"token": "tok"}}'
+            return resp
+
+        with patch.object(client, "_ensure_client"):
+            client.client = MagicMock()
+            client.client.post = AsyncMock(side_effect=fake_post)
+            results = await asyncio.gather(
+                *(client._get_auth_headers() for _ in range(5))
+            )
+        assert client.client.post.await_count == 1
+        assert all(h["Authorization"] == "Bearer tok" for h in results)
+
+    def test_jwt_expiring_within_margin_is_expired(self):
+        client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.JWT,
+            username="admin",
+            password="secret",
+            verify_ssl=False,
+        )
+        client.jwt_token = "tok"
+        client.jwt_expiry = time.monotonic() + 30
+        assert client._is_jwt_expired()
+        client.jwt_expiry = time.monotonic() + 600
+        assert not client._is_jwt_expired()
+
 
 # ---------------------------------------------------------------------------
 # HATEOAS extract_links
@@ -567,3 +1181,130 @@ class TestHateoasExtract:
         )
         links = client.extract_links({"data": []})
         assert links == {}
+
+
+# ---------------------------------------------------------------------------
+# PfSenseSettings.from_env
+# ---------------------------------------------------------------------------
+
+class TestSettingsFromEnv:
+    def test_defaults_and_parsing(self, monkeypatch):
+        from src.server import PfSenseSettings
+        monkeypatch.setenv("PFSENSE_VERSION", "PLUS_25_11")
+        monkeypatch.setenv("AUTH_METHOD", "basic")
+        monkeypatch.setenv("API_TIMEOUT", "not-a-number")
+        monkeypatch.setenv("PFSENSE_HTTP2", "false")
+        settings = PfSenseSettings.from_env()
+        assert settings.version.name == "PLUS_25_11"
+        assert settings.auth_method == AuthMethod.BASIC
+        assert settings.timeout == 30
+        assert settings.http2 is False
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            settings.timeout = 5
+
+    def test_auth_method_dispatch(self, monkeypatch):
+        from src.server import PfSenseSettings
+        for value, expected in [
+            ("JWT", AuthMethod.JWT),
+            ("api_key", AuthMethod.API_KEY),
+            ("bogus", AuthMethod.API_KEY),
+        ]:
+            monkeypatch.setenv("AUTH_METHOD", value)
+            assert PfSenseSettings.from_env().auth_method == expected
+
+    def test_unknown_version_rejected(self, monkeypatch):
+        from src.server import PfSenseSettings
+        monkeypatch.setenv("PFSENSE_VERSION", "CE_1_0")
+        with pytest.raises(ValueError, match="not recognized"):
+            PfSenseSettings.from_env()
+
+    def test_missing_url_rejected(self, monkeypatch):
+        from src.server import PfSenseSettings
+        monkeypatch.setenv("PFSENSE_URL", "  ")
+        with pytest.raises(ValueError, match="PFSENSE_URL"):
+            PfSenseSettings.from_env()
+
+
+class TestClientHeaders:
+    def test_default_headers_and_compression(self):
+        client = EnhancedPfSenseAPIClient(
+            host="https://192.0.2.1",
+            auth_method=AuthMethod.API_KEY,
+            api_key="k",
+            verify_ssl=False,
+        )
+        client._ensure_client()
+        headers = client.client.headers
+        assert headers["user-agent"] == "pfsense-mcp-server"
+        assert headers["accept"] == "application/json"
+        assert "gzip" in headers["accept-encoding"]
+
+
+# ---------------------------------------------------------------------------
+# Server lifespan: client ownership and warm-up
+# ---------------------------------------------------------------------------
+
+class TestServerLifespan:
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, mock_client, mock_make_request, monkeypatch):
+        from src.server import _lifespan, mcp
+        monkeypatch.delenv("PFSENSE_WARM_CACHE", raising=False)
+        async with _lifespan(mcp):
+            pass
+        mock_make_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_primes_common_reads(self, mock_client, mock_make_request, monkeypatch):
+        from src.server import _lifespan, mcp
+        monkeypatch.setenv("PFSENSE_WARM_CACHE", "true")
+        mock_make_request.side_effect = [{"data": {}}, RuntimeError("down"), {"data": []}]
+        async with _lifespan(mcp):
+            pass
+        endpoints = {c.args[1] for c in mock_make_request.call_args_list}
+        assert endpoints == {"/status/system", "/status/interfaces", "/status/services"}
+
+    @pytest.mark.asyncio
+    async def test_client_closed_on_shutdown(self, mock_client, monkeypatch):
+        import src.server as server_mod
+        monkeypatch.delenv("PFSENSE_WARM_CACHE", raising=False)
+        mock_client.close = AsyncMock()
+        async with server_mod._lifespan(server_mod.mcp):
+            assert server_mod.get_api_client() is mock_client
+        mock_client.close.assert_awaited_once()
+        assert server_mod.api_client is None
+
+    def test_settings_parsed_once(self, monkeypatch):
+        import src.server as server_mod
+        monkeypatch.setattr(server_mod, "api_client", None)
+        monkeypatch.setattr(server_mod, "settings", None)
+        with patch.object(
+            server_mod.PfSenseSettings, "from_env",
+            wraps=server_mod.PfSenseSettings.from_env,
+        ) as from_env:
+            first = server_mod.get_api_client()
+            server_mod.reset_api_client()
+            second = server_mod.get_api_client()
+        assert first is not second
+        assert from_env.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Tool result serialization
+# ---------------------------------------------------------------------------
+
+class TestToolSerializer:
+    def test_compact_json_with_str_fallback(self):
+        from datetime import datetime, timezone
+
+        from src.server import _serialize_tool_result
+        ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        out = _serialize_tool_result({"success": True, "data": [{"id": 1}], "at": ts, 5: "x"})
+        assert json.loads(out) == {
+            "success": True, "data": [{"id": 1}], "at": "2026-01-01T00:00:00+00:00", "5": "x",
+        }
+        assert out.startswith('{"success":true,"data":[{"id":1}]')
+
+    def test_registered_on_tools(self):
+        from src.server import _serialize_tool_result
+        from src.tools.system import system_status
+        assert system_status.serializer is _serialize_tool_result
@@ -2,15 +2,21 @@
 rate limiting, input sanitization, dry-run, and rollback tracking."""
 
 
+import json
+
 from src.guardrails import (
+    RateLimiter,
     RiskLevel,
+    audit_log,
     build_approval_request,
     build_dry_run_response,
     check_guardrails,
     check_rate_limit,
     classify_risk,
     get_rollback_history,
+    guarded,
     is_tool_allowed,
+    rate_limited,
     record_rollback,
     sanitize_input,
     sanitize_parameters,
@@ -52,6 +58,37 @@ class TestClassifyRisk:
     def test_unknown_defaults_to_medium(self):
         assert classify_risk("unknown_tool_xyz") == RiskLevel.MEDIUM
 
+    def test_matches_linear_prefix_scan(self):
+        from src.guardrails import _RISK_CLASSIFICATION
+
+        def linear(name):
+            if name in _RISK_CLASSIFICATION:
+                return _RISK_CLASSIFICATION[name]
+            for pattern, level in _RISK_CLASSIFICATION.items():
+                if name.startswith(pattern):
+                    return level
+            return RiskLevel.MEDIUM
+
+        names = [p + suffix for p in _RISK_CLASSIFICATION for suffix in ("", "x", "_rule")]
+        names += ["get", "run_pin", "unknown_tool", ""]
+        for name in names:
+            assert classify_risk(name) == linear(name), name
+
+    def test_results_memoized(self):
+        classify_risk.cache_clear()
+        classify_risk("delete_alias")
+        classify_risk("delete_alias")
+        info = classify_risk.cache_info()
+        assert info.hits == 1 and info.misses == 1
+
+    def test_rank_ordering(self):
+        ranks = [level.rank for level in RiskLevel]
+        assert ranks == sorted(ranks)
+        assert RiskLevel.HIGH.value == "high"
+        assert not RiskLevel.MEDIUM.requires_confirmation
+        assert RiskLevel.HIGH.requires_confirmation
+        assert RiskLevel.CRITICAL.requires_confirmation
+
 
 # ---------------------------------------------------------------------------
 # Approval Gate
@@ -69,6 +106,28 @@ class TestApprovalRequest:
         assert "request_id" in result
         assert "rule_id" in str(result["parameters_visible"])
 
+    def test_request_id_independent_of_key_order(self):
+        from src.guardrails import ApprovalRequest
+        ts = "2026-01-01T00:00:00+00:00"
+        a = ApprovalRequest("delete_alias", RiskLevel.HIGH, {"a": 1, "b": 2}, "", "", timestamp=ts)
+        b = ApprovalRequest("delete_alias", RiskLevel.HIGH, {"b": 2, "a": 1}, "", "", timestamp=ts)
+        c = ApprovalRequest("delete_alias", RiskLevel.HIGH, {"a": 1, "b": 3}, "", "", timestamp=ts)
+        assert a.request_id == b.request_id
+        assert a.request_id != c.request_id
+        assert len(a.request_id) == 16
+
+    def test_redaction_copies_only_when_needed(self):
+        from src.guardrails import _redact_sensitive
+        clean = {"name": "web", "rules": [{"id": 1}], "opts": {"a": 1}}
+        assert _redact_sensitive(clean) is clean
+
+        nested = {"name": "vpn", "peers": [{"id": 1}, {"id": 2, "key": "abc"}]}
+        redacted = _redact_sensitive(nested)
+        assert redacted is not nested
+        assert redacted["peers"][1]["key"] == "***REDACTED***"
+        assert redacted["peers"][0] is nested["peers"][0]
+        assert nested["peers"][1]["key"] == "abc"
+
     def test_redacts_sensitive_params(self):
         result = build_approval_request(
             "create_openvpn_server",
@@ -100,6 +159,17 @@ class TestRateLimiting:
         # At least one of the first two should pass, third should fail
         assert result3 is not None or (result1 is None and result2 is None)
 
+    def test_window_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("src.guardrails.time.monotonic", lambda: now[0])
+        limiter = RateLimiter(max_ops=2, window_seconds=60)
+        assert limiter.check("delete") is None
+        assert limiter.check("delete") is None
+        assert "Rate limit exceeded" in limiter.check("delete")
+        now[0] += 60
+        assert limiter.check("delete") is None
+        assert len(limiter._timestamps["delete"]) == 1
+
 
 # ---------------------------------------------------------------------------
 # Input Sanitization
@@ -124,6 +194,10 @@ class TestInputSanitization:
 
     def test_xss(self):
         assert sanitize_input("<script>alert(1)</script>") is not None
+        assert sanitize_input("<SCRIPT src=x>") is not None
+
+    def test_variable_expansion(self):
+        assert sanitize_input("${HOME}") is not None
 
     def test_parameter_scanning(self):
         assert sanitize_parameters({"name": "good", "descr": "safe"}) is None
@@ -152,6 +226,36 @@ class TestDryRun:
         assert result["risk_level"] == "high"
 
 
+# ---------------------------------------------------------------------------
+# Audit Logging
+# ---------------------------------------------------------------------------
+
+class TestAuditLog:
+    def test_entries_written_by_background_writer(self, tmp_path, monkeypatch):
+        from src import guardrails
+        path = tmp_path / "audit.jsonl"
+        monkeypatch.setattr(guardrails, "_AUDIT_LOG_PATH", str(path))
+        guardrails._stop_audit_writer()
+
+        audit_log("delete_alias", RiskLevel.HIGH, {"id": 1}, "success", True)
+        writer = guardrails._audit_listener
+        audit_log("delete_alias", RiskLevel.HIGH, {"id": 2, "password": "x"}, "success", True)
+        assert guardrails._audit_listener is writer
+
+        # Stopping drains the queue and closes the file
+        guardrails._stop_audit_writer()
+        entries = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [e["parameters"]["id"] for e in entries] == [1, 2]
+        assert entries[1]["parameters"]["password"] == "***REDACTED***"
+
+    def test_unwritable_path_does_not_raise(self, tmp_path, monkeypatch):
+        from src import guardrails
+        monkeypatch.setattr(guardrails, "_AUDIT_LOG_PATH", str(tmp_path / "missing" / "a.log"))
+        guardrails._stop_audit_writer()
+        audit_log("delete_alias", RiskLevel.HIGH, {"id": 1}, "success", True)
+        assert guardrails._audit_listener is None
+
+
 # ---------------------------------------------------------------------------
 # Rollback Tracking
 # ---------------------------------------------------------------------------
@@ -172,6 +276,17 @@ class TestRollbackTracking:
         history = get_rollback_history(limit=1)
         assert history[0]["has_previous_state"] is False
 
+    def test_buffer_is_bounded(self):
+        from src import guardrails
+        for i in range(guardrails._MAX_ROLLBACK_ENTRIES + 5):
+            record_rollback("delete_alias", "alias", i, None)
+        assert len(guardrails._rollback_buffer) == guardrails._MAX_ROLLBACK_ENTRIES
+        history = get_rollback_history(limit=2)
+        assert [h["object_id"] for h in history] == [
+            guardrails._MAX_ROLLBACK_ENTRIES + 4,
+            guardrails._MAX_ROLLBACK_ENTRIES + 3,
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Allowlisting
@@ -216,3 +331,65 @@ class TestCheckGuardrails:
         )
         assert result is not None
         assert "unsafe" in result["error"].lower()
+        assert result["risk_level"] == "medium"
+
+    def test_allowlist_blocked(self, monkeypatch):
+        monkeypatch.setattr("src.guardrails.ALLOWED_TOOLS", frozenset({"create_alias"}))
+        result = check_guardrails("delete_alias", {"alias_id": 1}, confirm=True)
+        assert result == {
+            "success": False,
+            "error": "Tool 'delete_alias' is not in the allowed tools list (MCP_ALLOWED_TOOLS).",
+            "risk_level": "high",
+        }
+
+
+# ---------------------------------------------------------------------------
+# Decorators
+# ---------------------------------------------------------------------------
+
+class TestGuardDecorators:
+    async def test_guarded_sees_positional_params(self):
+        @guarded
+        async def delete_widget(widget_id: int, confirm: bool = False, dry_run: bool = False):
+            return {"success": True}
+
+        result = await delete_widget(7, dry_run=True)
+        assert result["dry_run"] is True
+        assert "7" in str(result)
+
+    async def test_rate_limited_sanitizes_positional_params(self):
+        @rate_limited
+        async def create_widget(name: str, descr: str = ""):
+            return {"success": True}
+
+        result = await create_widget("ok", "$(whoami)")
+        assert result["success"] is False
+        assert "unsafe" in result["error"].lower()
+
+    async def test_rate_limited_allowlist_blocked(self, monkeypatch):
+        @rate_limited
+        async def create_widget(name: str):
+            return {"success": True}
+
+        monkeypatch.setattr("src.guardrails.ALLOWED_TOOLS", frozenset())
+        result = await create_widget("ok")
+        assert result == {
+            "success": False,
+            "error": "Tool 'create_widget' is not in the allowed tools list (MCP_ALLOWED_TOOLS).",
+        }
+
+    async def test_guarded_attaches_pre_change_revision(self, mock_client):
+        mock_client._make_request.return_value = {
+            "data": [{"id": 42, "time": 1700000000, "description": "before"}]
+        }
+
+        @guarded
+        async def delete_widget(widget_id: int, confirm: bool = False, dry_run: bool = False):
+            return {"success": True}
+
+        result = await delete_widget(7, confirm=True)
+        assert result["config_backup"]["pre_change_revision_id"] == 42
+        assert "revision_id=42" in result["config_backup"]["rollback_instruction"]
+        entry = get_rollback_history(limit=1)[0]
+        assert entry["tool"] == "delete_widget"
+        assert entry["object_type"] == "widget"
@@ -7,12 +7,17 @@ from src.helpers import (
     MAX_OFFSET,
     MAX_PAGE,
     create_pagination,
+    dedupe_alias_entries,
+    filter_by_search_term,
     normalize_mac_address,
     parse_filterlog_entry,
+    rows_to_columns,
     safe_data_dict,
     safe_data_list,
     sanitize_description,
+    utc_now_iso,
     validate_alias_addresses,
+    validate_ip_address,
     validate_mac_address,
 )
 
@@ -48,6 +53,14 @@ class TestNormalizeMacAddress:
         with pytest.raises(ValueError, match="Invalid MAC"):
             normalize_mac_address("")
 
+    def test_invalid_mixed_separators(self):
+        with pytest.raises(ValueError, match="Invalid MAC"):
+            normalize_mac_address("AA:BB-CC:DD-EE:FF")
+
+    def test_invalid_partial_separators(self):
+        with pytest.raises(ValueError, match="Invalid MAC"):
+            normalize_mac_address("AABB:CCDD:EEFF")
+
 
 class TestValidateMacAddress:
     def test_valid_colon(self):
@@ -65,6 +78,27 @@ class TestValidateMacAddress:
         assert "Invalid MAC" in result
 
 
+# ---------------------------------------------------------------------------
+# IP address validation
+# ---------------------------------------------------------------------------
+
+class TestValidateIpAddress:
+    def test_ipv4_fast_path(self):
+        assert validate_ip_address(" 192.0.2.10 ") == "192.0.2.10"
+
+    def test_cidr_and_ipv6(self):
+        assert validate_ip_address("10.0.0.0/8") == "10.0.0.0/8"
+        assert validate_ip_address("2001:db8::1") == "2001:db8::1"
+
+    def test_any(self):
+        assert validate_ip_address("ANY") == "any"
+
+    @pytest.mark.parametrize("value", ["256.1.1.1", "1.2.3", "10.0.0.1\x00", "not-an-ip"])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError, match="Invalid IP address"):
+            validate_ip_address(value)
+
+
 # ---------------------------------------------------------------------------
 # Filterlog parser
 # ---------------------------------------------------------------------------
@@ -301,3 +335,100 @@ class TestFilterlogIpValidation:
         result = parse_filterlog_entry(line)
         assert result["src_ip"] == "10.0.0.1"
         assert result["dst_ip"] == "10.0.0.2"
+
+    def test_ipv6_addresses_pass_through(self):
+        line = (
+            "Jan 15 pfSense filterlog[1]: "
+            "5,,,1000,wan,match,block,in,6,0x00,0x00000,64,tcp,6,80,"
+            "2001:db8::1,2001:db8::2,54321,443,0,S,"
+        )
+        result = parse_filterlog_entry(line)
+        assert result["src_ip"] == "2001:db8::1"
+        assert result["dst_ip"] == "2001:db8::2"
+
+    def test_fallback_skips_out_of_range_quads(self):
+        line = (
+            "Jan 15 pfSense filterlog[1]: "
+            "5,,,1000,wan,match,block,in,9,999.1.1.1,10.0.0.5,10.0.0.6"
+        )
+        result = parse_filterlog_entry(line)
+        assert result is not None
+        assert result["src_ip"] == "10.0.0.5"
+        assert result["dst_ip"] == "10.0.0.6"
+
+
+# ---------------------------------------------------------------------------
+# Alias entry de-duplication
+# ---------------------------------------------------------------------------
+
+class TestDedupeAliasEntries:
+    def test_keeps_first_detail(self):
+        assert dedupe_alias_entries(["a", " b", "a", "b "], ["1", "2", "3", "4"]) == (
+            ["a", "b"], ["1", "2"],
+        )
+
+    def test_mismatched_details_untouched(self):
+        assert dedupe_alias_entries(["a", "a"], ["x"]) == (["a"], ["x"])
+        assert dedupe_alias_entries(["a", "a"]) == (["a"], None)
+
+
+# ---------------------------------------------------------------------------
+# Columnar rows
+# ---------------------------------------------------------------------------
+
+class TestRowsToColumns:
+    def test_heterogeneous_rows_padded(self):
+        rows = [{"a": 1, "b": 2}, {"b": 3}, {"c": 4, "a": 5}]
+        assert rows_to_columns(rows) == {
+            "a": [1, None, 5],
+            "b": [2, 3, None],
+            "c": [None, None, 4],
+        }
+
+    def test_empty(self):
+        assert rows_to_columns([]) == {}
+
+
+# ---------------------------------------------------------------------------
+# Client-side search_term filtering
+# ---------------------------------------------------------------------------
+
+class TestFilterBySearchTerm:
+    ROWS = [
+        {"name": "WAN_GW", "descr": "Primary uplink"},
+        {"name": "lan", "descr": None},
+        {"name": "opt1", "value": 8080},
+        {"descr": "no name"},
+    ]
+
+    def test_case_insensitive_any_field(self):
+        result = filter_by_search_term(self.ROWS, "UPLINK", ("name", "descr"))
+        assert result == [self.ROWS[0]]
+
+    def test_null_and_missing_fields_never_match(self):
+        result = filter_by_search_term(self.ROWS, "lan", ("name", "descr"))
+        assert result == [self.ROWS[1]]
+
+    def test_non_string_values_matched_as_text(self):
+        assert filter_by_search_term(self.ROWS, "808", ("value",)) == [self.ROWS[2]]
+
+
+# ---------------------------------------------------------------------------
+# Cached response timestamp
+# ---------------------------------------------------------------------------
+
+class TestUtcNowIso:
+    def test_reused_within_a_second(self, monkeypatch):
+        now = [1700000000.1]
+        monkeypatch.setattr("src.helpers.time.time", lambda: now[0])
+        first = utc_now_iso()
+        now[0] = 1700000000.9
+        assert utc_now_iso() is first
+        assert first == "2023-11-14T22:13:20+00:00"
+
+    def test_rebuilt_on_next_second(self, monkeypatch):
+        now = [1700000000.5]
+        monkeypatch.setattr("src.helpers.time.time", lambda: now[0])
+        utc_now_iso()
+        now[0] = 1700000001.0
+        assert utc_now_iso() == "2023-11-14T22:13:21+00:00"
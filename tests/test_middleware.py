@@ -0,0 +1,52 @@
+"""Tests for the HTTP bearer-auth / Origin middleware."""
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.middleware import BearerAuthMiddleware
+
+
+def _client():
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route("/mcp", ok, methods=["GET"])])
+    return TestClient(BearerAuthMiddleware(app, "key1,key2"))
+
+
+class TestBearerAuthMiddleware:
+    def test_valid_token_passes(self):
+        resp = _client().get("/mcp", headers={"Authorization": "Bearer key2"})
+        assert resp.status_code == 200
+        assert resp.text == "ok"
+
+    def test_missing_token_rejected(self):
+        resp = _client().get("/mcp")
+        assert resp.status_code == 401
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == {"error": "Unauthorized"}
+
+    def test_disallowed_origin_rejected(self):
+        resp = _client().get(
+            "/mcp",
+            headers={"Authorization": "Bearer key1", "Origin": "https://evil.example"},
+        )
+        assert resp.status_code == 403
+        assert resp.json() == {"error": "Forbidden: Origin not allowed"}
+
+    def test_localhost_origin_allowed(self):
+        resp = _client().get(
+            "/mcp",
+            headers={"Authorization": "Bearer key1", "Origin": "http://localhost:3000"},
+        )
+        assert resp.status_code == 200
+
+    def test_wrong_token_rejected(self):
+        resp = _client().get("/mcp", headers={"Authorization": "Bearer key3"})
+        assert resp.status_code == 401
+
+    def test_non_bearer_scheme_rejected(self):
+        resp = _client().get("/mcp", headers={"Authorization": "Basic key1"})
+        assert resp.status_code == 401
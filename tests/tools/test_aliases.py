@@ -103,6 +103,17 @@ class TestCreateAlias:
         assert result["success"] is True
         assert result["applied"] is False
 
+    async def test_duplicate_entries_dropped(self, mock_client, mock_make_request):
+        mock_make_request.return_value = {"data": {"id": 2}}
+        await _create_alias(
+            name="dup", alias_type="host",
+            addresses=["10.0.0.1", "10.0.0.2", " 10.0.0.1"],
+            details=["first", "second", "repeat"],
+        )
+        data = mock_make_request.call_args.kwargs["data"]
+        assert data["address"] == ["10.0.0.1", "10.0.0.2"]
+        assert data["detail"] == ["first", "second"]
+
 
 # ---------------------------------------------------------------------------
 # manage_alias_addresses
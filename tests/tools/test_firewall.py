@@ -23,6 +23,22 @@ _apply_firewall_changes = apply_firewall_changes.fn
 _get_pf_rules = get_pf_rules.fn
 
 
+def _write_calls(mock):
+    """(method, endpoint, kwargs) for each non-GET request, in order."""
+    return [
+        (c.args[0], c.args[1], c.kwargs)
+        for c in mock.call_args_list
+        if c.args[0] != "GET"
+    ]
+
+
+async def _apply_fails(method, endpoint, **kwargs):
+    """_make_request side effect: every call succeeds except the apply."""
+    if endpoint == "/firewall/apply":
+        raise Exception("filter reload failed")
+    return {"data": {"id": 3}}
+
+
 # ---------------------------------------------------------------------------
 # search_firewall_rules
 # ---------------------------------------------------------------------------
@@ -34,6 +50,12 @@ class TestSearchFirewallRules:
         assert result["success"] is True
         assert result["count"] == 2
 
+    async def test_columnar(self, mock_client, mock_make_request, firewall_rules_response):
+        mock_make_request.return_value = firewall_rules_response
+        result = await _search_firewall_rules(columnar=True)
+        assert result["count"] == 2
+        assert all(len(col) == 2 for col in result["rules"].values())
+
     async def test_interface_filter(self, mock_client, mock_make_request, firewall_rules_response):
         mock_make_request.return_value = firewall_rules_response
         result = await _search_firewall_rules(interface="lan")
@@ -101,6 +123,16 @@ class TestCreateFirewallRuleAdvanced:
         assert result["success"] is False
         assert "create failed" in result["error"]
 
+    async def test_apply_failure_reports_committed_create(self, mock_client, mock_make_request):
+        mock_make_request.side_effect = _apply_fails
+        result = await _create_firewall_rule_advanced(
+            interface="lan", rule_type="pass", protocol="tcp",
+            source="any", destination="any", position=0,
+        )
+        assert result["success"] is True
+        assert result["applied_immediately"] is False
+        assert "NOT applied" in result["warning"]
+
     async def test_basic(self, mock_client, mock_make_request):
         mock_make_request.return_value = {"data": {"id": 5}}
         result = await _create_firewall_rule_advanced(
@@ -112,7 +144,7 @@ class TestCreateFirewallRuleAdvanced:
             destination_port="443",
         )
         assert result["success"] is True
-        call_data = mock_make_request.call_args.kwargs.get("data") or mock_make_request.call_args[0][2]
+        call_data = _write_calls(mock_make_request)[0][2]["data"]
         assert call_data["interface"] == ["lan"]
         assert call_data["protocol"] == "tcp"
 
@@ -123,7 +155,7 @@ class TestCreateFirewallRuleAdvanced:
             interface="lan", rule_type="pass", protocol="tcp",
             source="any", destination="any",
         )
-        data = mock_make_request.call_args.kwargs.get("data") or mock_make_request.call_args[1].get("data")
+        data = _write_calls(mock_make_request)[0][2]["data"]
         assert data["statetype"] == "keep state"
 
     async def test_protocol_any_maps_to_null(self, mock_client, mock_make_request):
@@ -132,7 +164,7 @@ class TestCreateFirewallRuleAdvanced:
             interface="wan", rule_type="block", protocol="any",
             source="any", destination="any",
         )
-        data = mock_make_request.call_args[1].get("data") or mock_make_request.call_args.kwargs.get("data")
+        data = _write_calls(mock_make_request)[0][2]["data"]
         assert data["protocol"] is None
 
     async def test_position_creates_then_moves_then_applies(self, mock_client, mock_make_request):
@@ -183,7 +215,7 @@ class TestCreateFirewallRuleAdvanced:
             interface="lan", rule_type="pass", protocol="tcp",
             source="any", destination="any",
         )
-        data = mock_make_request.call_args.kwargs.get("data") or mock_make_request.call_args[0][2]
+        data = _write_calls(mock_make_request)[0][2]["data"]
         assert data["ipprotocol"] == "inet"
 
     async def test_ipprotocol_inet6_threaded_through(self, mock_client, mock_make_request):
@@ -192,7 +224,7 @@ class TestCreateFirewallRuleAdvanced:
             interface="lan", rule_type="block", protocol="udp",
             source="any", destination="ff02::fb", ipprotocol="inet6",
         )
-        data = mock_make_request.call_args.kwargs.get("data") or mock_make_request.call_args[0][2]
+        data = _write_calls(mock_make_request)[0][2]["data"]
         assert data["ipprotocol"] == "inet6"
 
     async def test_ipprotocol_invalid_rejected(self, mock_client, mock_make_request):
@@ -225,9 +257,23 @@ class TestUpdateFirewallRule:
     async def test_interface_wrapped_in_list(self, mock_client, mock_make_request):
         mock_make_request.return_value = {"data": {"id": 3}}
         await _update_firewall_rule(rule_id=3, interface="dmz")
-        data = mock_make_request.call_args.kwargs.get("data") or mock_make_request.call_args[1].get("data")
+        data = _write_calls(mock_make_request)[0][2]["data"]
         assert data["interface"] == ["dmz"]
 
+    async def test_applies_inline(self, mock_client, mock_make_request):
+        mock_make_request.return_value = {"data": {"id": 3}}
+        result = await _update_firewall_rule(rule_id=3, description="x")
+        assert result["applied"] is True
+        writes = _write_calls(mock_make_request)
+        assert [w[1] for w in writes] == ["/firewall/rule"]
+        assert writes[0][2]["control"].apply is True
+
+    async def test_no_apply(self, mock_client, mock_make_request):
+        mock_make_request.return_value = {"data": {"id": 3}}
+        result = await _update_firewall_rule(rule_id=3, description="x", apply_immediately=False)
+        assert result["applied"] is False
+        assert [w[1] for w in _write_calls(mock_make_request)] == ["/firewall/rule"]
+
     async def test_no_fields_error(self, mock_client, mock_make_request):
         result = await _update_firewall_rule(rule_id=3)
         assert result["success"] is False
@@ -239,6 +285,13 @@ class TestUpdateFirewallRule:
         assert "Invalid destination_port" in result["error"]
         mock_make_request.assert_not_called()
 
+    async def test_rejects_invalid_rule_type(self, mock_client, mock_make_request):
+        result = await _update_firewall_rule(rule_id=3, rule_type="allow", verify_descr="x")
+        assert result["success"] is False
+        assert "Invalid rule_type" in result["error"]
+        # Rejected before the stale-ID lookup
+        mock_make_request.assert_not_called()
+
     async def test_rejects_invalid_source_port(self, mock_client, mock_make_request):
         result = await _update_firewall_rule(rule_id=3, source_port="80, 443")
         assert result["success"] is False
@@ -397,6 +450,17 @@ class TestBulkBlockIps:
         assert create_data is not None, "No create call found with statetype"
         assert create_data["statetype"] == "keep state"
 
+    async def test_duplicates_created_once_and_applied_once(self, mock_client, mock_make_request):
+        mock_make_request.return_value = {"data": {"id": 10}}
+        result = await _bulk_block_ips(
+            ip_addresses=["1.2.3.4", " 1.2.3.4", "5.6.7.8"], confirm=True
+        )
+        assert result["successful"] == 2
+        assert result["duplicates_skipped"] == 1
+        endpoints = [c.args[1] for c in mock_make_request.call_args_list]
+        assert endpoints.count("/firewall/rule") == 2
+        assert endpoints.count("/firewall/apply") == 1
+
     async def test_confirm_required(self, mock_client, mock_make_request):
         result = await _bulk_block_ips(ip_addresses=["1.2.3.4"])
         assert result["success"] is False
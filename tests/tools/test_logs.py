@@ -66,6 +66,13 @@ class TestGetFirewallLog:
         assert result["success"] is True
         assert result["filters_applied"]["action"] == "block"
         assert result["filters_applied"]["interface"] == "wan"
+        assert result["count"] == 1
+
+    async def test_filters_case_insensitive(self, mock_client, mock_make_request, firewall_logs_response):
+        mock_make_request.return_value = firewall_logs_response
+        result = await _get_firewall_log(action_filter="PASS", protocol="UDP")
+        assert result["count"] == 1
+        assert "8.8.8.8" in result["log_entries"][0]["text"]
 
     async def test_destination_ip_filter(self, mock_client, mock_make_request, firewall_logs_response):
         mock_make_request.return_value = firewall_logs_response
@@ -106,6 +113,11 @@ class TestAnalyzeBlockedTraffic:
         result = await _analyze_blocked_traffic(group_by_source=True)
         assert result["success"] is True
         assert result["analysis"]["grouped_by"] == "source_ip"
+        top = result["analysis"]["top_sources"]
+        assert result["analysis"]["total_unique_sources"] == 2
+        assert top["203.0.113.5"]["count"] == 1
+        assert top["203.0.113.5"]["destinations"] == ["192.168.1.1"]
+        assert top["203.0.113.5"]["threat_score"] == 0.2
 
     async def test_ungrouped(self, mock_client, mock_make_request, firewall_logs_response):
         mock_make_request.return_value = firewall_logs_response
@@ -132,6 +144,8 @@ class TestSearchLogsByIp:
         assert result["success"] is True
         assert result["ip_address"] == "203.0.113.5"
         assert result["patterns"] is not None
+        assert result["patterns"]["blocked_count"] == 1
+        assert result["patterns"]["allowed_count"] == 1
 
     async def test_non_firewall_type(self, mock_client, mock_make_request):
         mock_make_request.return_value = {"data": []}
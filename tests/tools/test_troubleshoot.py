@@ -0,0 +1,188 @@
+"""Unit tests for troubleshooting tools (src/tools/troubleshoot.py)."""
+
+import asyncio
+
+from src.tools.troubleshoot import (
+    diagnose_dns_resolution,
+    diagnose_high_availability,
+    diagnose_service_health,
+    diagnose_vpn_status,
+    get_system_health_report,
+    search_audit_trail,
+)
+
+_diagnose_dns_resolution = diagnose_dns_resolution.fn
+_diagnose_high_availability = diagnose_high_availability.fn
+_diagnose_service_health = diagnose_service_health.fn
+_diagnose_vpn_status = diagnose_vpn_status.fn
+_get_system_health_report = get_system_health_report.fn
+_search_audit_trail = search_audit_trail.fn
+
+
+def _probe(responses):
+    """_make_request side effect that records peak concurrency.
+
+    Endpoints in responses get their value (exceptions are raised); any other
+    endpoint returns an empty list. Returns (side_effect, state) where
+    state["peak"] is the most requests seen in flight at once.
+    """
+    state = {"in_flight": 0, "peak": 0}
+
+    async def fake_request(method, endpoint, **kwargs):
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0)
+        state["in_flight"] -= 1
+        result = responses.get(endpoint, {"data": []})
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return fake_request, state
+
+
+class TestDiagnoseVpnStatus:
+    async def test_endpoints_fetched_concurrently(self, mock_client, mock_make_request):
+        in_flight = 0
+        peak = 0
+
+        async def fake_request(method, endpoint, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"data": []}
+
+        mock_make_request.side_effect = fake_request
+        result = await _diagnose_vpn_status()
+        assert peak == 4
+        assert result["diagnosis"] == "All VPN tunnels appear healthy"
+
+    async def test_one_failure_does_not_hide_the_others(self, mock_client, mock_make_request):
+        async def fake_request(method, endpoint, **kwargs):
+            if endpoint == "/status/ipsec/sas":
+                raise Exception("ipsec down")
+            if endpoint == "/status/openvpn/clients":
+                return {"data": [{"status": "up"}, {"status": "down"}]}
+            return {"data": []}
+
+        mock_make_request.side_effect = fake_request
+        result = await _diagnose_vpn_status()
+        assert result["ipsec_sas"] == {"error": "ipsec down"}
+        assert result["summary"]["openvpn_clients"]["disconnected"] == 1
+        assert result["issues"] == [
+            "1 OpenVPN client(s) are disconnected",
+            "Failed to get IPsec status: ipsec down",
+        ]
+
+
+class TestDiagnoseDnsResolution:
+    async def test_checks_fetched_concurrently(self, mock_client, mock_make_request):
+        mock_make_request.side_effect, state = _probe({
+            "/services/dns_resolver/host_overrides": Exception("timeout"),
+            "/status/system": {"data": {"dns_servers": ["1.1.1.1"]}},
+        })
+        result = await _diagnose_dns_resolution()
+        assert state["peak"] == 5
+        assert result["host_overrides_count"] == {"error": "timeout"}
+        assert result["system_dns_servers"] == ["1.1.1.1"]
+        assert result["connectivity_check"] == "OK"
+
+
+class TestDiagnoseServiceHealth:
+    async def test_both_checks_fetched_concurrently(self, mock_client, mock_make_request):
+        mock_make_request.side_effect, state = _probe({
+            "/status/services": {"data": [{"name": "unbound", "status": "running"}]},
+            "/status/system": {"data": {"cpu_usage": "12", "uptime": "3 days"}},
+        })
+        result = await _diagnose_service_health()
+        assert state["peak"] == 2
+        assert result["running_count"] == 1
+        assert result["system_resources"]["uptime"] == "3 days"
+
+    async def test_service_failure_keeps_resources(self, mock_client, mock_make_request):
+        mock_make_request.side_effect, _ = _probe({
+            "/status/services": Exception("services down"),
+            "/status/system": {"data": {"cpu_usage": "95"}},
+        })
+        result = await _diagnose_service_health()
+        assert result["services"] == {"error": "services down"}
+        assert result["system_resources"]["cpu_usage"] == "95"
+        assert "CPU usage is critically high: 95%" in result["issues"]
+
+
+class TestDiagnoseHighAvailability:
+    async def test_both_checks_fetched_concurrently(self, mock_client, mock_make_request):
+        mock_make_request.side_effect, state = _probe({
+            "/status/carp": {"data": {"enable": True}},
+        })
+        result = await _diagnose_high_availability()
+        assert state["peak"] == 2
+        assert result["carp_status"] == {"enable": True}
+        assert result["virtual_ips"] == []
+
+    async def test_carp_failure_keeps_virtual_ips(self, mock_client, mock_make_request):
+        vips = [{"mode": "carp", "subnet": "10.0.0.1", "status": "master"}]
+        mock_make_request.side_effect, _ = _probe({
+            "/status/carp": Exception("carp down"),
+            "/firewall/virtual_ips": {"data": vips},
+        })
+        result = await _diagnose_high_availability()
+        assert result["carp_status"] == {"error": "carp down"}
+        assert "Failed to get CARP status: carp down" in result["issues"]
+        assert result["virtual_ips"] == vips
+
+
+class TestSystemHealthReport:
+    async def test_sections_fetched_concurrently(self, mock_client, mock_make_request):
+        in_flight = 0
+        peak = 0
+
+        async def fake_request(method, endpoint, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"data": []}
+
+        mock_make_request.side_effect = fake_request
+        result = await _get_system_health_report()
+        assert peak == mock_make_request.call_count == 10
+        assert result["overall_health"] == "HEALTHY"
+
+    async def test_failed_section_reported_alone(self, mock_client, mock_make_request):
+        async def fake_request(method, endpoint, **kwargs):
+            if endpoint == "/status/system":
+                raise Exception("status down")
+            if endpoint == "/firewall/rules":
+                return {"data": [{}, {}, {}]}
+            return {"data": []}
+
+        mock_make_request.side_effect = fake_request
+        result = await _get_system_health_report()
+        assert result["system_status"] == {"error": "status down"}
+        assert result["firewall_rule_count"] == 3
+        assert result["overall_health"] == "DEGRADED"
+
+
+class TestSearchAuditTrail:
+    async def test_missing_file_reported(self, monkeypatch, tmp_path):
+        path = tmp_path / "missing.log"
+        monkeypatch.setenv("MCP_AUDIT_LOG", str(path))
+        result = await _search_audit_trail()
+        assert result["audit_log_entries"] == []
+        assert f"Audit log file not found at: {path}" in result["issues"]
+
+    async def test_reads_and_filters_entries(self, monkeypatch, tmp_path):
+        path = tmp_path / "audit.log"
+        path.write_text(
+            '{"tool": "delete_alias", "risk_level": "high"}\n'
+            "not json\n"
+            '{"tool": "create_alias", "risk_level": "medium"}\n'
+        )
+        monkeypatch.setenv("MCP_AUDIT_LOG", str(path))
+        result = await _search_audit_trail(risk_filter="high")
+        assert result["audit_log_entries"] == [{"tool": "delete_alias", "risk_level": "high"}]
+        assert result["issues"] == []
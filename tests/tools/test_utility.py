@@ -1,6 +1,7 @@
 """Unit tests for utility tools (src/tools/utility.py)."""
 
 from src.tools.utility import (
+    check_tool_risk,
     disable_hateoas,
     enable_hateoas,
     find_object_by_field,
@@ -17,6 +18,7 @@ _refresh_object_ids = refresh_object_ids.fn
 _find_object_by_field = find_object_by_field.fn
 _get_api_capabilities = get_api_capabilities.fn
 _test_enhanced_connection = test_enhanced_connection.fn
+_check_tool_risk = check_tool_risk.fn
 
 
 # ---------------------------------------------------------------------------
@@ -163,3 +165,21 @@ class TestTestEnhancedConnection:
         mock_make_request.side_effect = Exception("connection refused")
         result = await _test_enhanced_connection()
         assert result["success"] is False
+
+
+# ---------------------------------------------------------------------------
+# check_tool_risk
+# ---------------------------------------------------------------------------
+
+class TestCheckToolRisk:
+    async def test_high_risk(self):
+        result = await _check_tool_risk(tool_name="delete_alias")
+        assert result["risk_level"] == "high"
+        assert result["requires_confirm"] is True
+        assert "confirm=True" in result["description"]
+
+    async def test_read(self):
+        result = await _check_tool_risk(tool_name="search_aliases")
+        assert result["risk_level"] == "read"
+        assert result["requires_confirm"] is False
+        assert result["description"] == "No state change. Safe to call freely."